@@ -51,6 +51,9 @@ setup(
     install_requires={{ install_requires }}, 
     packages=packages,
     platforms={{ platforms }},
+{% if interpreters %}
+    python_requires='>={{ interpreters[0] }}',
+{% endif %}
     url='https://github.com/{{ github_user }}/{{ name }}',
     tests_require={{ tests_require }},
     test_suite='{{ test_suite }}',
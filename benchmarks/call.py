@@ -0,0 +1,48 @@
+"""Compare per-call overhead of task calling paths.
+
+Usage::
+
+    $ python benchmarks/call.py [--calls 100000] [--repeat 5]
+"""
+import timeit
+import argparse
+from run import Module
+
+
+class BenchmarkModule(Module):
+
+    def task(self):
+        return 1
+
+
+def measure(function, calls, repeat):
+    timings = timeit.repeat(function, number=calls, repeat=repeat)
+    return min(timings) / calls
+
+
+def report(name, timing, baseline):
+    print('{name:<10} {timing:8.3f}us  overhead {overhead:8.3f}us'.format(
+        name=name, timing=timing * 1e6, overhead=(timing - baseline) * 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=5)
+    arguments = parser.parse_args()
+    # Default listeners (task logging is off like with -q)
+    module = BenchmarkModule(Build=True)
+    task = module.task
+    baseline = measure(task.Invoke, arguments.calls, arguments.repeat)
+    fast = measure(task, arguments.calls, arguments.repeat)
+    # Listener observing every call makes calls take the full path
+    module.Listeners.append(lambda event: None)
+    full = measure(task, arguments.calls, arguments.repeat)
+    print('{calls} calls, best of {repeat}'.format(**vars(arguments)))
+    report('invoke', baseline, baseline)
+    report('fast', fast, baseline)
+    report('full', full, baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Compare cold CLI latency with daemon latency.
+
+Usage::
+
+    $ python benchmarks/daemon.py [--tasks 1000] [--repeat 20]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+from run.daemon import locate
+
+COMMAND = [sys.executable, '-c', 'from run import program; program()']
+
+
+def make_runfile(dirpath, tasks):
+    filepath = os.path.join(dirpath, 'runfile.py')
+    with open(filepath, 'w') as file:
+        file.write('from run import Module, require\n\n\n')
+        file.write('class BenchmarkModule(Module):\n')
+        for number in range(tasks):
+            file.write('\n')
+            if number:
+                file.write(
+                    '    @require(\'task{0}\')\n'.format(number - 1))
+            file.write('    def task{0}(self):\n'.format(number))
+            file.write('        return {0}\n'.format(number))
+    return filepath
+
+
+def measure(filepath, repeat, options=()):
+    timings = []
+    command = COMMAND + ['-f', filepath, '-q', *options, 'task0']
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.check_call(command, stdout=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name, timings):
+    print('{name:<8} mean {mean:.4f}s  median {median:.4f}s  '
+          'min {min:.4f}s'.format(
+              name=name,
+              mean=statistics.mean(timings),
+              median=statistics.median(timings),
+              min=min(timings)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    arguments = parser.parse_args()
+    dirpath = tempfile.mkdtemp()
+    try:
+        filepath = make_runfile(dirpath, arguments.tasks)
+        cold = measure(filepath, arguments.repeat)
+        server = subprocess.Popen(
+            COMMAND + ['-f', filepath, '-q', '--server'])
+        try:
+            while not os.path.exists(locate(filepath)):
+                time.sleep(0.05)
+            daemon = measure(
+                filepath, arguments.repeat, ['-s', 'daemon=True'])
+        finally:
+            server.terminate()
+            server.wait()
+        print('{tasks} tasks, {repeat} runs'.format(**vars(arguments)))
+        report('cold', cold)
+        report('daemon', daemon)
+    finally:
+        shutil.rmtree(dirpath)
+
+
+if __name__ == '__main__':
+    main()
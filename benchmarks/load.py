@@ -0,0 +1,70 @@
+"""Compare runfile load time without and with bytecode cache.
+
+Usage::
+
+    $ python benchmarks/load.py [--tasks 3000] [--repeat 10]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+from importlib.util import cache_from_source
+from run.helpers import load
+
+
+def make_runfile(dirpath, tasks):
+    filepath = os.path.join(dirpath, 'runfile.py')
+    with open(filepath, 'w') as file:
+        file.write('from run import Module\n\n\n')
+        file.write('class BenchmarkModule(Module):\n')
+        for number in range(tasks):
+            file.write('\n')
+            file.write('    def task{0}(self, value={0}):\n'.format(number))
+            file.write('        """Return value {0}."""\n'.format(number))
+            file.write('        return value * 2\n')
+    return filepath
+
+
+def measure(filepath, repeat, *, cached, validation):
+    timings = []
+    for _ in range(repeat):
+        if not cached:
+            try:
+                os.remove(cache_from_source(filepath))
+            except OSError:
+                pass
+        start = time.perf_counter()
+        load(filepath, validation=validation)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tasks', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=10)
+    arguments = parser.parse_args()
+    sys.dont_write_bytecode = False
+    dirpath = tempfile.mkdtemp()
+    try:
+        filepath = make_runfile(dirpath, arguments.tasks)
+        print('{tasks} tasks, {repeat} runs'.format(**vars(arguments)))
+        for name, cached, validation in [
+                ('source', False, 'timestamp'),
+                ('timestamp', True, 'timestamp'),
+                ('checked-hash', True, 'checked-hash')]:
+            timings = measure(filepath, arguments.repeat,
+                              cached=cached, validation=validation)
+            print('{name:<13} median {median:.4f}s  min {min:.4f}s'.format(
+                name=name,
+                median=statistics.median(timings),
+                min=min(timings)))
+    finally:
+        shutil.rmtree(dirpath)
+
+
+if __name__ == '__main__':
+    main()
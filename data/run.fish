@@ -0,0 +1 @@
+complete -c run -f -a '(run --complete (commandline -ct) -q -s plain=True 2>/dev/null)'
@@ -3,10 +3,10 @@ _run()
     local list
     local cur
 
-    list=$(run list -q -s plain=True)
     cur=${COMP_WORDS[COMP_CWORD]}
+    list=$(run --complete "$cur" -q -s plain=True 2>/dev/null)
 
     COMPREPLY=($(compgen -W '${list}' -- $cur))
 }
 
-complete -F _run run
\ No newline at end of file
+complete -F _run run
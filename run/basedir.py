@@ -0,0 +1,48 @@
+import os
+import builtins
+import subprocess
+from contextvars import ContextVar
+
+# Invoking task's basedir (None outside of task invocation)
+basedir = ContextVar('basedir', default=None)
+
+
+def path(*paths):
+    """Return path resolved against the invoking task's basedir.
+
+    Outside of task invocation paths are resolved against the
+    current directory. Absolute paths are returned as they are.
+
+    Examples
+    --------
+    Usage example::
+
+      class Module(Module):
+
+          Basedir = 'docs'
+
+          def build(self):
+              return run.path('build', 'index.html')
+    """
+    return os.path.join(basedir.get() or os.getcwd(), *paths)
+
+
+def open(file, *args, **kwargs):
+    """Open file resolved against the invoking task's basedir.
+
+    It has :func:`open` builtin signature (file descriptor
+    is passed as it is).
+    """
+    if not isinstance(file, int):
+        file = path(file)
+    return builtins.open(file, *args, **kwargs)
+
+
+def execute(args, **kwargs):
+    """Run command in the invoking task's basedir.
+
+    It has :func:`subprocess.run` signature with
+    cwd defaulting to the task's basedir.
+    """
+    kwargs.setdefault('cwd', path())
+    return subprocess.run(args, **kwargs)
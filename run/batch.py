@@ -0,0 +1,125 @@
+import json
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import (ThreadPoolExecutor, FIRST_COMPLETED,
+                                as_completed, wait)
+
+
+class Batch:
+    """Batch of task calls read from JSONL stream.
+
+    Every input line is a call like::
+
+        {"task": "module.task", "args": [1], "kwargs": {"key": "value"}}
+
+    Every output line is a call result like::
+
+        {"line": 1, "task": "module.task", "state": "done", "result": 1}
+        {"line": 2, "task": "module.task", "state": "fail", "error": "..."}
+
+    Parameters
+    ----------
+    module: :class:`.Module`
+        Module to get tasks from.
+    jobs: int
+        Count of calls running concurrently.
+    order: str
+        Results order: "input" or "completion".
+    """
+
+    # Public
+
+    INPUT = 'input'
+    COMPLETION = 'completion'
+
+    def __init__(self, module, *, jobs=1, order=INPUT):
+        if order not in [self.INPUT, self.COMPLETION]:
+            raise ValueError(
+                'Unsupported order "{order}"'.format(order=order))
+        self.__module = module
+        self.__jobs = max(int(jobs), 1)
+        self.__order = order
+
+    def __call__(self, input, output):
+        """Run calls from the input writing results to the output.
+
+        Parameters
+        ----------
+        input: file
+            Text file with JSONL calls.
+        output: file
+            Text file for JSONL results.
+
+        Returns
+        -------
+        int
+            Failed calls count.
+        """
+        failures = 0
+        calls = self.__read(input)
+        if self.__jobs == 1:
+            results = map(self.__call, calls)
+        else:
+            results = self.__run(calls)
+        for result in results:
+            if result['state'] == 'fail':
+                failures += 1
+            output.write(json.dumps(result, default=repr) + '\n')
+            output.flush()
+        return failures
+
+    # Private
+
+    def __read(self, input):
+        for number, line in enumerate(input, start=1):
+            if line.strip():
+                yield (number, line)
+
+    def __call(self, call):
+        number, line = call
+        result = {'line': number, 'task': None}
+        try:
+            call = json.loads(line)
+            result['task'] = call['task']
+            task = getattr(self.__module, call['task'])
+            value = task(*call.get('args', []), **call.get('kwargs', {}))
+            if isinstance(value, Iterator):
+                # Stream is finished (and it's call is done) here
+                value = list(value)
+            result.update(state='done', result=value)
+        except Exception as exception:
+            result.update(state='fail', error=str(exception))
+        return result
+
+    def __run(self, calls):
+        # Calls are submitted lazily keeping in-flight count
+        # bounded so large inputs are never read at once
+        pending = set()
+        completed = {}
+        order = deque()
+        with ThreadPoolExecutor(max_workers=self.__jobs) as executor:
+            for call in calls:
+                future = executor.submit(self.__call, call)
+                pending.add(future)
+                if self.__order == self.INPUT:
+                    order.append(future)
+                if len(pending) >= self.__jobs * 2:
+                    done, pending = wait(pending,
+                                         return_when=FIRST_COMPLETED)
+                else:
+                    done = {future for future in pending if future.done()}
+                    pending -= done
+                yield from self.__collect(done, order, completed)
+            for future in as_completed(pending):
+                yield from self.__collect({future}, order, completed)
+
+    def __collect(self, done, order, completed):
+        if self.__order == self.COMPLETION:
+            for future in done:
+                yield future.result()
+            return
+        completed.update(dict.fromkeys(done))
+        while order and order[0] in completed:
+            future = order.popleft()
+            del completed[future]
+            yield future.result()
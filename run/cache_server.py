@@ -0,0 +1,171 @@
+import os
+import re
+import hmac
+import hashlib
+import logging
+import argparse
+import ipaddress
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+class Server(ThreadingHTTPServer):
+    """Reference server of the remote task results cache.
+
+    Data is read by "GET /{kind}/{digest}" and stored by
+    "PUT /{kind}/{digest}" where kind is "keys" or "objects"
+    (objects are verified by their SHA-256 digest).
+
+    If token is set every request must carry it as "Authorization:
+    Bearer {token}" header (401 otherwise). Not loopback address is
+    listened only with a token. Stored entries are still trusted
+    only if they are signed by clients' shared key (see
+    :class:`run.task.DiskCache`) so the server doesn't need it.
+
+    Parameters
+    ----------
+    address: tuple
+        (host, port) address to listen.
+    dirpath: str
+        Storage directory (created on demand).
+    token: str
+        Access token.
+
+    .. seealso:: :class:`run.task.HTTPBackend`
+    """
+
+    # Public
+
+    daemon_threads = True
+
+    def __init__(self, address, *, dirpath, token=None):
+        self.__dirpath = os.path.abspath(dirpath)
+        self.__token = token
+        super().__init__(address, Handler)
+        host = self.server_address[0]
+        if token is None and not ipaddress.ip_address(host).is_loopback:
+            self.server_close()
+            raise RuntimeError(
+                'Cache server on not loopback address "{host}" '
+                'requires a token (set RUN_CACHE_TOKEN environment '
+                'variable)'.format(host=host))
+
+    def authorize(self, header):
+        """Return if Authorization header carries server's token.
+        """
+        if self.__token is None:
+            return True
+        expected = 'Bearer {token}'.format(token=self.__token)
+        return hmac.compare_digest(
+            (header or '').encode('utf-8'), expected.encode('utf-8'))
+
+    @property
+    def dirpath(self):
+        return self.__dirpath
+
+    def locate(self, kind, digest):
+        """Return data path.
+        """
+        return os.path.join(self.dirpath, kind, digest[:2], digest)
+
+
+class Handler(BaseHTTPRequestHandler):
+
+    # Public
+
+    def do_GET(self):
+        match = self.__match()
+        if match is None:
+            return
+        path = self.server.locate(*match)
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_PUT(self):
+        match = self.__match()
+        if match is None:
+            return
+        kind, digest = match
+        path = self.server.locate(kind, digest)
+        try:
+            length = int(self.headers['Content-Length'])
+        except (TypeError, ValueError):
+            self.send_error(411)
+            return
+        data = self.rfile.read(length)
+        if kind == 'objects' and hashlib.sha256(data).hexdigest() != digest:
+            self.send_error(400, 'Digest mismatch')
+            return
+        temppath = '{path}.{pid}.{thread}'.format(
+            path=path, pid=os.getpid(), thread=threading.get_ident())
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temppath, 'wb') as file:
+            file.write(data)
+        os.replace(temppath, path)
+        self.send_response(201)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        logger = logging.getLogger(__name__)
+        logger.debug(format % args)
+
+    # Private
+
+    __pattern = re.compile(r'^/(keys|objects)/([0-9a-f]{64})$')
+
+    def __match(self):
+        if not self.server.authorize(self.headers['Authorization']):
+            self.send_error(401)
+            return None
+        match = self.__pattern.match(self.path)
+        if match is None:
+            self.send_error(404)
+            return None
+        return match.groups()
+
+
+def main(argv=None):
+    """Serve the cache until interrupted.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m run.cache_server',
+        description='Serve remote cache of task results.')
+    parser.add_argument(
+        '--host', default='127.0.0.1', help='Host to listen.')
+    parser.add_argument(
+        '--port', default=8765, type=int, help='Port to listen.')
+    parser.add_argument(
+        '--dirpath', default='.run-cache', help='Storage directory.')
+    parser.add_argument(
+        '--token', default=os.environ.get('RUN_CACHE_TOKEN'),
+        help='Access token (RUN_CACHE_TOKEN environment variable '
+             'by default, required for not loopback host).')
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO, format='[%(levelname)s] %(message)s')
+    server = Server(
+        (args.host, args.port), dirpath=args.dirpath, token=args.token)
+    logger = logging.getLogger(__name__)
+    logger.info(
+        'Serving "{dirpath}" on "http://{0}:{1}"'.format(
+            *server.server_address[:2], dirpath=server.dirpath))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,3 @@
+from .client import Client
+from .locate import locate, verify
+from .server import Server
@@ -0,0 +1,93 @@
+import os
+import socket
+import logging
+from .locate import verify
+from .protocol import STREAMS, peer_uid, send_request, receive_status
+
+
+class Client:
+    """Daemon client forwarding invocations to the server.
+
+    Invocations (including environment and standard streams) are
+    forwarded only to the same user's server in a private directory.
+
+    Parameters
+    ----------
+    address: str
+        Socket path.
+    """
+
+    # Public
+
+    def __init__(self, address):
+        self.__address = address
+        self.__socket = None
+
+    @property
+    def address(self):
+        return self.__address
+
+    def connect(self):
+        """Connect to the server.
+
+        Returns
+        -------
+        bool
+            Connection status (False for not trusted server).
+        """
+        if not os.path.exists(self.address):
+            return False
+        logger = logging.getLogger(__name__)
+        try:
+            verify(os.path.dirname(self.address))
+        except (OSError, RuntimeError) as exception:
+            logger.warning(str(exception))
+            return False
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.address)
+            uid = peer_uid(sock)
+        except OSError:
+            sock.close()
+            return False
+        if uid is not None and uid != os.getuid():
+            sock.close()
+            logger.warning(
+                'Daemon "{address}" of user {uid} is not trusted'.
+                format(address=self.address, uid=uid))
+            return False
+        self.__socket = sock
+        return True
+
+    def execute(self, argv, *, env, cwd):
+        """Execute invocation on the server.
+
+        Client's standard streams are passed to the server
+        so output is written to them directly.
+
+        Parameters
+        ----------
+        argv: list
+            Program argv.
+        env: dict
+            Environment variables.
+        cwd: str
+            Working directory.
+
+        Returns
+        -------
+        int
+            Exit status.
+        """
+        if self.__socket is None:
+            raise RuntimeError('Client is not connected')
+        request = {'argv': argv, 'env': env, 'cwd': cwd}
+        try:
+            send_request(self.__socket, request, list(range(STREAMS)))
+            status = receive_status(self.__socket)
+        except ConnectionError:
+            status = 1
+        finally:
+            self.__socket.close()
+            self.__socket = None
+        return status
@@ -0,0 +1,43 @@
+import os
+import stat
+import hashlib
+from ..settings import settings
+
+
+def locate(filepath):
+    """Return daemon socket path for the runfile by filepath.
+
+    Parameters
+    ----------
+    filepath: str
+        Runfile path.
+
+    Returns
+    -------
+    str
+        Socket path.
+    """
+    filepath = os.path.abspath(filepath)
+    digest = hashlib.sha1(filepath.encode('utf-8')).hexdigest()
+    path = os.path.join(settings.daemon_dirpath, digest + '.sock')
+    return path
+
+
+def verify(dirpath):
+    """Raise RuntimeError if the socket directory is not private.
+
+    Directory has to be a real directory (not a symlink) owned by
+    the current user and not accessible by others.
+
+    Parameters
+    ----------
+    dirpath: str
+        Socket directory path.
+    """
+    info = os.lstat(dirpath)
+    if (not stat.S_ISDIR(info.st_mode) or
+            info.st_uid != os.getuid() or
+            stat.S_IMODE(info.st_mode) & 0o077):
+        raise RuntimeError(
+            'Daemon directory "{dirpath}" has to be owned by the user '
+            'with 0700 mode'.format(dirpath=dirpath))
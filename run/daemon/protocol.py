@@ -0,0 +1,60 @@
+import json
+import socket
+import struct
+
+HEADER = struct.Struct('!I')
+CREDENTIALS = struct.Struct('3i')
+STATUS = struct.Struct('!i')
+STREAMS = 3
+
+
+def peer_uid(sock):
+    """Return uid of the socket's peer or None if it's not supported.
+    """
+    option = getattr(socket, 'SO_PEERCRED', None)
+    if option is None:
+        return None
+    data = sock.getsockopt(socket.SOL_SOCKET, option, CREDENTIALS.size)
+    _, uid, _ = CREDENTIALS.unpack(data)
+    return uid
+
+
+def send_request(sock, request, fds):
+    """Send request with file descriptors to the socket.
+    """
+    data = json.dumps(request).encode('utf-8')
+    socket.send_fds(sock, [HEADER.pack(len(data))], fds)
+    sock.sendall(data)
+
+
+def receive_request(sock):
+    """Receive request with file descriptors from the socket.
+    """
+    header, fds, _, _ = socket.recv_fds(sock, HEADER.size, STREAMS)
+    header += receive_exactly(sock, HEADER.size - len(header))
+    size, = HEADER.unpack(header)
+    request = json.loads(receive_exactly(sock, size).decode('utf-8'))
+    return (request, fds)
+
+
+def send_status(sock, status):
+    """Send exit status to the socket.
+    """
+    sock.sendall(STATUS.pack(status))
+
+
+def receive_status(sock):
+    """Receive exit status from the socket.
+    """
+    status, = STATUS.unpack(receive_exactly(sock, STATUS.size))
+    return status
+
+
+def receive_exactly(sock, size):
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError('Connection closed by peer')
+        data += chunk
+    return data
@@ -0,0 +1,130 @@
+import os
+import sys
+import socket
+import logging
+from socketserver import ForkingMixIn, UnixStreamServer, BaseRequestHandler
+from .locate import verify
+from .protocol import peer_uid, receive_request, send_status
+
+
+class Server(ForkingMixIn, UnixStreamServer):
+    """Daemon server serving invocations over unix socket.
+
+    Every request is handled in a forked child process so all requests
+    share runfile's main module built once in the server process.
+    Client's stdin, stdout and stderr are passed with request so
+    child writes output directly to the client's streams. Socket's
+    directory has to be private and only the same user's requests
+    are served.
+
+    Parameters
+    ----------
+    address: str
+        Socket path.
+    runfile: :class:`.Runfile`
+        Runfile to serve (rebuilt before request if changed).
+    handler: callable
+        Handler with [(argv) -> status] signature called in child process.
+    """
+
+    # Public
+
+    def __init__(self, address, *, runfile, handler):
+        self.__runfile = runfile
+        self.__handler = handler
+        self.__prepare_address(address)
+        super().__init__(address, Handler)
+
+    @property
+    def runfile(self):
+        return self.__runfile
+
+    @property
+    def handler(self):
+        return self.__handler
+
+    def process_request(self, request, client_address):
+        try:
+            self.runfile.module
+        except Exception as exception:
+            # Child will report the error to the client
+            logger = logging.getLogger(__name__)
+            logger.error(str(exception))
+        super().process_request(request, client_address)
+
+    def verify_request(self, request, client_address):
+        uid = peer_uid(request)
+        if uid is not None and uid != os.getuid():
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                'Request of user {uid} is refused'.format(uid=uid))
+            return False
+        return True
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+
+    # Private
+
+    def __prepare_address(self, address):
+        dirpath = os.path.dirname(address)
+        os.makedirs(dirpath, mode=0o700, exist_ok=True)
+        # Mode is not applied to existent directory
+        verify(dirpath)
+        if os.path.exists(address):
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(address)
+            except OSError:
+                # Stale socket
+                os.remove(address)
+            else:
+                raise RuntimeError(
+                    'Daemon is already running on "{address}"'.
+                    format(address=address))
+            finally:
+                sock.close()
+
+
+class Handler(BaseRequestHandler):
+
+    # Public
+
+    timeout = 10
+
+    def handle(self):
+        # Connections without request (like liveness checks)
+        # must not block the child process forever
+        self.request.settimeout(self.timeout)
+        request, fds = receive_request(self.request)
+        self.request.settimeout(None)
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        os.environ.clear()
+        os.environ.update(request['env'])
+        os.chdir(request['cwd'])
+        try:
+            status = self.server.handler(request['argv'])
+        except SystemExit as exception:
+            status = self.__make_status(exception.code)
+        except BaseException as exception:
+            print(str(exception), file=sys.stderr)
+            status = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+        send_status(self.request, status)
+
+    # Private
+
+    def __make_status(self, code):
+        if code is None:
+            return 0
+        if isinstance(code, int):
+            return code
+        print(code, file=sys.stderr)
+        return 1
@@ -1,10 +1,16 @@
 from .cache import cachedproperty
 from .function import Function
+from .importtime import importtime
 from .impobj import import_object
 from .load import load
 from .merge import merge_dicts
 from .pack import pack
 from .parse import parse
 from .plugin import PluginImporter
+from .profiler import Profiler
+from .sampler import Sampler
 from .settings import Settings
 from .stylize import stylize
+from .trie import Trie
+from .watcher import Watcher
+from .writer import Writer
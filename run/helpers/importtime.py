@@ -0,0 +1,43 @@
+import sys
+import subprocess
+
+
+def importtime(args, *, stderr=None):
+    """Run python with import time measuring.
+
+    Interpreter's stderr output not related to
+    import time measuring is written to the stderr.
+
+    Parameters
+    ----------
+    args: list
+        Interpreter arguments (like ['-c', 'import json']).
+    stderr: file
+        File for not related stderr output (default sys.stderr).
+
+    Returns
+    -------
+    tuple
+        Return code and list of (module, self, cumulative)
+        import times in seconds in import completion order.
+    """
+    if stderr is None:
+        stderr = sys.stderr
+    process = subprocess.Popen(
+        [sys.executable, '-X', 'importtime'] + list(args),
+        stderr=subprocess.PIPE, universal_newlines=True)
+    records = []
+    prefix = 'import time:'
+    for line in process.stderr:
+        if not line.startswith(prefix):
+            stderr.write(line)
+            continue
+        try:
+            own, cumulative, module = line[len(prefix):].split('|')
+            record = (module.strip(),
+                      int(own) / 1000000, int(cumulative) / 1000000)
+        except ValueError:
+            # Header line
+            continue
+        records.append(record)
+    return process.wait(), records
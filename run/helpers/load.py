@@ -1,14 +1,28 @@
 import os
+import sys
+import hashlib
+import py_compile
+from importlib.util import (cache_from_source, module_from_spec,
+                            spec_from_file_location, MAGIC_NUMBER)
 from importlib.machinery import SourceFileLoader
 
 
-def load(filepath):
+def load(filepath, *, name=None, validation='timestamp'):
     """Import module from file by filepath.
 
+    Module is executed by the spec's loader so compiled bytecode
+    is written to and validated from the __pycache__ directory.
+
     Parameters
     ----------
     filepath: str
         Module filepath.
+    name: str
+        Module name in sys.modules. Stable name based on
+        the filepath is used by default.
+    validation: str
+        Bytecode cache validation: "timestamp" (source mtime and size)
+        or "checked-hash" (source hash).
 
     Returns
     -------
@@ -16,8 +30,41 @@ def load(filepath):
         Imported module.
     """
     filepath = os.path.abspath(filepath)
-    loader = SourceFileLoader(filepath, filepath)
-    # Method load_module is deprecated since Python 3.4
-    # New API is not clear before Python 3.5
-    module = loader.load_module(filepath)
+    if name is None:
+        digest = hashlib.sha1(filepath.encode('utf-8')).hexdigest()
+        name = 'runfile_' + digest[:16]
+    if validation == 'checked-hash':
+        _compile_checked_hash(filepath)
+    loader = SourceFileLoader(name, filepath)
+    spec = spec_from_file_location(name, filepath, loader=loader)
+    module = module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(name, None)
+        raise
     return module
+
+
+def _compile_checked_hash(filepath):
+    # Loader keeps hash-based pyc hash-based on recompilation
+    # so we have to write it only if there is no such pyc yet
+    if sys.dont_write_bytecode:
+        return
+    cfile = cache_from_source(filepath)
+    try:
+        with open(cfile, 'rb') as file:
+            header = file.read(8)
+        if (header[:4] == MAGIC_NUMBER and
+            int.from_bytes(header[4:8], 'little') & 0b1):
+            return
+    except OSError:
+        pass
+    try:
+        py_compile.compile(
+            filepath, cfile=cfile, doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH)
+    except (OSError, py_compile.PyCompileError):
+        # Loader will report errors
+        pass
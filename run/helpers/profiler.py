@@ -0,0 +1,115 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class Profiler:
+    """Phase profiler measuring wall and CPU time by phase.
+
+    Nested phase pauses the outer one so every phase's time
+    is exclusive. Phases are tracked per thread. Phase context
+    manager has no measuring overhead while profiler is disabled
+    (start/stop calls are always measured).
+
+    Examples
+    --------
+    Usage example::
+
+      >>> profiler = Profiler(enabled=True)
+      >>> with profiler.phase('load'):
+      ...     with profiler.phase('build'):
+      ...         pass
+      >>> list(profiler.phases)
+      ['load', 'build']
+    """
+
+    # Public
+
+    def __init__(self, *, enabled=False):
+        self.enabled = enabled
+        self.__phases = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+
+    def add(self, name, wall, cpu):
+        """Add externally measured time to the phase.
+        """
+        with self.__lock:
+            phase = self.__phases.setdefault(name, [0, 0])
+            phase[0] += wall
+            phase[1] += cpu
+
+    @contextmanager
+    def phase(self, name):
+        """Measure phase in context if profiler is enabled.
+        """
+        if not self.enabled:
+            yield
+            return
+        self.start(name)
+        try:
+            yield
+        finally:
+            self.stop()
+
+    @property
+    def phases(self):
+        """Phases dict with [wall, cpu] values in seconds.
+        """
+        with self.__lock:
+            return OrderedDict(
+                (name, tuple(phase)) for name, phase in self.__phases.items())
+
+    def start(self, name):
+        """Start phase pausing the current one.
+        """
+        stack = self.__stack
+        if stack:
+            self.__pause(stack[-1])
+        stack.append([name, time.perf_counter(), time.thread_time()])
+
+    def stop(self):
+        """Stop the current phase (if any) resuming the outer one.
+        """
+        stack = self.__stack
+        if not stack:
+            return
+        self.__pause(stack.pop())
+        if stack:
+            stack[-1][1:] = [time.perf_counter(), time.thread_time()]
+
+    @staticmethod
+    def uptime():
+        """Return process's (wall, cpu) time since start in seconds.
+
+        Wall time is read from procfs with clock tick accuracy.
+        CPU time is returned as wall time if there is no procfs.
+        """
+        cpu = time.process_time()
+        try:
+            with open('/proc/self/stat') as file:
+                # Process name could contain spaces
+                fields = file.read().rsplit(')', 1)[1].split()
+            start = int(fields[19]) / os.sysconf('SC_CLK_TCK')
+            wall = time.clock_gettime(time.CLOCK_BOOTTIME) - start
+        except (OSError, ValueError, IndexError, AttributeError):
+            wall = cpu
+        return wall, cpu
+
+    # Private
+
+    @property
+    def __stack(self):
+        try:
+            return self.__local.stack
+        except AttributeError:
+            self.__local.stack = []
+            return self.__local.stack
+
+    def __pause(self, frame):
+        name, wall, cpu = frame
+        self.add(name,
+                 time.perf_counter() - wall,
+                 time.thread_time() - cpu)
@@ -0,0 +1,65 @@
+import signal
+from collections import Counter
+
+
+class Sampler:
+    """Sampling profiler collecting collapsed stacks.
+
+    Main thread's stack is sampled on process CPU time timer signal.
+    Dumped file has flamegraph's collapsed stacks format like::
+
+        <module> (runfile.py:1);build (runfile.py:5) 12
+
+    Sampler has :class:`cProfile.Profile` like interface.
+
+    Parameters
+    ----------
+    interval: float
+        Sampling interval in seconds of CPU time.
+    """
+
+    # Public
+
+    def __init__(self, interval=0.001):
+        self.__interval = interval
+        self.__stacks = Counter()
+        self.__handler = None
+
+    def enable(self):
+        """Start sampling.
+        """
+        self.__handler = signal.signal(signal.SIGPROF, self.__sample)
+        signal.setitimer(signal.ITIMER_PROF, self.__interval, self.__interval)
+
+    def disable(self):
+        """Stop sampling.
+        """
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self.__handler or signal.SIG_DFL)
+
+    def dump_stats(self, filepath):
+        """Dump collapsed stacks to the file.
+        """
+        with open(filepath, 'w') as file:
+            for stack, count in sorted(self.__stacks.items()):
+                file.write('{stack} {count}\n'.
+                           format(stack=stack, count=count))
+
+    @property
+    def stacks(self):
+        """Collapsed stacks counter.
+        """
+        return self.__stacks
+
+    # Private
+
+    def __sample(self, signum, frame):
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append('{name} ({file}:{line})'.format(
+                name=code.co_name,
+                file=code.co_filename,
+                line=code.co_firstlineno))
+            frame = frame.f_back
+        self.__stacks[';'.join(reversed(names))] += 1
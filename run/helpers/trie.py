@@ -0,0 +1,66 @@
+class Trie:
+    """Prefix tree for dotted names.
+
+    Every node holds one name segment so nested names
+    are resolved segment by segment.
+
+    Parameters
+    ----------
+    names: list
+        Names to add.
+    separator: str
+        Names segment separator.
+
+    Examples
+    --------
+    Completion returns names of the prefix's depth::
+
+      >>> trie = Trie(['build', 'test', 'test.unit', 'test.lint'])
+      >>> trie.complete('t')
+      ['test']
+      >>> trie.complete('test.')
+      ['test.lint', 'test.unit']
+    """
+
+    # Public
+
+    def __init__(self, names=(), *, separator='.'):
+        self.__separator = separator
+        self.__root = {}
+        for name in names:
+            self.add(name)
+
+    def __contains__(self, name):
+        node = self.__find(name.split(self.__separator))
+        return node is not None
+
+    def add(self, name):
+        """Add name to the trie.
+        """
+        node = self.__root
+        for segment in name.split(self.__separator):
+            node = node.setdefault(segment, {})
+
+    def complete(self, prefix):
+        """Return sorted names completing the prefix.
+        """
+        segments = prefix.split(self.__separator)
+        node = self.__find(segments[:-1])
+        if node is None:
+            return []
+        names = []
+        for segment in sorted(node):
+            if segment.startswith(segments[-1]):
+                name = self.__separator.join(segments[:-1] + [segment])
+                names.append(name)
+        return names
+
+    # Private
+
+    def __find(self, segments):
+        node = self.__root
+        for segment in segments:
+            node = node.get(segment)
+            if node is None:
+                return None
+        return node
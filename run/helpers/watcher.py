@@ -0,0 +1,336 @@
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+from abc import ABCMeta, abstractmethod
+from fnmatch import fnmatch
+
+
+class Watcher(metaclass=ABCMeta):
+    """Watcher of file changes base class.
+
+    Directories are watched recursively. Bursts of changes are
+    debounced: changes are collected until there is no new
+    change for the debounce period. Use :meth:`create` to get
+    the most efficient watcher for the platform.
+
+    Parameters
+    ----------
+    paths: list
+        Directories and files to watch.
+    ignore: list
+        Glob patterns of path components to ignore (like ".*").
+    exclude: list
+        Glob patterns of absolute paths to ignore with their
+        contents (like task's outputs).
+    debounce: float
+        Quiet period in seconds to finish changes burst.
+    interval: float
+        Polling interval in seconds (for polling watcher).
+
+    Examples
+    --------
+    Usage example::
+
+      >>> watcher = Watcher.create(['src'], ignore=['__pycache__'])
+      >>> watcher.wait()
+      {'/project/src/module.py'}
+    """
+
+    # Public
+
+    def __init__(self, paths, *, ignore=(), exclude=(),
+                 debounce=0.1, interval=0.5):
+        self.__paths = [os.path.abspath(path) for path in paths]
+        self.__ignore = list(ignore)
+        self.__exclude = [os.path.abspath(pattern) for pattern in exclude]
+        self.__debounce = debounce
+        self.__interval = interval
+
+    def __repr__(self):
+        return '<{name} {paths}>'.format(
+            name=type(self).__name__, paths=self.paths)
+
+    def close(self):
+        """Release watcher's resources.
+        """
+        pass
+
+    @staticmethod
+    def create(paths, **kwargs):
+        """Return inotify watcher on Linux or polling watcher otherwise.
+        """
+        if sys.platform.startswith('linux'):
+            try:
+                return InotifyWatcher(paths, **kwargs)
+            except OSError:
+                pass
+        return PollingWatcher(paths, **kwargs)
+
+    def ignored(self, path):
+        """Return True if any path component (relative to the
+        watched path) matches ignore patterns or the path (or any
+        of it's parents) matches exclude patterns.
+        """
+        for pattern in self.__exclude:
+            if (fnmatch(path, pattern) or
+                    fnmatch(path, os.path.join(pattern, '*'))):
+                return True
+        for root in self.paths:
+            if path == root:
+                return False
+            if path.startswith(root + os.sep):
+                path = os.path.relpath(path, root)
+                break
+        for name in path.split(os.sep):
+            for pattern in self.__ignore:
+                if fnmatch(name, pattern):
+                    return True
+        return False
+
+    @property
+    def interval(self):
+        return self.__interval
+
+    @property
+    def paths(self):
+        return self.__paths
+
+    @abstractmethod
+    def poll(self, timeout=None):
+        """Return set of paths changed during timeout (not debounced).
+        """
+        pass  # pragma: no cover
+
+    def wait(self, timeout=None):
+        """Wait for changes and return set of changed paths.
+
+        Empty set is returned if there are no changes for timeout.
+        """
+        changes = self.poll(timeout)
+        while changes:
+            more = self.poll(self.__debounce)
+            if not more:
+                break
+            changes |= more
+        return changes
+
+
+class PollingWatcher(Watcher):
+    """Watcher of file changes polling files stat data.
+
+    Files are listed with :func:`os.scandir` (ignored directories
+    are never entered) and compared by modification time, size
+    and inode with the previous poll.
+
+    .. seealso:: :class:`Watcher`
+    """
+
+    # Public
+
+    def __init__(self, paths, **kwargs):
+        super().__init__(paths, **kwargs)
+        self.__snapshot = self.__scan()
+
+    def poll(self, timeout=None):
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+        while True:
+            snapshot = self.__scan()
+            changes = set()
+            for path in snapshot.keys() | self.__snapshot.keys():
+                if snapshot.get(path) != self.__snapshot.get(path):
+                    changes.add(path)
+            self.__snapshot = snapshot
+            if changes:
+                return changes
+            interval = self.interval
+            if deadline is not None:
+                interval = min(interval, deadline - time.monotonic())
+                if interval <= 0:
+                    return changes
+            time.sleep(interval)
+
+    # Private
+
+    def __scan(self):
+        snapshot = {}
+        for path in self.paths:
+            if os.path.isdir(path):
+                self.__scan_directory(path, snapshot)
+            else:
+                self.__stat(path, snapshot)
+        return snapshot
+
+    def __scan_directory(self, dirpath, snapshot):
+        try:
+            entries = list(os.scandir(dirpath))
+        except OSError:
+            return
+        for entry in entries:
+            if self.ignored(entry.path):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    self.__scan_directory(entry.path, snapshot)
+                    continue
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            snapshot[entry.path] = (
+                stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def __stat(self, path, snapshot):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class InotifyWatcher(Watcher):
+    """Watcher of file changes using Linux inotify (through ctypes).
+
+    Every not ignored directory gets it's own watch (new directories
+    are watched once created) and watched files are watched through
+    their parent directories. Queue overflow is reported as
+    change of the watched paths.
+
+    .. seealso:: :class:`Watcher`
+    """
+
+    # Public
+
+    def __init__(self, paths, **kwargs):
+        super().__init__(paths, **kwargs)
+        self.__libc = _load_libc()
+        self.__fd = self.__libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.__fd < 0:
+            raise self.__error()
+        self.__watches = {}
+        self.__files = set()
+        try:
+            for path in self.paths:
+                if os.path.isdir(path):
+                    self.__add_tree(path)
+                else:
+                    self.__files.add(path)
+                    self.__add(os.path.dirname(path))
+        except OSError:
+            self.close()
+            raise
+
+    def close(self):
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+
+    def poll(self, timeout=None):
+        changes = set()
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+        if not readable:
+            return changes
+        try:
+            data = os.read(self.__fd, 65536)
+        except BlockingIOError:
+            return changes
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = struct.unpack_from('iIII', data, offset)
+            offset += struct.calcsize('iIII')
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                changes.update(self.paths)
+                continue
+            dirpath = self.__watches.get(wd)
+            if dirpath is None:
+                continue
+            if mask & _IN_IGNORED:
+                del self.__watches[wd]
+                continue
+            path = dirpath
+            if name:
+                path = os.path.join(dirpath, os.fsdecode(name))
+            if not self.__accepted(path):
+                continue
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                self.__add_tree(path)
+            changes.add(path)
+        return changes
+
+    # Private
+
+    def __accepted(self, path):
+        if self.ignored(path):
+            return False
+        if path in self.__files:
+            return True
+        for root in self.paths:
+            if root not in self.__files:
+                if path == root or path.startswith(root + os.sep):
+                    return True
+        return False
+
+    def __add(self, dirpath):
+        wd = self.__libc.inotify_add_watch(
+            self.__fd, os.fsencode(dirpath), _MASK)
+        if wd < 0:
+            error = self.__error()
+            # Directory could be removed before watching
+            if error.errno in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise error
+        self.__watches[wd] = dirpath
+
+    def __add_tree(self, dirpath):
+        self.__add(dirpath)
+        for root, dirnames, _ in os.walk(dirpath):
+            dirnames[:] = [name for name in dirnames
+                           if not self.ignored(os.path.join(root, name))]
+            for name in dirnames:
+                self.__add(os.path.join(root, name))
+
+    def __error(self):
+        code = ctypes.get_errno()
+        return OSError(code, os.strerror(code))
+
+
+# Inotify
+
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE |
+         _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE |
+         _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+
+
+def _load_libc():
+    path = ctypes.util.find_library('c')
+    try:
+        libc = ctypes.CDLL(path, use_errno=True)
+        init = libc.inotify_init1
+        add_watch = libc.inotify_add_watch
+    except (OSError, AttributeError) as exception:
+        raise OSError(str(exception))
+    init.argtypes = [ctypes.c_int]
+    init.restype = ctypes.c_int
+    add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    add_watch.restype = ctypes.c_int
+    return libc
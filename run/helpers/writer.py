@@ -0,0 +1,74 @@
+import json
+from collections.abc import Iterator
+
+
+class Writer:
+    """Writer of call results to the text stream.
+
+    Iterator result (like generator) is written item by item as it's
+    produced so the output is streamed with flat memory use. Every
+    item (or not iterator result) is written as a line: str(item)
+    for "text" format or JSON for "jsonl" format. In text format
+    bytes items are written as is to the stream's binary buffer.
+
+    Parameters
+    ----------
+    stream: object
+        Text stream like sys.stdout.
+    format: str
+        Output format: "text" or "jsonl".
+
+    Examples
+    --------
+    Usage example::
+
+      >>> writer = Writer(sys.stdout, format='jsonl')
+      >>> writer.write(iter([{'line': 1}, {'line': 2}]))
+      {"line": 1}
+      {"line": 2}
+    """
+
+    # Public
+
+    FORMATS = ['text', 'jsonl']
+
+    def __init__(self, stream, *, format='text'):
+        if format not in self.FORMATS:
+            raise ValueError(
+                'Unsupported format "{format}"'.format(format=format))
+        self.__stream = stream
+        self.__format = format
+
+    def __repr__(self):
+        return '<Writer "{self.format}">'.format(self=self)
+
+    @property
+    def format(self):
+        return self.__format
+
+    def write(self, result):
+        """Write result (iterator is written item by item).
+        """
+        if isinstance(result, Iterator):
+            for item in result:
+                self.__write(item)
+        else:
+            self.__write(result)
+        self.__stream.flush()
+
+    # Private
+
+    def __write(self, item):
+        stream = self.__stream
+        if self.format == 'jsonl':
+            stream.write(json.dumps(item, default=repr) + '\n')
+        elif isinstance(item, (bytes, bytearray)):
+            buffer = getattr(stream, 'buffer', None)
+            if buffer is None:
+                stream.write(item.decode(errors='replace'))
+                return
+            # Text written before has to go first
+            stream.flush()
+            buffer.write(item)
+        else:
+            stream.write(str(item) + '\n')
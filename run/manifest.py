@@ -0,0 +1,204 @@
+import os
+import json
+import hashlib
+import logging
+from .helpers import Trie, cachedproperty
+from .module import Module
+from .settings import settings
+from .task import describe, stylize
+
+
+class Manifest:
+    """Runfile's task manifest.
+
+    Manifest describes runfile's tasks (names, signatures, docstrings etc)
+    to display them without runfile importing. It's stored in the cache
+    directory keyed by runfile's path (so it's replaced on the next dump)
+    with runfile's content hash so any runfile change makes it outdated.
+
+    Parameters
+    ----------
+    filepath: str
+        Runfile path.
+    """
+
+    # Public
+
+    FORMAT = 3
+
+    def __init__(self, filepath):
+        self.__filepath = os.path.abspath(filepath)
+        self.__tasks = None
+        self.__history = None
+
+    def __repr__(self):
+        return '<Manifest "{self.filepath}">'.format(self=self)
+
+    def complete(self, prefix):
+        """Return sorted task names completing the prefix.
+        """
+        return self.__trie.complete(prefix)
+
+    def dump(self, module):
+        """Describe module's tasks and dump manifest to the cache directory.
+
+        Described tasks are available even if dumping fails (it's not
+        tried again for the same directory in this process).
+
+        Parameters
+        ----------
+        module: :class:`.Module`
+            Runfile's main module.
+
+        Returns
+        -------
+        bool
+            Dumping status.
+        """
+        self.__tasks = {}
+        self.__history = module.Locate(settings.history_filename)
+        self.__describe(module, '')
+        dirpath = os.path.dirname(self.path)
+        if dirpath in self.__failed:
+            return False
+        data = {
+            'format': self.FORMAT,
+            'filepath': self.filepath,
+            'digest': self.__digest,
+            'history': self.__history,
+            'tasks': self.__tasks,
+        }
+        temppath = '{path}.{pid}'.format(path=self.path, pid=os.getpid())
+        try:
+            os.makedirs(dirpath, exist_ok=True)
+            with open(temppath, 'w', encoding='utf-8') as file:
+                json.dump(data, file)
+            os.replace(temppath, self.path)
+        except OSError as exception:
+            self.__failed.add(dirpath)
+            logger = logging.getLogger(__name__)
+            logger.debug(str(exception))
+            return False
+        return True
+
+    @property
+    def exists(self):
+        """Manifest's existence status for the current runfile content.
+        """
+        return self.__read() is not None
+
+    @property
+    def filepath(self):
+        return self.__filepath
+
+    @property
+    def history(self):
+        """Runfile's timing history database path.
+        """
+        return self.__history
+
+    def info(self, task=None):
+        """Return task information like :meth:`.Module.info` prints.
+        """
+        return self.__tasks[task or '']['info']
+
+    def list(self, module=None):
+        """Return module tasks like :meth:`.Module.list` prints.
+        """
+        names = []
+        module = module or ''
+        for name in self.__tasks[module]['names']:
+            name = '.'.join(filter(None, [module, name]))
+            task = self.__tasks.get(name)
+            if task is not None:
+                if task['hidden']:
+                    continue
+                name = stylize(name, style=task['style'])
+            names.append(name)
+        result = '\n'.join(names)
+        return result
+
+    def load(self):
+        """Load manifest from the cache directory.
+
+        Returns
+        -------
+        bool
+            Loading status (False if there is no manifest
+            for the current runfile content).
+        """
+        data = self.__read()
+        if data is None:
+            return False
+        self.__tasks = data['tasks']
+        self.__history = data['history']
+        return True
+
+    @cachedproperty
+    def path(self):
+        """Manifest's path in the cache directory.
+        """
+        digest = hashlib.sha1(self.filepath.encode('utf-8'))
+        path = os.path.join(
+            settings.cache_dirpath, 'manifest',
+            digest.hexdigest() + '.json')
+        return path
+
+    # Private
+
+    __failed = set()
+
+    @cachedproperty
+    def __digest(self):
+        digest = hashlib.sha1()
+        try:
+            with open(self.filepath, 'rb') as file:
+                digest.update(file.read())
+        except OSError:
+            pass
+        return digest.hexdigest()
+
+    def __read(self):
+        # Data of manifest for the current runfile content or None
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.get('format') != self.FORMAT:
+            return None
+        if data.get('digest') != self.__digest:
+            return None
+        return data
+
+    @cachedproperty
+    def __trie(self):
+        trie = Trie()
+        for qualname, task in self.__tasks.items():
+            for name in task.get('names', []):
+                name = '.'.join(filter(None, [qualname, name]))
+                if self.__tasks.get(name, {}).get('hidden', False):
+                    continue
+                trie.add(name)
+        return trie
+
+    def __describe(self, task, qualname):
+        description = {
+            'hidden': task.Hidden,
+            'info': describe(task),
+            'style': task.Style,
+        }
+        if isinstance(task, Module):
+            names = []
+            tasks = task.Tasks
+            for name in sorted(dir(task)):
+                if name[0].isupper():
+                    continue
+                elif name.startswith('_'):
+                    continue
+                elif name in tasks:
+                    self.__describe(tasks[name],
+                        '.'.join(filter(None, [qualname, name])))
+                names.append(name)
+            description['names'] = names
+        self.__tasks[qualname] = description
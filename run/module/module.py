@@ -1,11 +1,15 @@
 import os
+import time
 import inspect
+import threading
 from pprint import pprint
 from builtins import print
 from collections import OrderedDict
 from ..helpers import cachedproperty, import_object
+from ..profiler import profiler
 from ..settings import settings
-from ..task import Task, Prototype, ConvertError, convert, stylize
+from ..task import (Task, History, Prototype, ConvertError,
+                    convert, describe, stylize)
 from .exception import GetattrError
 
 
@@ -15,6 +19,25 @@ class Module(Task):
 
     Auto = True
 
+    async def Acall(self, __qualname, *args, **kwargs):
+        """Call module's task asynchronously.
+
+        Parameters
+        ----------
+        qualname: str
+            Task's qualified name relative to the module.
+        args, kwargs
+            Arguments for task calling.
+
+        Examples
+        --------
+        Usage example::
+
+            result = await module.Acall('build.assets', minify=True)
+        """
+        task = self.__get_task(__qualname)
+        return await Task.Acall(task, *args, **kwargs)
+
     def __getattribute__(self, name):
         nested_name = None
         if '.' in name:
@@ -29,6 +52,10 @@ class Module(Task):
             raise GetattrError(
                 'Module "{self}" has no attribute "{name}".'.
                 format(self=self, name=name))
+        if isinstance(attribute, Prototype):
+            # Task prototypes are built on first access
+            task = self.__build(name)
+            attribute = task.__get__(self, type(self))
         if nested_name is not None:
             attribute = getattr(attribute, nested_name)
         return attribute
@@ -39,6 +66,24 @@ class Module(Task):
             os.path.dirname(inspect.getfile(type(self))))
         return self.Inspect('Basedir', default=default)
 
+    @property
+    def BuildTime(self):
+        """Module's (including submodules) task building time in seconds.
+        """
+        result = self.__build_time
+        for module in self.__built_modules:
+            result += module.BuildTime
+        return result
+
+    @property
+    def Builds(self):
+        """Module's (including submodules) built tasks count.
+        """
+        result = self.__builds
+        for module in self.__built_modules:
+            result += module.Builds
+        return result
+
     @property
     def Cache(self):
         """Vars caching status (enabled or disabled).
@@ -48,24 +93,35 @@ class Module(Task):
     @classmethod
     def Create(cls, *args, **kwargs):
         # Create module object
-        spawned_class = cls.Spawn()
+        with profiler.phase('spawn'):
+            spawned_class = cls.Spawn()
         self = super(Module, spawned_class).Create(*args, **kwargs)
-        # Create tasks
-        names = []
+        # Collect task prototypes to build them lazily
+        self.__prototypes = []
+        self.__builds = 0
+        self.__build_time = 0
+        self.__build_lock = threading.RLock()
+        self.__updated = False
+        names = set()
         for cls in type(self).mro():
             for name, attr in vars(cls).items():
                 if name in names:
                     continue
-                names.append(name)
+                names.add(name)
                 if isinstance(attr, Prototype):
-                    task = attr.Build(Module=self)
-                    setattr(type(self), name, task)
+                    self.__prototypes.append(name)
         return self
 
     @property
     def Default(self):
         return self.Inspect('Default', default='list')
 
+    @property
+    def Executor(self):
+        """Module is always invoked in place (see :attr:`Task.Executor`).
+        """
+        return None
+
     def Invoke(self, *args, **kwargs):
         default = getattr(self, self.Default)
         result = default(*args, **kwargs)
@@ -88,6 +144,27 @@ class Module(Task):
         """
         return super().Inspect(name, default=default)
 
+    def Lookup(self, name):
+        """Return module's task by name or None (only it is built).
+
+        Nested name is looked up segment-wise. Unlike attribute
+        access it never evaluates vars.
+        """
+        nested_name = None
+        if '.' in name:
+            # Nested name - split
+            name, nested_name = name.split('.', 1)
+        if name in self.__prototypes:
+            self.__build(name)
+        task = vars(type(self)).get(name)
+        if not isinstance(task, Task):
+            return None
+        if nested_name is not None:
+            if not isinstance(task, Module):
+                return None
+            task = task.Lookup(nested_name)
+        return task
+
     @classmethod
     def Spawn(cls):
         names = []
@@ -105,8 +182,12 @@ class Module(Task):
                     attrs[name] = attr.Fork()
                 else:
                     if cls.Auto:
+                        # Module's own methods are invoked in place
+                        kwargs = {}
+                        if namespace is Module:
+                            kwargs['Executor'] = None
                         try:
-                            attrs[name] = convert(attr)
+                            attrs[name] = convert(attr, **kwargs)
                         except ConvertError:
                             pass
         attrs['__doc__'] = cls.__doc__
@@ -123,6 +204,8 @@ class Module(Task):
 
         Dict contains task instances, not values.
         """
+        for name in self.__prototypes:
+            self.__build(name)
         tasks = {}
         for name, attr in vars(type(self)).items():
             if isinstance(attr, Task):
@@ -130,8 +213,11 @@ class Module(Task):
         return tasks
 
     def Update(self):
-        for task in self.Tasks.values():
-            task.Update()
+        # Not built yet tasks will be updated after building
+        for attr in list(vars(type(self)).values()):
+            if isinstance(attr, Task):
+                attr.Update()
+        self.__updated = True
         super().Update()
 
     def list(self, module=None):
@@ -162,20 +248,8 @@ class Module(Task):
     def info(self, task=None):
         """Print task information.
         """
-        info = ''
         task = self.__get_task(task)
-        info += task.Qualname
-        info += task.Signature
-        info += '\n---\n'
-        info += 'Type: ' + task.Type
-        info += '\n'
-        info += 'Dependencies: ' + str(task.Dependencies)
-        info += '\n'
-        info += 'Default arguments: ' + str(task.Args)
-        info += '\n'
-        info += 'Default keyword arguments: ' + str(task.Kwargs)
-        info += '\n---\n'
-        info += task.Docstring
+        info = describe(task, stats=self.__get_stats(task))
         print(info)
 
     def meta(self, task=None):
@@ -192,6 +266,40 @@ class Module(Task):
 
     # Private
 
+    def __build(self, name):
+        with self.__build_lock:
+            task = getattr(type(self), name)
+            if not isinstance(task, Prototype):
+                # Already built
+                return task
+            start = time.perf_counter()
+            with profiler.phase('build'):
+                task = task.Build(Module=self, Name=name)
+            setattr(type(self), name, task)
+            self.__build_time += time.perf_counter() - start
+            self.__builds += 1
+            if self.__updated:
+                task.Update()
+        return task
+
+    def __get_stats(self, task):
+        # History database is never created to be described
+        filepath = self.Main.Locate(settings.history_filename)
+        if not os.path.exists(filepath):
+            return None
+        history = History.get(filepath)
+        for stats in history.stats(
+                task.Qualname, limit=settings.history_limit):
+            if stats.qualname == task.Qualname:
+                return stats
+        return None
+
+    @property
+    def __built_modules(self):
+        for attr in list(vars(type(self)).values()):
+            if isinstance(attr, Module):
+                yield attr
+
     # TODO: somehow to merge with __getattribute__?
     def __get_task(self, name=None):
         if name is None:
@@ -201,7 +309,11 @@ class Module(Task):
             # Nested name - split
             name, nested_name = name.split('.', 1)
         # TODO: add good exception text here like in __getattribute__
-        task = self.Tasks[name]
+        if name in self.__prototypes:
+            self.__build(name)
+        task = vars(type(self))[name]
+        if not isinstance(task, Task):
+            raise KeyError(name)
         if nested_name is not None:
             task = task.__get_task(nested_name)
         return task
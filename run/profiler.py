@@ -0,0 +1,4 @@
+from .helpers import Profiler
+
+# Program's phase profiler (enabled by "--profile")
+profiler = Profiler()
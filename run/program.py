@@ -1,11 +1,23 @@
 import os
 import sys
-import inspect
+import signal
+import cProfile
+import json
+import contextvars
 import logging.config
+from contextlib import ExitStack, contextmanager, redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
 from clyde import Command, Option, mixin
-from .helpers import cachedproperty, load, parse
-from .module import Module
+from .batch import Batch
+from .daemon import Client, Server, locate
+from .helpers import (Sampler, Watcher, Writer,
+                      cachedproperty, importtime, parse)
+from .manifest import Manifest
+from .profiler import profiler
+from .runfile import Runfile
 from .settings import settings
+from .task import (DiskCache, History, Mapper, Pipeline, Plan, Session,
+                   Worker)
 version = '0.47.0'  # REPLACE: version = '{{ version }}'
 
 
@@ -15,25 +27,38 @@ class Program(Command):
 
     # Public
 
+    def __call__(self, *args, **kwargs):
+        # Daemon's children are called again in the same process
+        if 'import' not in profiler.phases:
+            profiler.add('import', *profiler.uptime())
+        profiler.start('parse')
+        return super().__call__(*args, **kwargs)
+
     def Execute(self, attribute=None, *arguments):
-        for name in ['list', 'info', 'meta']:
-            if getattr(self, name, False):
-                if attribute is not None:
-                    arguments = (attribute,) + arguments
-                attribute = name
-                break
-        self.__run(attribute, *arguments)
+        self.__update_settings()
+        if self.server:
+            return self.__serve()
+        if self.worker:
+            return self.__work()
+        if self.importtime:
+            return self.__importtime()
+        with self.__profile():
+            self.__execute(attribute, *arguments)
 
     # Mixins
 
     @mixin
     def initiate_logging(self):
+        # Profiler is not enabled yet so it's measured explicitly
+        profiler.stop()
+        profiler.start('logging')
         logging.config.dictConfig(settings.logging_config)
         logger = logging.getLogger()
         if self.verbose:
             logger.setLevel(logging.DEBUG)
         if self.quiet:
             logger.setLevel(logging.ERROR)
+        profiler.stop()
 
     @mixin(require='help')
     def print_help(self):
@@ -47,6 +72,18 @@ class Program(Command):
 
     # Options
 
+    batch = Option(
+        flags=['--batch'],
+        default=None,
+        help='Run task calls from JSONL file ("-" for stdin).',
+    )
+
+    complete = Option(
+        flags=['--complete'],
+        default=None,
+        help='Display task names completing the prefix.',
+    )
+
     filepath = Option(
         flags=['-f', '--filepath'],
         default=settings.filename,
@@ -59,30 +96,103 @@ class Program(Command):
         help='Display this help message.',
     )
 
+    importtime = Option(
+        action='store_true',
+        flags=['--importtime'],
+        help='Display import time by module.',
+    )
+
     info = Option(
         action='store_true',
         flags=['-i', '--info'],
         help='Display task information.',
     )
 
+    jobs = Option(
+        default=None,
+        flags=['-j', '--jobs'],
+        help='Run tasks and requires concurrently with the given jobs count.',
+    )
+
+    keep_going = Option(
+        action='store_true',
+        flags=['-k', '--keep-going'],
+        help='Keep running requires not depending on failed ones.',
+    )
+
     list = Option(
         action='store_true',
         flags=['-l', '--list'],
         help='Display module tasks.',
     )
 
+    listen = Option(
+        flags=['--listen'],
+        default=None,
+        help=('Worker "host:port" address to listen '
+              '(not loopback one requires RUN_WORKER_AUTHKEY).'),
+    )
+
+    map_from = Option(
+        flags=['--map-from'],
+        default=None,
+        help='Call task for every item of JSON lines file ("-" for stdin).',
+    )
+
     meta = Option(
         action='store_true',
         flags=['-m', '--meta'],
         help='Display task meta.',
     )
 
+    order = Option(
+        flags=['--order'],
+        default='input',
+        help='Batch results order: "input" or "completion".',
+    )
+
+    output = Option(
+        flags=['--output'],
+        default='text',
+        help='Result output format: "text" or "jsonl".',
+    )
+
+    plan = Option(
+        action='store_true',
+        flags=['--plan'],
+        help='Display task call graph without executing it.',
+    )
+
+    plan_format = Option(
+        flags=['--plan-format'],
+        default='json',
+        help='Plan format: "json" or "dot".',
+    )
+
+    profile = Option(
+        action='store_true',
+        flags=['--profile'],
+        help='Display time by startup phase.',
+    )
+
+    profile_output = Option(
+        flags=['--profile-output'],
+        default=None,
+        help='Dump pstats (or collapsed stacks for ".folded") to the file.',
+    )
+
     quiet = Option(
         action='store_true',
         flags=['-q', '--quiet'],
         help='Enable quiet mode.',
     )
 
+    server = Option(
+        action='store_true',
+        flags=['--server'],
+        help='Serve invocations forwarded with -s daemon=True.',
+    )
+
     settings = Option(
         action='append',
         default=[],
@@ -90,58 +200,535 @@ class Program(Command):
         help='Add settings key/value pair.',
     )
 
+    simulate = Option(
+        action='store_true',
+        flags=['--simulate'],
+        help='Predict plan makespan for job counts up to --jobs.',
+    )
+
+    stats = Option(
+        action='store_true',
+        flags=['--stats'],
+        help='Display task timing history stats.',
+    )
+
     verbose = Option(
         action='store_true',
         flags=['-v', '--verbose'],
         help='Enable verbose mode.',
     )
 
+    watch = Option(
+        action='store_true',
+        flags=['--watch'],
+        help='Run task again on file changes (in-flight run is cancelled).',
+    )
+
     version = Option(
         action='store_true',
         flags=['-V', '--version'],
         help='Display the program version.',
     )
 
+    worker = Option(
+        action='store_true',
+        flags=['--worker'],
+        help='Invoke tasks for a cluster coordinator.',
+    )
+
+    workers = Option(
+        flags=['--workers'],
+        default=None,
+        help='Invoke tasks on comma-separated "host:port" workers.',
+    )
+
     # Private
 
-    def __run(self, attribute, *arguments):
-        args, kwargs = parse(''.join(arguments))
+    __serving = False
+    __phases = ['import', 'parse', 'logging',
+                'load', 'spawn', 'build', 'update', 'invoke']
+
+    def __execute(self, attribute, *arguments):
+        if self.complete is not None:
+            return self.__complete(self.complete)
+        if settings.manifest and not arguments:
+            for name in ['list', 'info']:
+                if getattr(self, name, False):
+                    if self.__describe(name, attribute):
+                        return
+        if self.watch:
+            return self.__watch(attribute, arguments)
+        if settings.daemon and not self.__serving and not self.__profiling:
+            self.__forward()
+        if self.plan or self.simulate:
+            return self.__plan(attribute, arguments)
+        if self.stats:
+            return self.__stats(attribute)
+        if self.batch is not None:
+            return self.__batch(self.batch)
+        for name in ['list', 'info', 'meta']:
+            if getattr(self, name, False):
+                if attribute is not None:
+                    arguments = (attribute,) + arguments
+                return self.__run([(name, arguments)])
+        self.__run(self.__split(attribute, arguments))
+
+    def __run(self, calls):
         try:
+            calls = list(calls)
+            jobs = min(settings.jobs, len(calls))
+            writer = Writer(sys.stdout, format=self.output)
+            # Calls of the command line share resolution session
+            with Session.enter():
+                if jobs > 1:
+                    with ThreadPoolExecutor(max_workers=jobs) as executor:
+                        futures = [executor.submit(
+                            contextvars.copy_context().run,
+                            self.__call, call) for call in calls]
+                        for future in futures:
+                            self.__print(writer, future.result())
+                else:
+                    for call in calls:
+                        self.__print(writer, self.__call(call))
+        except Exception as exception:
+            logger = logging.getLogger(__name__)
+            logger.error(str(exception), exc_info=self.verbose)
+            sys.exit(1)
+        finally:
+            self.__report_cache()
+
+    def __call(self, call):
+        attribute, arguments = call
+        args, kwargs = parse(''.join(arguments))
+        with profiler.phase('invoke'):
             if attribute is None:
                 attribute = self.__module
+            elif '|' in attribute:
+                # Pipeline expression like "extract | load"
+                stages = [name.strip() for name in attribute.split('|')]
+                attribute = Pipeline(*stages, Build=True,
+                                     Module=self.__module, Name=attribute)
             else:
                 attribute = getattr(self.__module, attribute)
             if not callable(attribute):
-                return print(attribute)
-            self.__update_settings()
-            result = attribute(*args, **kwargs)
-            if result is not None:
-                print(result)
+                return attribute
+            if self.map_from is not None:
+                mapper = Mapper(attribute, self.__read_items(self.map_from))
+                return mapper(*args, **kwargs)
+            return attribute(*args, **kwargs)
+
+    def __read_items(self, path):
+        # Items are read lazily (file is closed once exhausted)
+        with ExitStack() as stack:
+            file = sys.stdin
+            if path != '-':
+                file = stack.enter_context(open(path))
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def __report_cache(self):
+        # Uploads are waited for here not to block task completion
+        logger = logging.getLogger(__name__)
+        for store in DiskCache.shared():
+            store.flush()
+            stats = store.stats
+            if stats.hits or stats.remote_hits or stats.misses:
+                logger.info('Cache: {stats}'.format(stats=stats))
+
+    def __print(self, writer, result):
+        # Streams are written as they are produced
+        if result is not None:
+            writer.write(result)
+
+    def __split(self, attribute, arguments):
+        # Calls are separated only by explicit separator so
+        # arguments are never taken for tasks (generator to be lazy)
+        if settings.separator in arguments:
+            call = [attribute]
+            for argument in arguments:
+                if argument == settings.separator:
+                    yield (call[0], tuple(call[1:]))
+                    call = []
+                else:
+                    call.append(argument)
+            if call:
+                yield (call[0], tuple(call[1:]))
+        else:
+            yield (attribute, arguments)
+
+    @property
+    def __module(self):
+        return self.__runfile.module
+
+    @cachedproperty
+    def __runfile(self):
+        return Runfile(self.filepath)
+
+    def __watch(self, attribute, arguments):
+        # Every run is forked from the process with loaded module
+        # so it starts fast in a fresh session and it's cancelled
+        # by killing the child when new changes land (task's own
+        # outputs are excluded from watching)
+        logger = logging.getLogger(__name__)
+        try:
+            paths, exclude = self.__locate_watched(attribute)
+            watcher = Watcher.create(
+                paths,
+                ignore=settings.watch_ignore,
+                exclude=exclude,
+                debounce=settings.watch_debounce,
+                interval=settings.watch_interval)
+        except Exception as exception:
+            logger.error(str(exception), exc_info=self.verbose)
+            sys.exit(1)
+        calls = list(self.__split(attribute, arguments))
+        pid = None
+        try:
+            while True:
+                pid = self.__fork(calls)
+                changes = set()
+                while not changes:
+                    timeout = None
+                    if pid is not None:
+                        timeout = settings.watch_interval
+                    changes = watcher.wait(timeout)
+                    if pid is not None and os.waitpid(pid, os.WNOHANG)[0]:
+                        pid = None
+                        logger.info('Waiting for changes...')
+                if pid is not None:
+                    self.__kill(pid)
+                    pid = None
+                    logger.info('Run is cancelled.')
+                logger.info('Changed: {paths}'.format(
+                    paths=', '.join(sorted(changes))))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if pid is not None:
+                self.__kill(pid)
+            watcher.close()
+
+    def __locate_watched(self, attribute):
+        # Task's inputs are watched by their not glob prefixes
+        # and task's outputs are excluded
+        task = self.__module
+        if attribute is not None:
+            task = getattr(self.__module, attribute)
+        paths = [self.__runfile.filepath]
+        inputs = getattr(task, 'Inputs', [])
+        if not inputs:
+            paths.append(self.__module.Locate())
+        for pattern in inputs:
+            prefix = []
+            for part in pattern.split(os.sep):
+                if any(char in part for char in '*?['):
+                    break
+                prefix.append(part)
+            paths.append(task.Locate(*prefix))
+        exclude = [task.Locate(pattern)
+                   for pattern in getattr(task, 'Outputs', [])]
+        return (paths, exclude)
+
+    def __fork(self, calls):
+        logger = logging.getLogger(__name__)
+        try:
+            # Runfile is rebuilt before forking if it has been changed
+            self.__module
+        except Exception as exception:
+            logger.error(str(exception), exc_info=self.verbose)
+            return None
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid:
+            return pid
+        status = 0
+        try:
+            self.__run(calls)
+        except SystemExit as exception:
+            status = exception.code if isinstance(exception.code, int) else 1
+        except BaseException:
+            status = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(status)
+
+    def __kill(self, pid):
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        os.waitpid(pid, 0)
+
+    def __batch(self, path):
+        # Task output goes to stderr to keep results stream clean
+        output = sys.stdout
+        try:
+            batch = Batch(
+                self.__module, jobs=settings.jobs, order=self.order)
+            with ExitStack() as stack:
+                input = sys.stdin
+                if path != '-':
+                    input = stack.enter_context(open(path))
+                stack.enter_context(redirect_stdout(sys.stderr))
+                stack.enter_context(profiler.phase('invoke'))
+                failures = batch(input, output)
         except Exception as exception:
             logger = logging.getLogger(__name__)
             logger.error(str(exception), exc_info=self.verbose)
             sys.exit(1)
+        finally:
+            self.__report_cache()
+        if failures:
+            sys.exit(1)
 
-    @cachedproperty
-    def __module(self):
-        filepath = os.path.abspath(self.filepath)
-        module = load(filepath)
-        for name in dir(module):
-            attr = getattr(module, name)
-            if not isinstance(attr, type):
-                continue
-            if not issubclass(attr, Module):
-                continue
-            if inspect.getmodule(attr) != module:
-                continue
-            module = attr(Build=True)
-            return module
-        raise RuntimeError('Module not found.')
+    def __plan(self, attribute, arguments):
+        try:
+            args, kwargs = parse(''.join(arguments))
+            task = self.__module
+            if attribute is not None:
+                task = getattr(self.__module, attribute)
+            durations = {}
+            filepath = self.__module.Locate(settings.history_filename)
+            # History database is never created to be displayed
+            if os.path.exists(filepath):
+                for record in History.get(filepath).stats(
+                        limit=settings.history_limit):
+                    durations[record.qualname] = record.mean
+            plan = Plan(task, args, kwargs, durations=durations)
+            if not self.simulate:
+                print(plan.export(self.plan_format))
+                return
+        except Exception as exception:
+            logger = logging.getLogger(__name__)
+            logger.error(str(exception), exc_info=self.verbose)
+            sys.exit(1)
+        unknown = [node.name for node in plan.nodes
+                   if node.task not in durations]
+        if unknown:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                'No timing history for {count} calls (taken as 0s)'.
+                format(count=len(unknown)))
+        limit = settings.jobs
+        if self.jobs is None:
+            limit = os.cpu_count() or 1
+        counts = [1]
+        while counts[-1] * 2 < limit:
+            counts.append(counts[-1] * 2)
+        if limit > 1:
+            counts.append(limit)
+        template = '{0:>4}  {1:>12}  {2:>12}  {3:>7}'
+        lines = [template.format('Jobs', 'Makespan, s', 'Idle, s', 'Speedup')]
+        serial = None
+        for jobs in counts:
+            simulation = plan.simulate(jobs)
+            if serial is None:
+                serial = simulation.makespan
+            speedup = '-'
+            if simulation.makespan:
+                speedup = '{0:.2f}x'.format(serial / simulation.makespan)
+            lines.append(template.format(
+                jobs,
+                '{0:.4f}'.format(simulation.makespan),
+                '{0:.4f}'.format(simulation.idle),
+                speedup))
+        duration, names = plan.critical_path()
+        lines.append('')
+        lines.append('Critical path: {0:.4f}s'.format(duration))
+        lines.append('  ' + ' -> '.join(names))
+        print('\n'.join(lines))
+
+    def __stats(self, attribute):
+        try:
+            task = self.__module
+            if attribute is not None:
+                task = getattr(self.__module, attribute)
+            filepath = self.__module.Locate(settings.history_filename)
+            records = []
+            # History database is never created to be displayed
+            if os.path.exists(filepath):
+                records = History.get(filepath).stats(
+                    task.Qualname, limit=settings.history_limit)
+        except Exception as exception:
+            logger = logging.getLogger(__name__)
+            logger.error(str(exception), exc_info=self.verbose)
+            sys.exit(1)
+        width = max([len('Task')] +
+                    [len(record.qualname) for record in records])
+        template = '{0:<{width}}  {1:>6}  {2:>9}  {3:>9}  {4:>9}  {5:>6}'
+        lines = [template.format(
+            'Task', 'Count', 'p50, s', 'p95, s', 'Max, s', 'Trend',
+            width=width)]
+        for record in records:
+            lines.append(template.format(
+                record.qualname, record.count,
+                '{0:.4f}'.format(record.p50),
+                '{0:.4f}'.format(record.p95),
+                '{0:.4f}'.format(record.max),
+                record.format_trend(), width=width))
+        print('\n'.join(lines))
+
+    def __complete(self, prefix):
+        try:
+            names = self.__runfile.manifest.complete(prefix)
+        except Exception as exception:
+            logger = logging.getLogger(__name__)
+            logger.error(str(exception), exc_info=self.verbose)
+            sys.exit(1)
+        for name in names:
+            print(name)
+
+    def __describe(self, name, task):
+        # Fresh manifest lets to skip runfile importing. Otherwise
+        # it's dumped here for the next time (module's errors are
+        # reported by the regular path).
+        manifest = Manifest(self.filepath)
+        if not manifest.load():
+            try:
+                manifest = self.__runfile.manifest
+            except Exception:
+                return False
+        # Timing stats are read from the history by the module
+        if name == 'info' and os.path.exists(manifest.history):
+            return False
+        try:
+            result = getattr(manifest, name)(task)
+        except KeyError:
+            return False
+        print(result)
+        return True
+
+    def __serve(self):
+        # Requests are handled in forked children
+        # so they have to be not forwarded again
+        self.__serving = True
+        logger = logging.getLogger(__name__)
+        try:
+            self.__runfile.module
+            server = Server(
+                locate(self.__runfile.filepath),
+                runfile=self.__runfile,
+                handler=self.__handle)
+        except Exception as exception:
+            logger.error(str(exception), exc_info=self.verbose)
+            sys.exit(1)
+        logger.info(
+            'Serving "{filepath}" on "{address}"'.
+            format(filepath=self.__runfile.filepath,
+                   address=server.server_address))
+        signal.signal(signal.SIGTERM, lambda *args: sys.exit())
+        try:
+            server.serve_forever()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        finally:
+            server.server_close()
+
+    def __work(self):
+        # Calls are invoked in forked children
+        logger = logging.getLogger(__name__)
+        try:
+            self.__runfile.module
+            worker = Worker(
+                self.listen or settings.worker_listen,
+                runfile=self.__runfile)
+        except Exception as exception:
+            logger.error(str(exception), exc_info=self.verbose)
+            sys.exit(1)
+        logger.info(
+            'Working on "{filepath}" at "{address}"'.
+            format(filepath=self.__runfile.filepath,
+                   address=worker.address))
+        signal.signal(signal.SIGTERM, lambda *args: sys.exit())
+        try:
+            worker.serve_forever()
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        finally:
+            worker.server_close()
+
+    def __handle(self, argv):
+        sys.argv = argv
+        self()
+        return 0
+
+    def __forward(self):
+        client = Client(locate(self.filepath))
+        if client.connect():
+            status = client.execute(
+                sys.argv, env=dict(os.environ), cwd=os.getcwd())
+            sys.exit(status)
+
+    @property
+    def __profiling(self):
+        return self.profile or self.profile_output is not None
+
+    @contextmanager
+    def __profile(self):
+        # Phases are measured exclusively (nested phase
+        # time is not included to the outer phase time)
+        if not self.__profiling:
+            yield
+            return
+        profiler.enabled = True
+        collector = None
+        if self.profile_output is not None:
+            collector = cProfile.Profile()
+            if self.profile_output.endswith('.folded'):
+                collector = Sampler()
+            collector.enable()
+        try:
+            yield
+        finally:
+            if collector is not None:
+                collector.disable()
+                collector.dump_stats(self.profile_output)
+            phases = profiler.phases
+            names = sorted(phases, key=lambda name: (
+                self.__phases.index(name)
+                if name in self.__phases else len(self.__phases)))
+            rows = [(name,) + phases[name] for name in names]
+            rows.append(('total',
+                sum(wall for wall, _ in phases.values()),
+                sum(cpu for _, cpu in phases.values())))
+            self.__print_table(['Phase', 'Wall, s', 'CPU, s'], rows)
+
+    def __importtime(self):
+        # Interpreter is run again because
+        # most of the imports are already done
+        argv = [arg for arg in sys.argv[1:] if arg != '--importtime']
+        status, records = importtime(
+            ['-c', 'from run import program; program()',
+             '-s', 'daemon=False'] + argv)
+        records.sort(key=lambda record: record[1], reverse=True)
+        records = records[:settings.importtime_limit]
+        self.__print_table(['Module', 'Self, s', 'Cumulative, s'], records)
+        sys.exit(status)
+
+    def __print_table(self, header, rows):
+        width = max([len(header[0])] + [len(row[0]) for row in rows])
+        template = '{0:<{width}}  {1:>13}  {2:>13}'
+        lines = [template.format(*header, width=width)]
+        for name, first, second in rows:
+            lines.append(template.format(
+                name, '{0:.4f}'.format(first), '{0:.4f}'.format(second),
+                width=width))
+        print('\n'.join(lines), file=sys.stderr)
 
     def __update_settings(self):
         _, patch = parse(','.join(self.settings))
         for key, value in patch.items():
             setattr(settings, key, value)
+        if self.jobs is not None:
+            settings.jobs = int(self.jobs)
+        if self.keep_going:
+            settings.keep_going = True
+        if self.workers is not None:
+            settings.workers = self.workers.split(',')
+            settings.executor = 'cluster'
 
 
 program = Program(name='run')
@@ -0,0 +1,260 @@
+import os
+import ast
+import sys
+import time
+import inspect
+import logging
+import importlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from .helpers import load
+from .manifest import Manifest
+from .module import Module
+from .profiler import profiler
+from .settings import settings
+from .task import Task, ReloadEvent
+
+
+class Runfile:
+    """Runfile representation.
+
+    Runfile loads python module by filepath and builds it's main module.
+    Modification time of the runfile and local modules it imports
+    (from the runfile's directory) is tracked to rebuild main module
+    on changes. On rebuilding cached results (memo and var results)
+    of tasks whose classes' source has not been changed are restored
+    and :class:`.ReloadEvent` is notified. Results are restored only
+    in the process holding the runfile (daemon and watch modes call
+    tasks in forked children so there is nothing to restore).
+
+    Parameters
+    ----------
+    filepath: str
+        Runfile path.
+    """
+
+    # Public
+
+    def __init__(self, filepath):
+        self.__filepath = os.path.abspath(filepath)
+        self.__mtime = None
+        self.__imports = {}
+        self.__module = None
+        self.__sources = None
+        self.__timings = OrderedDict()
+
+    def __repr__(self):
+        return '<Runfile "{self.filepath}">'.format(self=self)
+
+    @property
+    def changed(self):
+        """Runfile's change status since last build.
+
+        Local modules imported by the runfile are taken into account.
+        """
+        if self.__mtime != self.__stat(self.filepath):
+            return True
+        return bool(self.__changed_imports)
+
+    @property
+    def filepath(self):
+        return self.__filepath
+
+    @property
+    def manifest(self):
+        """Runfile's manifest.
+
+        Fresh manifest is read without runfile importing.
+        Otherwise it's dumped after runfile building (it's the only
+        place where manifest is written because it builds all tasks).
+        """
+        manifest = Manifest(self.filepath)
+        if not manifest.load():
+            module = self.module
+            if not manifest.load():
+                manifest.dump(module)
+        return manifest
+
+    @property
+    def module(self):
+        """Runfile's main module (rebuilt if runfile has been changed).
+        """
+        if self.__module is None or self.changed:
+            self.reload()
+        return self.__module
+
+    def reload(self):
+        """Load runfile and build it's main module.
+
+        Runfile is executed into a fresh python module. If the main
+        module has been built before, cached results of tasks whose
+        module class and task class have not been changed are restored
+        (any change of runfile's module-level code or local imports
+        discards them). Changed local imports are reloaded first.
+        """
+        mtime = self.__stat(self.filepath)
+        with self.__measure('load'):
+            changed_imports = self.__changed_imports
+            for name in changed_imports:
+                importlib.reload(sys.modules[name])
+            module = load(
+                self.filepath,
+                validation=settings.bytecode_validation)
+            sources = self.__parse()
+            imports = self.__collect(module)
+        with self.__measure('build'):
+            previous = self.__module
+            self.__module = self.__build(module)
+            if previous is not None:
+                changed = self.__compare(self.__sources, sources)
+                if changed_imports:
+                    changed.add(None)
+                restored = []
+                if None not in changed:
+                    self.__restore(
+                        self.__module, previous, changed, restored)
+                else:
+                    changed = set(sources or {}) - {None}
+                event = ReloadEvent(self.__module,
+                    changed=sorted(changed), restored=sorted(restored))
+        self.__sources = sources
+        self.__imports = imports
+        self.__mtime = mtime
+        if previous is not None:
+            self.__module.Notify(event)
+
+    @property
+    def timings(self):
+        """Last reload's timings by phase in seconds.
+        """
+        return self.__timings
+
+    # Private
+
+    def __build(self, module):
+        for name in dir(module):
+            attr = getattr(module, name)
+            if not isinstance(attr, type):
+                continue
+            if not issubclass(attr, Module):
+                continue
+            if inspect.getmodule(attr) != module:
+                continue
+            return attr(Build=True)
+        raise RuntimeError('Module not found.')
+
+    @property
+    def __changed_imports(self):
+        names = []
+        for name, (filepath, mtime) in self.__imports.items():
+            if name in sys.modules and self.__stat(filepath) != mtime:
+                names.append(name)
+        return names
+
+    def __collect(self, module):
+        # Local modules imported by the runfile (recursively) by name.
+        # Run itself and installed packages are never reloaded.
+        dirpath = os.path.dirname(self.filepath)
+        package = __name__.split('.')[0]
+        imports = {}
+        pending = [module]
+        while pending:
+            for value in list(vars(pending.pop()).values()):
+                if inspect.ismodule(value):
+                    imported = value
+                elif inspect.isclass(value) or inspect.isfunction(value):
+                    imported = sys.modules.get(value.__module__)
+                else:
+                    continue
+                if imported is None or imported is module:
+                    continue
+                name = imported.__name__
+                if name in imports or name.split('.')[0] == package:
+                    continue
+                filepath = getattr(imported, '__file__', None)
+                if not filepath:
+                    continue
+                filepath = os.path.abspath(filepath)
+                parts = filepath.split(os.sep)
+                if (os.path.commonpath([dirpath, filepath]) != dirpath or
+                        'site-packages' in parts or 'dist-packages' in parts):
+                    continue
+                imports[name] = (filepath, self.__stat(filepath))
+                pending.append(imported)
+        return imports
+
+    def __compare(self, previous, sources):
+        # Names of changed classes (None is module-level code)
+        if previous is None or sources is None:
+            return {None}
+        changed = set()
+        for name in set(previous) | set(sources):
+            if previous.get(name) != sources.get(name):
+                changed.add(name)
+        return changed
+
+    def __is_changed(self, task, changed):
+        classes = list(type(task).mro())
+        if task.Module is not None:
+            classes += type(task.Module).mro()
+        for cls in classes:
+            if cls.__module__ == self.__module.__module__:
+                if cls.__qualname__.split('.')[0] in changed:
+                    return True
+        return False
+
+    @contextmanager
+    def __measure(self, phase):
+        start = time.perf_counter()
+        with profiler.phase(phase):
+            yield
+        self.__timings[phase] = time.perf_counter() - start
+        logger = logging.getLogger(__name__)
+        logger.debug(
+            'Runfile {phase} time: {time:.4f}s'.
+            format(phase=phase, time=self.__timings[phase]))
+
+    def __parse(self):
+        # Source of top-level classes by name and the rest under None
+        try:
+            with open(self.filepath, encoding='utf-8') as file:
+                source = file.read()
+            tree = ast.parse(source)
+        except (OSError, SyntaxError, ValueError):
+            return None
+        lines = source.splitlines(keepends=True)
+        sources = {}
+        rest = []
+        start = 0
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            lineno = min([node.lineno] +
+                [decorator.lineno for decorator in node.decorator_list])
+            rest += lines[start:lineno - 1]
+            sources[node.name] = ''.join(lines[lineno - 1:node.end_lineno])
+            start = node.end_lineno
+        rest += lines[start:]
+        sources[None] = ''.join(rest)
+        return sources
+
+    def __restore(self, module, previous, changed, restored):
+        # Only tasks built in the previous module could have cached
+        # results so only their counterparts are built
+        for name, task in list(vars(type(previous)).items()):
+            if not isinstance(task, Task):
+                continue
+            target = module.Lookup(name)
+            if type(target).__name__ != type(task).__name__:
+                continue
+            if isinstance(task, Module):
+                self.__restore(target, task, changed, restored)
+            elif not self.__is_changed(task, changed):
+                target.Restore(task)
+                restored.append(target.Qualname)
+
+    def __stat(self, filepath):
+        try:
+            return os.stat(filepath).st_mtime_ns
+        except OSError:
+            return None
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from .helpers import Settings
 
 
@@ -5,11 +7,59 @@ class Settings(Settings):
 
     # Main
 
+    bytecode_validation = 'timestamp'
     cache = True
-    chdir = True
+    cache_authkey = os.environ.get('RUN_CACHE_AUTHKEY')
+    cache_backend = 'run.task.cache.HTTPBackend'
+    cache_dirpath = os.path.join(
+        os.environ.get('XDG_CACHE_HOME',
+            os.path.join(os.path.expanduser('~'), '.cache')), 'run')
+    cache_env = []
+    cache_remote = None
+    cache_token = os.environ.get('RUN_CACHE_TOKEN')
+    chdir = False
+    executor = None
     fallback = None
     filename = 'runfile.py'
+    history_filename = os.path.join('.run', 'history.sqlite')
+    history_limit = 100
+    jobs = 1
+    keep_going = False
+    manifest = True
+    map_chunk_size = 8
+    map_jobs = 4
+    memoize_limit = 128
+    pipeline_queue_size = 64
     plain = False
+    processes = None
+    separator = '+'
+    state_filename = os.path.join('.run', 'state.sqlite')
+
+    # Cluster
+
+    worker_authkey = os.environ.get('RUN_WORKER_AUTHKEY')
+    worker_heartbeat = 1.0
+    worker_listen = '127.0.0.1:0'
+    worker_retries = 3
+    worker_timeout = 10.0
+    workers = []
+
+    # Daemon
+
+    daemon = False
+    daemon_dirpath = os.path.join(
+        os.environ.get('XDG_RUNTIME_DIR', tempfile.gettempdir()),
+        'run-{uid}'.format(uid=os.getuid()))
+
+    # Profile
+
+    importtime_limit = 30
+
+    # Watch
+
+    watch_debounce = 0.1
+    watch_ignore = ['.*', '__pycache__', '*.pyc']
+    watch_interval = 0.5
 
     # Converters
 
@@ -33,6 +83,7 @@ class Settings(Settings):
         'init': {'foreground': 'bright_yellow'},
         'fail': {'foreground': 'bright_red'},
         'done': {'foreground': 'bright_green'},
+        'skip': {'foreground': 'bright_black'},
         'module': {'foreground': 'bright_cyan'},
         'task': {'foreground': 'bright_blue'},
         'var': {'foreground': 'bright_magenta'},
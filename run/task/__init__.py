@@ -1,12 +1,22 @@
+from .cache import DiskCache, HTTPBackend
+from .cluster import Cluster, Worker
 from .convert import convert
 from .converter import task
+from .coroutine import CoroutineTask
 from .depend import depend
-from .exception import ConvertError
+from .describe import describe
+from .exception import ConvertError, MapError
 from .hide import hide
+from .history import History
 from .logger import Logger
+from .mapper import Mapper
+from .pipeline import Pipeline
+from .plan import Plan
 from .prototype import Prototype
+from .recorder import Recorder
 from .require import require
-from .event import Event, TaskEvent, CallTaskEvent
+from .event import Event, TaskEvent, CallTaskEvent, ReloadEvent
+from .session import Session
 from .skip import skip
 from .stylize import stylize
 from .task import Task
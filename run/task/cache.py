@@ -0,0 +1,447 @@
+import io
+import os
+import sys
+import hmac
+import pickle
+import hashlib
+import inspect
+import logging
+import threading
+import contextvars
+import urllib.error
+import urllib.request
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from ..helpers import import_object
+from ..settings import settings
+from .require import require
+
+
+class DiskCache:
+    """Content-addressed on-disk store of task results.
+
+    Entry (pickled result with captured stdout and stderr) is stored
+    by it's content digest and call key refers to the entry's digest
+    so equal entries are stored once.
+
+    Remote backend (like :class:`HTTPBackend`) is a shared second
+    tier: entries missing locally are downloaded from it (and stored
+    locally) and dumped entries are uploaded to it in background
+    threads (use :meth:`flush` to wait for uploads).
+
+    Downloaded entries are unpickled so remote entries are signed
+    by HMAC of the call key and the entry under the shared key and
+    entries with a wrong signature are misses (still anyone with
+    the key can store any entry so the key must be given only to
+    trusted hosts).
+
+    Parameters
+    ----------
+    dirpath: str
+        Store directory (created on demand).
+    remote: object
+        Remote backend with get(kind, digest) and
+        put(kind, digest, data) methods.
+    authkey: bytes
+        Key to sign remote entries (required if remote is set).
+    """
+
+    # Public
+
+    Entry = namedtuple('Entry', ['result', 'stdout', 'stderr'])
+
+    class Stats(namedtuple('Stats',
+            ['hits', 'remote_hits', 'misses', 'uploads', 'failures'])):
+        """Store's lookups and uploads counters.
+        """
+
+        # Public
+
+        def __str__(self):
+            lookups = self.hits + self.remote_hits + self.misses
+            rate = 0
+            if lookups:
+                rate = (self.hits + self.remote_hits) / lookups
+            return ('hits {hits}/{lookups} ({rate:.0%}), '
+                    'remote hits {self.remote_hits}, '
+                    'uploads {self.uploads}, failures {self.failures}'.
+                    format(self=self, hits=self.hits + self.remote_hits,
+                           lookups=lookups, rate=rate))
+
+    def __init__(self, dirpath, *, remote=None, authkey=None):
+        if remote is not None and authkey is None:
+            raise RuntimeError(
+                'Remote cache requires a key to sign entries '
+                '(set RUN_CACHE_AUTHKEY environment variable)')
+        self.__dirpath = os.path.abspath(dirpath)
+        self.__remote = remote
+        self.__authkey = authkey
+        self.__uploader = None
+        self.__uploads = set()
+        self.__counters = dict.fromkeys(self.Stats._fields, 0)
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        return '<DiskCache "{self.dirpath}">'.format(self=self)
+
+    @contextmanager
+    def capture(self):
+        """Capture stdout and stderr still writing them through.
+
+        Output is captured for the current context only (streams
+        are proxied while any capture is active) so concurrent
+        calls in other threads are not captured.
+        Context returns dict to be filled with
+        "stdout" and "stderr" keys on exit.
+        """
+        output = {}
+        buffers = {'stdout': io.StringIO(), 'stderr': io.StringIO()}
+        _Proxy.install()
+        token = _buffers.set(_buffers.get() + (buffers,))
+        try:
+            yield output
+        finally:
+            _buffers.reset(token)
+            _Proxy.uninstall()
+        output['stdout'] = buffers['stdout'].getvalue()
+        output['stderr'] = buffers['stderr'].getvalue()
+
+    @property
+    def dirpath(self):
+        return self.__dirpath
+
+    def dump(self, key, result, stdout='', stderr=''):
+        """Store call's result and output.
+
+        Returns
+        -------
+        bool
+            Storing status (False if result is not picklable).
+        """
+        try:
+            data = pickle.dumps((result, stdout, stderr))
+        except Exception as exception:
+            logger = logging.getLogger(__name__)
+            logger.debug(str(exception))
+            return False
+        digest = hashlib.sha256(data).hexdigest()
+        self.__write(self.__locate('objects', digest), data)
+        self.__write(self.__locate('keys', key), digest.encode('ascii'))
+        if self.remote is not None:
+            with self.__lock:
+                if self.__uploader is None:
+                    self.__uploader = ThreadPoolExecutor(
+                        max_workers=self.__upload_workers)
+                future = self.__uploader.submit(self.__upload, key, data)
+                self.__uploads.add(future)
+            future.add_done_callback(self.__uploads.discard)
+        return True
+
+    def flush(self):
+        """Wait for pending uploads.
+        """
+        with self.__lock:
+            uploads = list(self.__uploads)
+        wait(uploads)
+
+    @classmethod
+    def get(cls, dirpath, *, remote=None):
+        """Return shared store for the directory and remote url.
+
+        Remote backend is created from the url by
+        :attr:`settings.cache_backend` and entries are signed
+        by :attr:`settings.cache_authkey`.
+        """
+        dirpath = os.path.abspath(dirpath)
+        with cls.__stores_lock:
+            store = cls.__stores.get((dirpath, remote))
+            if store is None:
+                backend = None
+                authkey = None
+                if remote is not None:
+                    backend = import_object(settings.cache_backend)(remote)
+                    if settings.cache_authkey is not None:
+                        authkey = settings.cache_authkey.encode('utf-8')
+                store = cls(dirpath, remote=backend, authkey=authkey)
+                cls.__stores[(dirpath, remote)] = store
+            return store
+
+    def key(self, task, args=(), kwargs={}, *, environ=()):
+        """Return call's key or None if arguments are not picklable.
+
+        Key combines task's qualified name and source, arguments bound
+        through the task's signature, keys of required tasks and
+        values of the environment variables.
+        """
+        digest = hashlib.sha256()
+        try:
+            self.__update(digest, task, args, kwargs)
+        except Exception as exception:
+            logger = logging.getLogger(__name__)
+            logger.debug(str(exception))
+            return None
+        for name in sorted(environ):
+            digest.update(pickle.dumps((name, os.environ.get(name))))
+        return digest.hexdigest()
+
+    def load(self, key):
+        """Return stored :attr:`Entry` or None.
+        """
+        try:
+            with open(self.__locate('keys', key), 'rb') as file:
+                digest = file.read().decode('ascii')
+            with open(self.__locate('objects', digest), 'rb') as file:
+                entry = self.Entry(*pickle.load(file))
+            self.__count('hits')
+            return entry
+        except Exception:
+            pass
+        entry = None
+        if self.remote is not None:
+            entry = self.__download(key)
+        self.__count('remote_hits' if entry is not None else 'misses')
+        return entry
+
+    @property
+    def remote(self):
+        return self.__remote
+
+    @classmethod
+    def shared(cls):
+        """Return list of shared stores.
+        """
+        with cls.__stores_lock:
+            return list(cls.__stores.values())
+
+    @property
+    def stats(self):
+        """Store's :class:`Stats`.
+        """
+        with self.__lock:
+            return self.Stats(**self.__counters)
+
+    # Private
+
+    __stores = {}
+    __stores_lock = threading.Lock()
+    __upload_workers = 4
+
+    def __count(self, name):
+        with self.__lock:
+            self.__counters[name] += 1
+
+    def __download(self, key):
+        # Remote failures are misses
+        try:
+            digest = self.remote.get('keys', key)
+            if digest is None:
+                return None
+            digest = digest.decode('ascii')
+            signed = self.remote.get('objects', digest)
+            if (signed is None or
+                    hashlib.sha256(signed).hexdigest() != digest):
+                return None
+            signature = signed[:_SIGNATURE_SIZE]
+            data = signed[_SIGNATURE_SIZE:]
+            if not hmac.compare_digest(signature, self.__sign(key, data)):
+                raise ValueError('Entry "{key}" has a wrong signature'.
+                    format(key=key))
+            entry = self.Entry(*pickle.loads(data))
+        except Exception as exception:
+            logger = logging.getLogger(__name__)
+            logger.warning('Cache download failed: {exception}'.
+                format(exception=exception))
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        self.__write(self.__locate('objects', digest), data)
+        self.__write(self.__locate('keys', key), digest.encode('ascii'))
+        return entry
+
+    def __sign(self, key, data):
+        signature = hmac.new(self.__authkey, digestmod=hashlib.sha256)
+        signature.update(key.encode('ascii'))
+        signature.update(data)
+        return signature.digest()
+
+    def __upload(self, key, data):
+        # Object goes first so remote key never refers to missing object
+        signed = self.__sign(key, data) + data
+        digest = hashlib.sha256(signed).hexdigest()
+        try:
+            self.remote.put('objects', digest, signed)
+            self.remote.put('keys', key, digest.encode('ascii'))
+        except Exception as exception:
+            logger = logging.getLogger(__name__)
+            logger.warning('Cache upload failed: {exception}'.
+                format(exception=exception))
+            self.__count('failures')
+            return
+        self.__count('uploads')
+
+    def __locate(self, kind, digest):
+        return os.path.join(self.dirpath, kind, digest[:2], digest)
+
+    def __update(self, digest, task, args, kwargs):
+        arguments = []
+        bound = task.Bind(*args, **kwargs)
+        for name, value in bound.arguments.items():
+            kind = bound.signature.parameters[name].kind
+            if kind == inspect.Parameter.VAR_KEYWORD:
+                value = sorted(value.items())
+            arguments.append((name, value))
+        digest.update(pickle.dumps(
+            (task.Qualname, task.Source, arguments), protocol=4))
+        for dependency in task.Dependencies:
+            if isinstance(dependency, require):
+                predecessor = dependency.predecessor
+                if not hasattr(predecessor, 'Bind'):
+                    # Not a task (like var's value)
+                    digest.update(repr(predecessor).encode('utf-8'))
+                    continue
+                self.__update(digest, predecessor,
+                              dependency.args, dependency.kwargs)
+
+    def __write(self, path, data):
+        temppath = '{path}.{pid}.{thread}'.format(
+            path=path, pid=os.getpid(), thread=threading.get_ident())
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temppath, 'wb') as file:
+            file.write(data)
+        os.replace(temppath, path)
+
+
+class HTTPBackend:
+    """Remote cache backend speaking GET/PUT by digest over HTTP.
+
+    Data is stored at "{url}/{kind}/{digest}" where kind is "keys"
+    (call key to entry digest) or "objects" (entry digest to pickled
+    entry). Missing data is reported as 404. Use ``python -m
+    run.cache_server`` as a reference server. Requests carry
+    the token as "Authorization: Bearer {token}" header.
+
+    Parameters
+    ----------
+    url: str
+        Server url.
+    timeout: float
+        Request timeout in seconds.
+    token: str
+        Server's access token (:attr:`settings.cache_token` by default).
+    """
+
+    # Public
+
+    def __init__(self, url, *, timeout=10, token=None):
+        if token is None:
+            token = settings.cache_token
+        self.__url = url.rstrip('/')
+        self.__timeout = timeout
+        self.__token = token
+
+    def __repr__(self):
+        return '<HTTPBackend "{self.url}">'.format(self=self)
+
+    def get(self, kind, digest):
+        """Return data or None if there is no such data.
+        """
+        request = urllib.request.Request(
+            self.__locate(kind, digest), headers=self.__headers())
+        try:
+            with urllib.request.urlopen(
+                    request, timeout=self.__timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as exception:
+            if exception.code == 404:
+                return None
+            raise
+
+    def put(self, kind, digest, data):
+        """Store data.
+        """
+        headers = self.__headers()
+        headers['Content-Type'] = 'application/octet-stream'
+        request = urllib.request.Request(
+            self.__locate(kind, digest), data=data, method='PUT',
+            headers=headers)
+        with urllib.request.urlopen(request, timeout=self.__timeout):
+            pass
+
+    @property
+    def url(self):
+        return self.__url
+
+    # Private
+
+    def __headers(self):
+        if self.__token is None:
+            return {}
+        return {'Authorization': 'Bearer {token}'.format(token=self.__token)}
+
+    def __locate(self, kind, digest):
+        return '{url}/{kind}/{digest}'.format(
+            url=self.url, kind=kind, digest=digest)
+
+
+class _Proxy:
+
+    # Public
+
+    def __init__(self, name, stream):
+        self.__name = name
+        self.__stream = stream
+
+    def __getattr__(self, name):
+        return getattr(self.__stream, name)
+
+    @classmethod
+    def install(cls):
+        """Proxy sys.stdout and sys.stderr (if they are not proxied).
+        """
+        with cls.__lock:
+            for name in cls.__names:
+                stream = getattr(sys, name)
+                if not isinstance(stream, cls):
+                    setattr(sys, name, cls(name, stream))
+            cls.__count += 1
+
+    @property
+    def stream(self):
+        return self.__stream
+
+    @classmethod
+    def uninstall(cls):
+        """Restore proxied streams once there is no active capture.
+        """
+        with cls.__lock:
+            cls.__count -= 1
+            if cls.__count:
+                return
+            for name in cls.__names:
+                stream = getattr(sys, name)
+                if isinstance(stream, cls):
+                    setattr(sys, name, stream.stream)
+
+    def flush(self):
+        self.__stream.flush()
+
+    def write(self, string):
+        for buffers in _buffers.get():
+            buffers[self.__name].write(string)
+        return self.__stream.write(string)
+
+    # Private
+
+    __count = 0
+    __lock = threading.Lock()
+    __names = ['stdout', 'stderr']
+
+
+# Capture
+
+_buffers = contextvars.ContextVar('buffers', default=())
+
+
+# Signature
+
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
@@ -0,0 +1,426 @@
+import io
+import os
+import sys
+import hmac
+import pickle
+import socket
+import logging
+import secrets
+import ipaddress
+import threading
+from contextlib import redirect_stdout, redirect_stderr
+from socketserver import ForkingMixIn, TCPServer, BaseRequestHandler
+from ..basedir import basedir, path
+from ..daemon.locate import verify
+from ..daemon.protocol import HEADER, receive_exactly
+from ..settings import settings
+from .cache import DiskCache
+from .event import CallTaskEvent
+
+
+class Cluster:
+    """Coordinator invoking runfile's tasks on remote workers.
+
+    Workers load the same runfile so calls are shipped by task's
+    qualified name, arguments and base directory relative to the
+    main module. Call's result, events and output are sent back.
+    Every call is assigned to the live worker with the least calls
+    in flight (and the least calls assigned). Worker sends heartbeats
+    while invoking so a call is reassigned to another worker if the
+    connection is lost or there is no heartbeat for
+    :attr:`settings.worker_timeout` (the worker is not used again).
+    A call reassigned more than :attr:`settings.worker_retries` times
+    fails with RuntimeError.
+
+    Calls are pickled so coordinator and worker authenticate each
+    other with the shared key (see :func:`get_authkey`) by HMAC
+    challenges before any message is unpickled.
+
+    Parameters
+    ----------
+    module: :class:`.Module`
+        Runfile's main module.
+    addresses: list
+        Workers' "host:port" addresses.
+    """
+
+    # Public
+
+    def __init__(self, module, addresses):
+        self.__module = module
+        self.__addresses = list(addresses)
+        self.__loads = {address: 0 for address in self.__addresses}
+        self.__counts = {address: 0 for address in self.__addresses}
+        self.__dead = set()
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        return '<Cluster {addresses}>'.format(addresses=self.addresses)
+
+    @property
+    def addresses(self):
+        return self.__addresses
+
+    @property
+    def alive(self):
+        """Addresses of workers not considered dead.
+        """
+        with self.__lock:
+            return self.__alive()
+
+    @classmethod
+    def get(cls, module, addresses):
+        """Return shared cluster for the module and addresses.
+        """
+        key = (module, tuple(addresses))
+        with cls.__clusters_lock:
+            cluster = cls.__clusters.get(key)
+            if cluster is None:
+                cluster = cls(module, addresses)
+                cls.__clusters[key] = cluster
+            return cluster
+
+    def invoke(self, task, *args, **kwargs):
+        """Invoke task on a worker (reassigned if the worker dies).
+
+        Parameters
+        ----------
+        task: :class:`.Task`
+            Runfile's task to invoke.
+        args, kwargs
+            Arguments for task invokation.
+        """
+        request = {
+            'qualname': task.Qualname,
+            'dirpath': os.path.relpath(path(), self.__module.Locate()),
+            'args': args,
+            'kwargs': kwargs,
+        }
+        retries = 0
+        while True:
+            address = self.__acquire()
+            try:
+                response = self.__request(address, request)
+            except OSError as exception:
+                self.__release(address, dead=True)
+                if retries >= settings.worker_retries:
+                    raise RuntimeError(
+                        'Task "{task}" is reassigned {retries} times, '
+                        'last worker "{address}" is lost ({exception})'.
+                        format(task=task.Qualname or '[main]',
+                               retries=retries, address=address,
+                               exception=exception)) from exception
+                retries += 1
+                logger = logging.getLogger(__name__)
+                logger.warning(
+                    'Worker "{address}" is lost ({exception}), '
+                    'reassigning "{task}"'.format(
+                        address=address, exception=exception,
+                        task=task.Qualname or '[main]'))
+                continue
+            except BaseException:
+                self.__release(address)
+                raise
+            self.__release(address)
+            break
+        failed, result, events, stdout, stderr = response
+        sys.stdout.write(stdout)
+        sys.stderr.write(stderr)
+        for qualname, uid, state, args, kwargs, duration in events:
+            target = _lookup(self.__module, qualname)
+            target.Notify(CallTaskEvent(
+                target, uid=uid, state=state, args=args, kwargs=kwargs,
+                duration=duration))
+        if failed:
+            raise result
+        return result
+
+    # Private
+
+    __clusters = {}
+    __clusters_lock = threading.Lock()
+
+    def __acquire(self):
+        with self.__lock:
+            alive = self.__alive()
+            if not alive:
+                raise RuntimeError(
+                    'No live workers of {addresses}'.
+                    format(addresses=', '.join(self.addresses)))
+            # Ties are broken by the count of assigned calls
+            address = min(alive, key=lambda address: (
+                self.__loads[address], self.__counts[address]))
+            self.__loads[address] += 1
+            self.__counts[address] += 1
+            return address
+
+    def __alive(self):
+        return [address for address in self.__addresses
+                if address not in self.__dead]
+
+    def __release(self, address, dead=False):
+        with self.__lock:
+            self.__loads[address] -= 1
+            if dead:
+                self.__dead.add(address)
+
+    def __request(self, address, request):
+        sock = socket.create_connection(
+            parse_address(address), timeout=settings.worker_timeout)
+        with sock:
+            authkey = get_authkey()
+            answer_challenge(sock, authkey)
+            deliver_challenge(sock, authkey)
+            send_message(sock, request)
+            while True:
+                message = receive_message(sock)
+                if message[0] == 'result':
+                    return message[1:]
+
+
+class Worker(ForkingMixIn, TCPServer):
+    """Worker server invoking runfile's tasks for :class:`Cluster`.
+
+    Every call is handled in a forked child process so all calls
+    share runfile's main module built once in the worker process.
+    Not loopback address is listened only if
+    :attr:`settings.worker_authkey` is set.
+
+    Parameters
+    ----------
+    address: str
+        "host:port" address to listen (port 0 for a free port).
+    runfile: :class:`.Runfile`
+        Runfile to serve (rebuilt before call if changed).
+    """
+
+    # Public
+
+    allow_reuse_address = True
+
+    def __init__(self, address, *, runfile):
+        self.__runfile = runfile
+        super().__init__(parse_address(address), Handler)
+        host = self.server_address[0]
+        if (settings.worker_authkey is None and
+                not ipaddress.ip_address(host).is_loopback):
+            self.server_close()
+            raise RuntimeError(
+                'Worker listening on "{host}" requires '
+                'settings.worker_authkey'.format(host=host))
+
+    @property
+    def address(self):
+        """Listened "host:port" address.
+        """
+        return '{0}:{1}'.format(*self.server_address[:2])
+
+    @property
+    def runfile(self):
+        return self.__runfile
+
+    def process_request(self, request, client_address):
+        try:
+            self.runfile.module
+        except Exception as exception:
+            # Child will report the error to the coordinator
+            logger = logging.getLogger(__name__)
+            logger.error(str(exception))
+        super().process_request(request, client_address)
+
+
+class Handler(BaseRequestHandler):
+
+    # Public
+
+    def handle(self):
+        self.request.settimeout(settings.worker_timeout)
+        try:
+            authkey = get_authkey()
+            deliver_challenge(self.request, authkey)
+            answer_challenge(self.request, authkey)
+        except (OSError, RuntimeError) as exception:
+            logger = logging.getLogger(__name__)
+            logger.warning(
+                'Request of {address} is refused: {exception}'.format(
+                    address=self.client_address[0], exception=exception))
+            return
+        request = receive_message(self.request)
+        self.request.settimeout(None)
+        stopped = threading.Event()
+        thread = threading.Thread(
+            target=self.__beat, args=(stopped,), daemon=True)
+        thread.start()
+        try:
+            response = self.__invoke(**request)
+            # Child exits after response so cache uploads are waited
+            for store in DiskCache.shared():
+                store.flush()
+        finally:
+            stopped.set()
+            thread.join()
+        send_message(self.request, ('result',) + response)
+
+    # Private
+
+    def __beat(self, stopped):
+        # Coordinator considers worker dead without heartbeats
+        while not stopped.wait(settings.worker_heartbeat):
+            try:
+                send_message(self.request, ('heartbeat',))
+            except OSError:
+                return
+
+    def __invoke(self, qualname, dirpath, args, kwargs):
+        global _worker
+        _worker = True
+        events = []
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        try:
+            module = self.server.runfile.module
+            # Child invokes one task so it's safe to change directory
+            cwd = os.path.normpath(os.path.join(module.Locate(), dirpath))
+            os.chdir(cwd)
+            basedir.set(cwd)
+            module.Listeners[:] = [lambda event: _collect(event, events)]
+            task = _lookup(module, qualname)
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                result = (False, task.Invoke(*args, **kwargs))
+        except Exception as exception:
+            result = (True, exception)
+        try:
+            pickle.dumps(result[1])
+        except Exception:
+            result = (True, RuntimeError(repr(result[1])))
+        return result + (events, stdout.getvalue(), stderr.getvalue())
+
+
+def get_authkey():
+    """Return key shared by cluster's coordinator and workers.
+
+    It's :attr:`settings.worker_authkey` if it's set. Otherwise
+    the key is read from (or created in) the user's private
+    :attr:`settings.daemon_dirpath` so only the same user's
+    coordinator and workers on this host share it.
+    """
+    if settings.worker_authkey is not None:
+        return settings.worker_authkey.encode('utf-8')
+    dirpath = settings.daemon_dirpath
+    os.makedirs(dirpath, mode=0o700, exist_ok=True)
+    verify(dirpath)
+    filepath = os.path.join(dirpath, 'authkey')
+    try:
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(filepath, 'rb') as file:
+            return file.read()
+    with os.fdopen(fd, 'wb') as file:
+        authkey = secrets.token_hex(32).encode('ascii')
+        file.write(authkey)
+    return authkey
+
+
+def deliver_challenge(sock, authkey):
+    """Authenticate the peer by HMAC challenge (ConnectionError if failed).
+    """
+    challenge = secrets.token_bytes(_CHALLENGE_SIZE)
+    _send_bytes(sock, challenge)
+    response = _receive_bytes(sock, _DIGEST_SIZE)
+    if not hmac.compare_digest(response, _sign(authkey, challenge)):
+        _send_bytes(sock, _FAILURE)
+        raise ConnectionError('Authentication failed')
+    _send_bytes(sock, _WELCOME)
+
+
+def answer_challenge(sock, authkey):
+    """Authenticate to the peer by HMAC challenge (ConnectionError if failed).
+    """
+    challenge = _receive_bytes(sock, _CHALLENGE_SIZE)
+    _send_bytes(sock, _sign(authkey, challenge))
+    if _receive_bytes(sock, len(_WELCOME)) != _WELCOME:
+        raise ConnectionError('Authentication failed')
+
+
+def is_worker():
+    """Return True if it's called in cluster's worker.
+    """
+    return _worker
+
+
+def parse_address(address):
+    """Return (host, port) tuple for the "host:port" address.
+    """
+    host, separator, port = address.rpartition(':')
+    if not separator or not port.isdigit():
+        raise ValueError(
+            'Invalid address "{address}" (host:port expected)'.
+            format(address=address))
+    return (host or '127.0.0.1', int(port))
+
+
+def send_message(sock, message):
+    """Send pickled message to the socket.
+    """
+    _send_bytes(sock, pickle.dumps(message))
+
+
+def receive_message(sock):
+    """Receive pickled message from the socket (authenticated peer only).
+    """
+    size, = HEADER.unpack(receive_exactly(sock, HEADER.size))
+    return pickle.loads(receive_exactly(sock, size))
+
+
+# Authentication
+
+_CHALLENGE_SIZE = 32
+_DIGEST_SIZE = 32
+_WELCOME = b'#WELCOME#'
+_FAILURE = b'#FAILURE#'
+
+
+def _sign(authkey, challenge):
+    return hmac.new(authkey, challenge, 'sha256').digest()
+
+
+def _send_bytes(sock, data):
+    sock.sendall(HEADER.pack(len(data)) + data)
+
+
+def _receive_bytes(sock, limit):
+    # Not authenticated peer can't make us read much
+    size, = HEADER.unpack(receive_exactly(sock, HEADER.size))
+    if size > limit:
+        raise ConnectionError('Unexpected message')
+    return receive_exactly(sock, size)
+
+
+# Worker
+
+_worker = False
+
+
+def _lookup(module, qualname):
+    # Static lookup not to evaluate vars
+    if not qualname:
+        return module
+    task = module.Lookup(qualname)
+    if task is None:
+        raise AttributeError(
+            'Module "{module}" has no task "{qualname}".'.format(
+                module=module, qualname=qualname))
+    return task
+
+
+def _collect(event, events):
+    if not isinstance(event, CallTaskEvent):
+        return
+    args, kwargs = event.args, event.kwargs
+    try:
+        pickle.dumps((args, kwargs))
+    except Exception:
+        args = tuple(map(repr, args))
+        kwargs = {key: repr(value) for key, value in kwargs.items()}
+    events.append((event.task.Qualname, event.uid, event.state,
+                   args, kwargs, event.duration))
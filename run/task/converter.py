@@ -1,5 +1,6 @@
 import inspect
 from ..helpers import Function
+from .coroutine import CoroutineTask
 from .exception import ConvertError
 from .method import MethodTask
 from .prototype import Prototype
@@ -71,7 +72,10 @@ class task(Function):
         return False
 
     def make(self, obj):
-        prototype = MethodTask(obj, *self.args, **self.kwargs)
+        Class = MethodTask
+        if inspect.iscoroutinefunction(obj):
+            Class = CoroutineTask
+        prototype = Class(obj, *self.args, **self.kwargs)
         return prototype
 
     # Private
@@ -0,0 +1,40 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from .method import MethodTask
+
+
+class CoroutineTask(MethodTask):
+    """Task made from coroutine function (async def method).
+
+    Synchronous call runs task's :meth:`Acall` on a new event loop
+    so requires are awaited concurrently. If event loop is already
+    running in the calling thread it's run in another thread.
+    Mapped task or task with executor is dispatched like any other
+    task and every invocation runs the coroutine on its own loop.
+    """
+
+    # Public
+
+    def __call__(self, *args, **kwargs):
+        return self.__run(self.Acall(*args, **kwargs))
+
+    async def Ainvoke(self, *args, **kwargs):
+        if self.Map is not None or self.Executor:
+            return await super().Ainvoke(*args, **kwargs)
+        return await super().Invoke(*args, **kwargs)
+
+    def Invoke(self, *args, **kwargs):
+        return self.__run(super().Invoke(*args, **kwargs))
+
+    # Private
+
+    def __run(self, coroutine):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
+                context.run, asyncio.run, coroutine).result()
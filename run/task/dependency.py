@@ -1,3 +1,6 @@
+import asyncio
+import contextvars
+from functools import partial
 from abc import ABCMeta, abstractmethod
 from ..helpers import cachedproperty, pack
 from .convert import convert
@@ -42,6 +45,32 @@ class Dependency(metaclass=ABCMeta):
         converted_object.Depend(self)
         return converted_object
 
+    async def aresolve(self, fail=None):
+        """Resolve dependency asynchronously.
+
+        By default :meth:`resolve` is run in the default executor.
+
+        Parameters
+        ----------
+        fail: bool
+            Resolve status.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        await loop.run_in_executor(
+            None, partial(context.run, self.resolve, fail=fail))
+
+    async def ainvoke(self):
+        """Invoke predecessor asynchronously if it exists.
+        """
+        # Task is imported here to avoid circular imports
+        from .task import Task
+        predecessor = self.predecessor
+        if isinstance(predecessor, Task):
+            await Task.Acall(predecessor, *self.__args, **self.__kwargs)
+        elif predecessor is not None:
+            predecessor(*self.__args, **self.__kwargs)
+
     def bind(self, successor):
         """Bind dependency to the successor.
 
@@ -52,6 +81,14 @@ class Dependency(metaclass=ABCMeta):
         """
         self.__successor = successor
 
+    @property
+    def args(self):
+        return self.__args
+
+    @property
+    def kwargs(self):
+        return self.__kwargs
+
     @abstractmethod
     def resolve(self, fail=None):
         """Resolve dependency.
@@ -0,0 +1,27 @@
+def describe(task, stats=None):
+    """Return task information string.
+
+    Parameters
+    ----------
+    task: :class:`.Task`
+        Task to describe.
+    stats: :class:`.History.Stats`
+        Task's timing stats to include.
+    """
+    info = ''
+    info += task.Qualname
+    info += task.Signature
+    info += '\n---\n'
+    info += 'Type: ' + task.Type
+    info += '\n'
+    info += 'Dependencies: ' + str(task.Dependencies)
+    info += '\n'
+    info += 'Default arguments: ' + str(task.Args)
+    info += '\n'
+    info += 'Default keyword arguments: ' + str(task.Kwargs)
+    if stats is not None:
+        info += '\n'
+        info += 'Timings: ' + str(stats)
+    info += '\n---\n'
+    info += task.Docstring
+    return info
@@ -36,11 +36,17 @@ class CallTaskEvent(TaskEvent):
     uid: int
         Call unique identifier.
     state: str
-        Call state: INIT, DONE or FAIL.
+        Call state: INIT, DONE, FAIL, SKIP (up to date task)
+        or CACHE (result is taken from the memo or disk cache).
+        Every call is finished with DONE or FAIL and not invoked
+        call's SKIP or CACHE is notified just before it's DONE.
     args: tuple
         Call args.
     kwargs: dict
         Call kwargs.
+    duration: float
+        Invocation duration in seconds excluding dependencies
+        (None if task has not been invoked).
     """
 
     # Public
@@ -48,12 +54,16 @@ class CallTaskEvent(TaskEvent):
     INIT = 'init'
     DONE = 'done'
     FAIL = 'fail'
+    SKIP = 'skip'
+    CACHE = 'cache'
 
-    def __init__(self, task, *, uid, state, args=(), kwargs={}):
+    def __init__(self, task, *, uid, state, args=(), kwargs={},
+                 duration=None):
         self.__uid = uid
         self.__state = state
         self.__args = args
         self.__kwargs = kwargs
+        self.__duration = duration
         super().__init__(task)
 
     @property
@@ -71,3 +81,37 @@ class CallTaskEvent(TaskEvent):
     @property
     def kwargs(self):
         return self.__kwargs
+
+    @property
+    def duration(self):
+        return self.__duration
+
+
+class ReloadEvent(TaskEvent):
+    """Runfile reload event.
+
+    Parameters
+    ----------
+    task: :class:`.Module`
+        Rebuilt main module.
+    changed: list
+        Names of runfile's changed classes (all classes if
+        runfile's module-level code or local imports have been changed).
+    restored: list
+        Qualified names of tasks with restored cached results.
+    """
+
+    # Public
+
+    def __init__(self, task, *, changed, restored):
+        self.__changed = changed
+        self.__restored = restored
+        super().__init__(task)
+
+    @property
+    def changed(self):
+        return self.__changed
+
+    @property
+    def restored(self):
+        return self.__restored
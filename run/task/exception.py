@@ -3,3 +3,26 @@ class ConvertError(Exception):
     # Public
 
     pass
+
+
+class MapError(Exception):
+    """Error of the map with failed items (raised once all items are done).
+
+    Parameters
+    ----------
+    failures: list
+        List of :attr:`run.task.Mapper.Failure`.
+    count: int
+        Count of processed items.
+    """
+
+    # Public
+
+    def __init__(self, failures, count):
+        super().__init__(failures, count)
+        self.failures = failures
+        self.count = count
+
+    def __str__(self):
+        return '{failures} of {count} map items failed'.format(
+            failures=len(self.failures), count=self.count)
@@ -0,0 +1,153 @@
+import os
+import math
+import sqlite3
+import threading
+import statistics
+from collections import namedtuple
+
+
+class History:
+    """On-disk database of task calls timing history.
+
+    Every call is recorded with it's start time, duration, outcome
+    (call event's state), arguments digest and host name.
+
+    Parameters
+    ----------
+    filepath: str
+        Database path (directories are created on demand).
+    """
+
+    # Public
+
+    class Stats(namedtuple('Stats',
+            ['qualname', 'count', 'mean', 'p50', 'p95', 'max', 'trend'])):
+        """Timing stats of task's recent successful calls.
+
+        Trend is a relative change of the median duration of the
+        newer half of calls against the older one (None if there
+        are less than 4 calls).
+        """
+
+        # Public
+
+        def __str__(self):
+            return ('count {self.count}, p50 {self.p50:.3f}s, '
+                    'p95 {self.p95:.3f}s, max {self.max:.3f}s, '
+                    'trend {trend}'.format(
+                        self=self, trend=self.format_trend()))
+
+        def format_trend(self):
+            if self.trend is None:
+                return '-'
+            return '{trend:+.0%}'.format(trend=self.trend)
+
+    def __init__(self, filepath):
+        self.__filepath = os.path.abspath(filepath)
+        self.__connection = None
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        return '<History "{self.filepath}">'.format(self=self)
+
+    def dump(self, qualname, *, started, duration, state, digest, host):
+        """Record task call.
+        """
+        with self.__lock:
+            connection = self.__connect()
+            connection.execute(
+                'INSERT INTO calls VALUES (?, ?, ?, ?, ?, ?)',
+                (qualname, started, duration, state, digest, host))
+            connection.commit()
+
+    @property
+    def filepath(self):
+        return self.__filepath
+
+    @classmethod
+    def get(cls, filepath):
+        """Return shared history for the database path.
+        """
+        filepath = os.path.abspath(filepath)
+        with cls.__histories_lock:
+            history = cls.__histories.get(filepath)
+            if history is None:
+                history = cls(filepath)
+                cls.__histories[filepath] = history
+            return history
+
+    def stats(self, prefix='', *, limit=100, state='done'):
+        """Return list of :class:`Stats` sorted by qualified name.
+
+        Parameters
+        ----------
+        prefix: str
+            Task's qualified name (submodules' tasks are included).
+        limit: int
+            Count of the latest calls per task to take into account.
+        state: str
+            Outcome of calls to take into account.
+        """
+        result = []
+        with self.__lock:
+            connection = self.__connect()
+            qualnames = [row[0] for row in connection.execute(
+                'SELECT DISTINCT qualname FROM calls '
+                'WHERE state = ? ORDER BY qualname', (state,))]
+            for qualname in qualnames:
+                if prefix and qualname != prefix:
+                    if not qualname.startswith(prefix + '.'):
+                        continue
+                durations = [row[0] for row in connection.execute(
+                    'SELECT duration FROM calls '
+                    'WHERE qualname = ? AND state = ? '
+                    'ORDER BY started DESC LIMIT ?',
+                    (qualname, state, limit))]
+                result.append(self.__make_stats(qualname, durations))
+        return result
+
+    # Private
+
+    __histories = {}
+    __histories_lock = threading.Lock()
+
+    def __connect(self):
+        if self.__connection is None:
+            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            connection = sqlite3.connect(
+                self.filepath, check_same_thread=False)
+            # Calls are recorded one by one so commits have to be cheap
+            connection.executescript(
+                'PRAGMA journal_mode = WAL;'
+                'PRAGMA synchronous = NORMAL;'
+                'CREATE TABLE IF NOT EXISTS calls ('
+                ' qualname TEXT, started REAL, duration REAL,'
+                ' state TEXT, digest TEXT, host TEXT);'
+                'CREATE INDEX IF NOT EXISTS calls_qualname '
+                ' ON calls (qualname, started);')
+            self.__connection = connection
+        return self.__connection
+
+    def __make_stats(self, qualname, durations):
+        # Durations are ordered from the newest one
+        ordered = sorted(durations)
+        trend = None
+        if len(durations) >= 4:
+            half = len(durations) // 2
+            older = statistics.median(durations[-half:])
+            newer = statistics.median(durations[:half])
+            if older:
+                trend = newer / older - 1
+        return self.Stats(
+            qualname=qualname,
+            count=len(durations),
+            mean=statistics.mean(durations),
+            p50=self.__percentile(ordered, 0.50),
+            p95=self.__percentile(ordered, 0.95),
+            max=ordered[-1],
+            trend=trend)
+
+    def __percentile(self, ordered, rank):
+        # Nearest-rank method
+        index = max(math.ceil(rank * len(ordered)) - 1, 0)
+        return ordered[index]
@@ -1,4 +1,5 @@
 import logging
+import threading
 from ..helpers import pack
 from .event import CallTaskEvent
 from .stylize import stylize
@@ -8,17 +9,35 @@ class Logger:
 
     # Public
 
+    def __init__(self):
+        self.__outcomes = {}
+        self.__lock = threading.Lock()
+        self.__logger = logging.getLogger('task')
+
     def __call__(self, event):
-        logger = logging.getLogger('task')
+        logger = self.__logger
         if isinstance(event, CallTaskEvent):
+            # Not invoked call is logged with it's outcome
+            if event.state in [event.SKIP, event.CACHE]:
+                with self.__lock:
+                    self.__outcomes[event.uid] = event.state
+                return
             if event.state in [event.DONE, event.FAIL]:
+                with self.__lock:
+                    state = self.__outcomes.pop(event.uid, event.state)
                 if event.task.Hidden:
                     return
                 prefix = '[+] '
                 style = 'done'
-                if event.state == event.FAIL:
+                if state == event.FAIL:
                     prefix = '[-] '
                     style = 'fail'
+                if state == event.SKIP:
+                    prefix = '[=] '
+                    style = 'skip'
+                if state == event.CACHE:
+                    prefix = '[*] '
+                    style = 'skip'
                 message = ''
                 message += prefix
                 message += event.task.Qualname or '[main]'
@@ -28,3 +47,10 @@ class Logger:
 
     def __repr__(self):
         return '<Logger>'
+
+    def observes(self, task):
+        """Return True if task's calls are logged.
+        """
+        if task.Hidden:
+            return False
+        return self.__logger.isEnabledFor(logging.INFO)
@@ -0,0 +1,195 @@
+import queue
+import logging
+import threading
+import contextvars
+from itertools import islice
+from collections import deque, namedtuple
+from ..settings import settings
+from .exception import MapError
+
+
+class Mapper:
+    """Applier of the function to every item of an iterable.
+
+    Items are pulled lazily in chunks by worker threads so there are
+    at most ``jobs * chunk_size`` items in flight and the iterable is
+    never materialized. Worker which is out of items steals not started
+    items from the other workers' chunks so slow items don't hold
+    the rest. Item's failure is logged and recorded in :attr:`failures`
+    without aborting the map and :class:`.MapError` is raised once all
+    items are done. Dict item is passed as keyword arguments
+    and any other item as the first argument.
+
+    Parameters
+    ----------
+    function: callable
+        Function to apply (like task's executor dispatch).
+    items: iterable
+        Items to map the function over.
+    jobs: int
+        Count of worker threads (default :attr:`settings.map_jobs`).
+    chunk_size: int
+        Count of items pulled at once
+        (default :attr:`settings.map_chunk_size`).
+
+    Examples
+    --------
+    Usage example::
+
+      >>> mapper = Mapper(lambda item, power: item ** power, range(3))
+      >>> sorted(mapper(power=2))
+      [0, 1, 4]
+    """
+
+    # Public
+
+    Failure = namedtuple('Failure', ['item', 'exception'])
+
+    def __init__(self, function, items, *, jobs=None, chunk_size=None):
+        self.__function = function
+        self.__items = items
+        self.__jobs = jobs or settings.map_jobs
+        self.__chunk_size = chunk_size or settings.map_chunk_size
+        self.__count = 0
+        self.__failures = []
+
+    def __call__(self, *args, **kwargs):
+        """Return iterator of items' results in completion order.
+        """
+        return self.__run(args, kwargs)
+
+    def __repr__(self):
+        return '<Mapper {function!r}>'.format(function=self.__function)
+
+    @property
+    def count(self):
+        """Count of items processed by the last map.
+        """
+        return self.__count
+
+    @property
+    def failures(self):
+        """List of :attr:`Failure` of the last map.
+        """
+        return list(self.__failures)
+
+    # Private
+
+    def __run(self, args, kwargs):
+        source = _Source(self.__items, self.__chunk_size)
+        chunks = [deque() for _ in range(self.__jobs)]
+        results = queue.Queue(self.__jobs * self.__chunk_size)
+        stopped = threading.Event()
+        self.__count = 0
+        self.__failures = []
+        workers = []
+        for index in range(self.__jobs):
+            # Workers share the calling session and basedir
+            worker = threading.Thread(
+                target=contextvars.copy_context().run,
+                args=(self.__work, index, source, chunks, results, stopped,
+                      args, kwargs),
+                daemon=True)
+            worker.start()
+            workers.append(worker)
+        logger = logging.getLogger(__name__)
+        try:
+            finished = 0
+            while finished < len(workers):
+                kind, item, payload = results.get()
+                if kind == _END:
+                    finished += 1
+                    continue
+                if kind == _ERROR:
+                    raise payload
+                self.__count += 1
+                if kind == _FAILURE:
+                    self.__failures.append(self.Failure(item, payload))
+                    logger.warning(
+                        'Map item {item!r} failed: {exception!r}'.
+                        format(item=item, exception=payload))
+                    continue
+                yield payload
+        finally:
+            stopped.set()
+            for worker in workers:
+                worker.join()
+            logger.info(
+                'Map: {count} items, {failures} failed'.format(
+                    count=self.__count, failures=len(self.__failures)))
+        if self.__failures:
+            raise MapError(self.failures, self.__count)
+
+    def __work(self, index, source, chunks, results, stopped, args, kwargs):
+        try:
+            while not stopped.is_set():
+                try:
+                    item = chunks[index].popleft()
+                except IndexError:
+                    chunk = source.pull()
+                    if chunk:
+                        chunks[index].extend(chunk)
+                        continue
+                    try:
+                        item = self.__steal(index, chunks)
+                    except IndexError:
+                        break
+                try:
+                    result = (_RESULT, item, self.__apply(item, args, kwargs))
+                except Exception as exception:
+                    result = (_FAILURE, item, exception)
+                if not self.__put(results, result, stopped):
+                    break
+        except Exception as exception:
+            # Iterable's failure aborts the map
+            self.__put(results, (_ERROR, None, exception), stopped)
+        finally:
+            self.__put(results, (_END, None, None), stopped)
+
+    def __apply(self, item, args, kwargs):
+        if isinstance(item, dict):
+            return self.__function(*args, **dict(kwargs, **item))
+        return self.__function(item, *args, **kwargs)
+
+    def __steal(self, index, chunks):
+        # Items are stolen from the end of other workers' chunks
+        for offset in range(1, len(chunks)):
+            try:
+                return chunks[(index + offset) % len(chunks)].pop()
+            except IndexError:
+                pass
+        raise IndexError('No items to steal')
+
+    def __put(self, results, result, stopped):
+        while not stopped.is_set():
+            try:
+                results.put(result, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+
+class _Source:
+
+    # Public
+
+    def __init__(self, items, chunk_size):
+        self.__items = iter(items)
+        self.__chunk_size = chunk_size
+        self.__lock = threading.Lock()
+
+    def pull(self):
+        """Return next chunk of items (empty if exhausted).
+        """
+        with self.__lock:
+            return list(islice(self.__items, self.__chunk_size))
+
+
+# Messages
+
+_RESULT = 'result'
+_FAILURE = 'failure'
+_ERROR = 'error'
+_END = 'end'
+_POLL_INTERVAL = 0.1
@@ -0,0 +1,102 @@
+import pickle
+import inspect
+import threading
+from collections import OrderedDict
+
+
+class Memo:
+    """Thread-safe LRU memo of call results.
+
+    Examples
+    --------
+    Usage example::
+
+      >>> memo = Memo()
+      >>> memo.set('key', 'value', limit=1)
+      >>> memo.get('key')
+      (True, 'value')
+      >>> memo.get('other')
+      (False, None)
+      >>> memo.hits, memo.misses
+      (1, 1)
+    """
+
+    # Public
+
+    def __init__(self):
+        self.__results = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__results)
+
+    def forget(self):
+        """Forget all results (counters are kept).
+        """
+        with self.__lock:
+            self.__results.clear()
+
+    def get(self, key):
+        """Return (found, result) tuple for the key.
+        """
+        with self.__lock:
+            try:
+                result = self.__results[key]
+            except KeyError:
+                self.__misses += 1
+                return (False, None)
+            self.__results.move_to_end(key)
+            self.__hits += 1
+            return (True, result)
+
+    @property
+    def hits(self):
+        return self.__hits
+
+    @staticmethod
+    def key(bound):
+        """Return hashable key for the bound arguments or None.
+
+        Values are keyed with their types so equal values of
+        different types (like 1, 1.0 and True) have different keys.
+        """
+        arguments = []
+        for name, value in bound.arguments.items():
+            kind = bound.signature.parameters[name].kind
+            if kind == inspect.Parameter.VAR_KEYWORD:
+                value = tuple(sorted(value.items()))
+            arguments.append((name, value))
+        key = tuple(arguments)
+        try:
+            hash(key)
+        except TypeError:
+            # Pickle tells types apart itself
+            try:
+                return pickle.dumps(key)
+            except Exception:
+                return None
+        return _typed(key)
+
+    @property
+    def misses(self):
+        return self.__misses
+
+    def set(self, key, result, *, limit):
+        """Remember the result evicting least recently used ones.
+        """
+        with self.__lock:
+            self.__results[key] = result
+            self.__results.move_to_end(key)
+            while len(self.__results) > limit:
+                self.__results.popitem(last=False)
+
+
+def _typed(value):
+    # Hashable containers are typed recursively
+    if isinstance(value, tuple):
+        return (type(value), tuple(map(_typed, value)))
+    if isinstance(value, frozenset):
+        return (type(value), frozenset(map(_typed, value)))
+    return (type(value), value)
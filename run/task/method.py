@@ -10,6 +10,14 @@ class MethodTask(Task):
     def __init__(self, method):
         self.__method = method
 
+    def Bind(self, *args, **kwargs):
+        signature = inspect.signature(self.__method)
+        bound = signature.bind(self.Module, *args, **kwargs)
+        bound.apply_defaults()
+        # Module argument is not a part of the call
+        del bound.arguments[next(iter(signature.parameters))]
+        return bound
+
     @property
     def Docstring(self):
         return self.Inspect(
@@ -18,6 +26,13 @@ class MethodTask(Task):
     def Invoke(self, *args, **kwargs):
         return self.__method(self.Module, *args, **kwargs)
 
+    @property
+    def Source(self):
+        try:
+            return inspect.getsource(self.__method)
+        except (OSError, TypeError):
+            return ''
+
     @property
     def Signature(self):
         default = str(inspect.signature(self.__method))
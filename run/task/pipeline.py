@@ -0,0 +1,285 @@
+import time
+import queue
+import pickle
+import logging
+import threading
+import contextvars
+import multiprocessing
+from collections import namedtuple
+from collections.abc import Iterable
+from ..settings import settings
+from .task import Task
+
+
+class Pipeline(Task):
+    """Task streaming items through the chain of stage tasks.
+
+    The first stage is called with pipeline's arguments and every next
+    stage is called with an iterator of the previous stage's items.
+    Stages run concurrently on their own threads connected by bounded
+    queues (:attr:`QueueSize`) so fast stages wait for slow ones.
+    Stage with "process" executor runs in a forked process (it's
+    invoked directly and it's items have to be picklable).
+    Pipeline's result streams the last stage's items and stages'
+    stats are logged once the stream is finished.
+
+    Parameters
+    ----------
+    stages: str
+        Names of the stage tasks relative to the module.
+
+    Examples
+    --------
+    Usage example::
+
+      class Module(Module):
+
+          etl = Pipeline('extract', 'transform', 'load')
+
+          def extract(self):
+              yield from range(10)
+
+          def transform(self, items):
+              for item in items:
+                  yield item * 2
+
+          def load(self, items):
+              print(sum(items))
+    """
+
+    # Public
+
+    StageStats = namedtuple('StageStats',
+        ['name', 'items', 'duration', 'throughput', 'occupancy', 'capacity'])
+
+    def __init__(self, *stages):
+        self.__names = stages
+        self.__stats = []
+
+    def Invoke(self, *args, **kwargs):
+        return self.__run(args, kwargs)
+
+    @property
+    def QueueSize(self):
+        """Capacity of the queues between stages.
+        """
+        return self.Inspect(
+            'QueueSize', default=settings.pipeline_queue_size)
+
+    @property
+    def Stages(self):
+        """Pipeline's stage tasks.
+        """
+        stages = []
+        for name in self.__names:
+            stage = name
+            if isinstance(name, str):
+                stage = getattr(self.Module, name)
+            stages.append(stage)
+        return stages
+
+    @property
+    def Stats(self):
+        """List of :attr:`StageStats` of the last finished stream.
+
+        Throughput is stage's items per second and occupancy is
+        an average count of items in stage's output queue.
+        """
+        return list(self.__stats)
+
+    # Private
+
+    def __run(self, args, kwargs):
+        stages = self.Stages
+        processes = [getattr(stage, 'Executor', None) == 'process'
+                     for stage in stages]
+        context = multiprocessing.get_context('fork')
+        stopped = threading.Event()
+        stats = {}
+        reports = None
+        if any(processes):
+            stopped = context.Event()
+            reports = context.SimpleQueue()
+        # Stage's output queue is shared with the next stage's process
+        channels = []
+        for index in range(len(stages)):
+            if any(processes[index:index + 2]):
+                channel = _Channel(context.Queue(self.QueueSize), stopped)
+            else:
+                channel = _Channel(queue.Queue(self.QueueSize), stopped)
+            channels.append(channel)
+        workers = []
+        for index in sorted(range(len(stages)),
+                            key=lambda index: not processes[index]):
+            # Processes are forked before any stage thread is started
+            runner = _Runner(
+                index, stages[index],
+                channels[index - 1] if index else None, channels[index],
+                args=args, kwargs=kwargs, process=processes[index],
+                stats=reports if processes[index] else stats)
+            if processes[index]:
+                worker = context.Process(target=runner, daemon=True)
+            else:
+                # Thread stages share the calling session and basedir
+                worker = threading.Thread(
+                    target=contextvars.copy_context().run,
+                    args=(runner,), daemon=True)
+            worker.start()
+            workers.append(worker)
+        try:
+            yield from channels[-1]
+        finally:
+            stopped.set()
+            for worker in workers:
+                worker.join()
+            while reports is not None and not reports.empty():
+                index, record = reports.get()
+                stats[index] = record
+            self.__stats = []
+            for index, stage in enumerate(stages):
+                items, duration, occupancy = stats.get(index, (0, 0, 0))
+                self.__stats.append(self.StageStats(
+                    name=getattr(stage, 'Qualname', repr(stage)),
+                    items=items,
+                    duration=duration,
+                    throughput=items / duration if duration else 0,
+                    occupancy=occupancy,
+                    capacity=self.QueueSize))
+            self.__report()
+
+    def __report(self):
+        logger = logging.getLogger(__name__)
+        for stats in self.__stats:
+            logger.info(
+                'Pipeline stage "{stats.name}": {stats.items} items, '
+                '{stats.throughput:.1f} items/s, queue occupancy '
+                '{stats.occupancy:.1f}/{stats.capacity}'.
+                format(stats=stats))
+
+
+class _Channel:
+
+    # Public
+
+    def __init__(self, queue, stopped):
+        self.__queue = queue
+        self.__stopped = stopped
+
+    def __iter__(self):
+        while True:
+            message = self.get()
+            if message is None or message[0] == _END:
+                return
+            if message[0] == _ERROR:
+                raise message[1]
+            yield message[1]
+
+    def close(self):
+        # Process exit flushes buffered items unless
+        # the pipeline is stopped (nobody consumes them)
+        cancel = getattr(self.__queue, 'cancel_join_thread', None)
+        if cancel is not None and self.__stopped.is_set():
+            cancel()
+
+    def get(self):
+        """Return message or None if pipeline is stopped.
+        """
+        while True:
+            try:
+                return self.__queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if self.__stopped.is_set():
+                    return None
+
+    def put(self, message):
+        """Put message waiting for free space (False if stopped).
+        """
+        while not self.__stopped.is_set():
+            try:
+                self.__queue.put(message, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    @property
+    def size(self):
+        try:
+            return self.__queue.qsize()
+        except NotImplementedError:
+            return 0
+
+
+class _Runner:
+
+    # Public
+
+    def __init__(self, index, stage, upstream, downstream,
+                 *, args, kwargs, process, stats):
+        self.__index = index
+        self.__stage = stage
+        self.__upstream = upstream
+        self.__downstream = downstream
+        self.__args = args
+        self.__kwargs = kwargs
+        self.__process = process
+        self.__stats = stats
+
+    def __call__(self):
+        started = time.perf_counter()
+        items = 0
+        occupancy = 0
+        try:
+            args, kwargs = self.__args, self.__kwargs
+            if self.__upstream is not None:
+                args, kwargs = (iter(self.__upstream),), {}
+            for item in self.__iterate(self.__invoke(*args, **kwargs)):
+                occupancy += self.__downstream.size
+                if not self.__downstream.put((_ITEM, item)):
+                    break
+                items += 1
+            else:
+                self.__downstream.put((_END, None))
+        except Exception as exception:
+            self.__downstream.put((_ERROR, self.__pack(exception)))
+        finally:
+            record = (items, time.perf_counter() - started,
+                      occupancy / items if items else 0)
+            if self.__process:
+                self.__downstream.close()
+                self.__stats.put((self.__index, record))
+            else:
+                self.__stats[self.__index] = record
+
+    # Private
+
+    def __invoke(self, *args, **kwargs):
+        # Process stage is invoked directly like by process executor
+        if self.__process:
+            return self.__stage.Invoke(*args, **kwargs)
+        return self.__stage(*args, **kwargs)
+
+    def __iterate(self, result):
+        if result is None:
+            return iter(())
+        if (isinstance(result, Iterable) and
+                not isinstance(result, (str, bytes, bytearray, dict))):
+            return iter(result)
+        return iter([result])
+
+    def __pack(self, exception):
+        if not self.__process:
+            return exception
+        try:
+            pickle.dumps(exception)
+        except Exception:
+            return RuntimeError(repr(exception))
+        return exception
+
+
+# Messages
+
+_ITEM = 'item'
+_END = 'end'
+_ERROR = 'error'
+_POLL_INTERVAL = 0.1
@@ -0,0 +1,217 @@
+import json
+import heapq
+from collections import OrderedDict, deque, namedtuple
+from ..helpers import cachedproperty, pack
+from .require import require
+from .trigger import trigger
+
+
+class Plan:
+    """Task's call graph expanded without executing anything.
+
+    Every node is a call (task and arguments) with requires to be
+    resolved before the call and triggers called after it. Node's
+    duration is taken from the durations mapping (usually average
+    durations from the timing history). Calls are deduplicated by
+    task and arguments like requires resolved in a session.
+
+    Parameters
+    ----------
+    task: :class:`.Task`
+        Task to plan call of.
+    args, kwargs
+        Arguments for task calling.
+    durations: dict
+        Durations in seconds by task's qualified name
+        (missing durations are taken as 0).
+    """
+
+    # Public
+
+    Node = namedtuple('Node',
+        ['name', 'task', 'duration', 'requires', 'triggers'])
+
+    Simulation = namedtuple('Simulation',
+        ['jobs', 'makespan', 'idle'])
+
+    def __init__(self, task, args=(), kwargs={}, *, durations={}):
+        self.__durations = durations
+        self.__nodes = OrderedDict()
+        self.__root = self.__expand(task, args, kwargs)
+
+    def __repr__(self):
+        return '<Plan "{self.root}">'.format(self=self)
+
+    def critical_path(self):
+        """Return (duration, names) of the longest chain of calls.
+        """
+        finishes = {}
+        previous = {}
+        for name in self.__order:
+            prerequisite = max(self.__prerequisites[name],
+                               key=finishes.get, default=None)
+            start = 0
+            if prerequisite is not None:
+                start = finishes[prerequisite]
+                previous[name] = prerequisite
+            finishes[name] = start + self.__nodes[name].duration
+        name = max(self.__order, key=finishes.get)
+        names = [name]
+        while names[-1] in previous:
+            names.append(previous[names[-1]])
+        return (finishes[name], list(reversed(names)))
+
+    def export(self, format='json'):
+        """Return plan as "json" or "dot" (Graphviz) string.
+        """
+        if format == 'json':
+            return json.dumps({
+                'root': self.root,
+                'nodes': [node._asdict() for node in self.nodes],
+            }, indent=2)
+        if format == 'dot':
+            lines = ['digraph plan {']
+            for node in self.nodes:
+                lines.append('  {name} [label="{label}\\n{duration:.3f}s"];'.
+                    format(name=json.dumps(node.name),
+                           label=self.__escape(node.name),
+                           duration=node.duration))
+            for node in self.nodes:
+                for name in node.requires:
+                    lines.append('  {0} -> {1};'.format(
+                        json.dumps(name), json.dumps(node.name)))
+                for name in node.triggers:
+                    lines.append('  {0} -> {1} [style=dashed];'.format(
+                        json.dumps(node.name), json.dumps(name)))
+            lines.append('}')
+            return '\n'.join(lines)
+        raise ValueError(
+            'Unsupported format "{format}"'.format(format=format))
+
+    @property
+    def nodes(self):
+        """List of plan's :class:`Node` objects.
+        """
+        return list(self.__nodes.values())
+
+    @property
+    def root(self):
+        """Name of the planned call node.
+        """
+        return self.__root
+
+    def simulate(self, jobs):
+        """Replay the plan through a scheduler with jobs workers.
+
+        Ready calls are started in the order they become
+        ready (like :class:`.Resolver` does) as soon as
+        there is an idle worker.
+
+        Returns
+        -------
+        :attr:`Simulation`
+            Predicted makespan and workers' idle time in seconds.
+        """
+        jobs = max(int(jobs), 1)
+        waiting = {}
+        dependents = {name: [] for name in self.__order}
+        for name in self.__order:
+            waiting[name] = set(self.__prerequisites[name])
+            for prerequisite in waiting[name]:
+                dependents[prerequisite].append(name)
+        ready = deque(name for name in self.__order if not waiting[name])
+        running = []
+        time = 0
+        busy = 0
+        while ready or running:
+            while ready and len(running) < jobs:
+                name = ready.popleft()
+                duration = self.__nodes[name].duration
+                busy += duration
+                heapq.heappush(running, (time + duration, name))
+            time, name = heapq.heappop(running)
+            for dependent in dependents[name]:
+                waiting[dependent].discard(name)
+                if not waiting[dependent]:
+                    ready.append(dependent)
+        return self.Simulation(
+            jobs=jobs, makespan=time, idle=jobs * time - busy)
+
+    # Private
+
+    def __expand(self, task, args, kwargs, path=()):
+        name = getattr(task, 'Qualname', repr(task)) + pack(*args, **kwargs)
+        if name in path:
+            raise RuntimeError(
+                'Dependency cycle for "{name}"'.format(name=name))
+        if name in self.__nodes:
+            return name
+        requires = []
+        triggers = []
+        for dependency in getattr(task, 'Dependencies', []):
+            if isinstance(dependency, require):
+                children = requires
+            elif isinstance(dependency, trigger):
+                children = triggers
+            else:
+                continue
+            if dependency.predecessor is not None:
+                children.append(self.__expand(
+                    dependency.predecessor,
+                    dependency.args, dependency.kwargs, path + (name,)))
+        qualname = getattr(task, 'Qualname', None)
+        self.__nodes[name] = self.Node(
+            name=name,
+            task=qualname,
+            duration=self.__durations.get(qualname, 0),
+            requires=requires,
+            triggers=triggers)
+        return name
+
+    def __escape(self, string):
+        return json.dumps(string)[1:-1]
+
+    @cachedproperty
+    def __order(self):
+        # Prerequisites precede calls (graph is acyclic after expanding)
+        order = []
+        visited = set()
+        stack = [(name, False) for name in reversed(self.__nodes)]
+        while stack:
+            name, expanded = stack.pop()
+            if expanded:
+                order.append(name)
+                continue
+            if name in visited:
+                continue
+            visited.add(name)
+            stack.append((name, True))
+            for prerequisite in reversed(self.__prerequisites[name]):
+                if prerequisite not in visited:
+                    stack.append((prerequisite, False))
+        return order
+
+    @cachedproperty
+    def __prerequisites(self):
+        # Call waits for it's requires (including their triggers
+        # called inside them) and trigger waits for it's successor
+        triggered = {}
+        for name in self.__nodes:
+            triggered[name] = self.__collect_triggers(name, [])
+        result = {name: [] for name in self.__nodes}
+        for node in self.__nodes.values():
+            for name in node.triggers:
+                if node.name not in result[name]:
+                    result[name].append(node.name)
+            for name in node.requires:
+                for prerequisite in [name] + triggered[name]:
+                    if prerequisite not in result[node.name]:
+                        result[node.name].append(prerequisite)
+        return result
+
+    def __collect_triggers(self, name, result):
+        for trigger_name in self.__nodes[name].triggers:
+            if trigger_name not in result:
+                result.append(trigger_name)
+                self.__collect_triggers(trigger_name, result)
+        return result
@@ -0,0 +1,146 @@
+import os
+import sys
+import pickle
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from ..basedir import basedir, path
+from .event import CallTaskEvent
+
+
+class ProcessPool:
+    """Pool of warm worker processes invoking runfile's tasks.
+
+    Every worker loads the runfile once and looks tasks up
+    by qualified name so dynamically spawned modules are never
+    pickled (only call arguments and results are). Call events
+    of tasks called in worker are notified in the parent process
+    after invocation.
+
+    Parameters
+    ----------
+    module: :class:`.Module`
+        Runfile's main module.
+    workers: int
+        Count of worker processes (default CPU count).
+    """
+
+    # Public
+
+    def __init__(self, module, *, workers=None):
+        self.__module = module
+        self.__executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_initiate,
+            initargs=(self.filepath,))
+
+    def __repr__(self):
+        return '<ProcessPool "{self.filepath}">'.format(self=self)
+
+    @classmethod
+    def get(cls, module, *, workers=None):
+        """Return shared pool for the module's runfile.
+        """
+        with cls.__pools_lock:
+            pool = cls.__pools.get(module)
+            if pool is None:
+                pool = cls(module, workers=workers)
+                cls.__pools[module] = pool
+            return pool
+
+    @property
+    def filepath(self):
+        """Runfile's path.
+        """
+        return sys.modules[type(self.__module).__module__].__file__
+
+    def invoke(self, task, *args, **kwargs):
+        """Invoke task in worker process.
+
+        Parameters
+        ----------
+        task: :class:`.Task`
+            Runfile's task to invoke.
+        args, kwargs
+            Arguments for task invokation.
+        """
+        future = self.__executor.submit(
+            _invoke, task.Qualname, path(), args, kwargs)
+        failed, result, events = future.result()
+        for qualname, uid, state, args, kwargs, duration in events:
+            target = _lookup(self.__module, qualname)
+            target.Notify(CallTaskEvent(
+                target, uid=uid, state=state, args=args, kwargs=kwargs,
+                duration=duration))
+        if failed:
+            raise result
+        return result
+
+    def shutdown(self):
+        """Shutdown worker processes.
+        """
+        self.__executor.shutdown()
+
+    # Private
+
+    __pools = {}
+    __pools_lock = threading.Lock()
+
+
+def is_worker():
+    """Return True if it's called in worker process.
+    """
+    return _module is not None
+
+
+# Worker
+
+_module = None
+_events = []
+
+
+def _initiate(filepath):
+    # Runfile is imported here to avoid circular imports
+    from ..runfile import Runfile
+    global _module
+    _module = Runfile(filepath).module
+    # Events are forwarded to the parent instead of logging
+    _module.Listeners[:] = [_collect]
+
+
+def _collect(event):
+    if not isinstance(event, CallTaskEvent):
+        return
+    args, kwargs = event.args, event.kwargs
+    try:
+        pickle.dumps((args, kwargs))
+    except Exception:
+        args = tuple(map(repr, args))
+        kwargs = {key: repr(value) for key, value in kwargs.items()}
+    _events.append((event.task.Qualname, event.uid, event.state,
+                    args, kwargs, event.duration))
+
+
+def _lookup(module, qualname):
+    # Static lookup not to evaluate vars
+    if not qualname:
+        return module
+    task = module.Lookup(qualname)
+    if task is None:
+        raise AttributeError(
+            'Module "{module}" has no task "{qualname}".'.format(
+                module=module, qualname=qualname))
+    return task
+
+
+def _invoke(qualname, cwd, args, kwargs):
+    # Worker invokes one task at once so it's safe to change directory
+    del _events[:]
+    os.chdir(cwd)
+    basedir.set(cwd)
+    task = _lookup(_module, qualname)
+    try:
+        return (False, task.Invoke(*args, **kwargs), list(_events))
+    except Exception as exception:
+        return (True, exception, list(_events))
@@ -0,0 +1,67 @@
+import socket
+import hashlib
+import threading
+from ..helpers import pack
+from ..settings import settings
+from .event import CallTaskEvent
+from .history import History
+
+
+class Recorder:
+    """Listener recording task calls into the timing history.
+
+    History database is located by :attr:`settings.history_filename`
+    relative to the main module. Call duration is the invocation
+    duration excluding dependencies (for calls without invocation
+    like SKIP it's measured between INIT and the final event). Not
+    invoked call is recorded with it's SKIP or CACHE state.
+
+    Examples
+    --------
+    Usage example (in settings)::
+
+      listeners = [
+          'run.Logger',
+          'run.Recorder',
+      ]
+    """
+
+    # Public
+
+    def __init__(self):
+        self.__calls = {}
+        self.__lock = threading.Lock()
+        self.__host = socket.gethostname()
+
+    def __call__(self, event):
+        if not isinstance(event, CallTaskEvent):
+            return
+        with self.__lock:
+            if event.state == event.INIT:
+                self.__calls[event.uid] = [event.time, None]
+                return
+            if event.state in [event.SKIP, event.CACHE]:
+                if event.uid in self.__calls:
+                    self.__calls[event.uid][1] = event.state
+                return
+            if event.state not in [event.DONE, event.FAIL]:
+                return
+            started, state = self.__calls.pop(event.uid, [None, None])
+        if started is None:
+            return
+        duration = event.duration
+        if duration is None:
+            duration = event.time - started
+        arguments = pack(*event.args, **event.kwargs)
+        history = History.get(
+            event.task.Main.Locate(settings.history_filename))
+        history.dump(
+            event.task.Qualname,
+            started=started,
+            duration=duration,
+            state=state or event.state,
+            digest=hashlib.sha1(arguments.encode('utf-8')).hexdigest(),
+            host=self.__host)
+
+    def __repr__(self):
+        return '<Recorder>'
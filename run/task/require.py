@@ -1,4 +1,6 @@
+from ..helpers import pack
 from .dependency import Dependency
+from .session import Session
 
 
 class require(Dependency):
@@ -17,16 +19,25 @@ class require(Dependency):
     Notes
     -----
     It's a shortcut for :class:`run.dependency.depend` decorator.
+    Predecessor called with the same arguments is resolved only once
+    per :class:`.Session` even if it's required by many tasks
+    (also from different threads).
     """
 
     # Public
 
-    def __init__(self, __target, *args, **kwargs):
-        self.__is_resolved = False
-        super().__init__(__target, *args, **kwargs)
+    async def aresolve(self, fail=None):
+        if fail is None:
+            with Session.enter() as session:
+                await session.aresolve(self.key, self.ainvoke)
+
+    @property
+    def key(self):
+        """Resolution key (predecessor and call arguments).
+        """
+        return (self.predecessor, pack(*self.args, **self.kwargs))
 
     def resolve(self, fail=None):
         if fail is None:
-            if not self.__is_resolved:
-                self.invoke()
-                self.__is_resolved = True
+            with Session.enter() as session:
+                session.resolve(self.key, self.invoke)
@@ -0,0 +1,119 @@
+import threading
+import contextvars
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from .require import require
+
+
+class Resolver:
+    """Resolver of require dependencies graph running calls concurrently.
+
+    Transitive require dependencies are expanded into a graph keyed
+    by predecessor and call arguments. Every predecessor is called
+    once all of its requires are resolved so independent requires
+    run concurrently. Requires resolved in resolver's worker are
+    resolved serially (nested graphs don't multiply workers).
+    Workers run in copies of the calling context so they share
+    the calling :class:`.Session`.
+
+    Parameters
+    ----------
+    jobs: int
+        Count of predecessor calls running concurrently.
+    keep_going: bool
+        Keep calling predecessors not depending on failed ones
+        (by default no new calls are started after the first failure).
+    """
+
+    # Public
+
+    def __init__(self, *, jobs, keep_going=False):
+        self.__jobs = max(int(jobs), 1)
+        self.__keep_going = keep_going
+
+    def __call__(self, dependencies):
+        """Resolve require dependencies (other dependencies are skipped).
+
+        The first predecessor's exception is raised after
+        all started calls are finished.
+
+        Parameters
+        ----------
+        dependencies: list
+            List of :class:`.Dependency` objects.
+        """
+        requires = [dependency for dependency in dependencies
+                    if isinstance(dependency, require)]
+        if self.__jobs == 1 or getattr(self.__local, 'worker', False):
+            for dependency in requires:
+                dependency.resolve()
+            return
+        nodes = OrderedDict()
+        for dependency in requires:
+            self.__expand(dependency, nodes)
+        self.__run(nodes)
+
+    # Private
+
+    __local = threading.local()
+
+    def __expand(self, dependency, nodes, path=()):
+        key = dependency.key
+        if key in path:
+            raise RuntimeError(
+                'Dependency cycle for "{dependency}"'.
+                format(dependency=dependency))
+        if key not in nodes:
+            keys = []
+            predecessor = dependency.predecessor
+            for child in getattr(predecessor, 'Dependencies', []):
+                if isinstance(child, require):
+                    keys.append(
+                        self.__expand(child, nodes, path + (key,)))
+            nodes[key] = (dependency, keys)
+        return key
+
+    def __run(self, nodes):
+        # Calls are submitted only to idle workers so
+        # no queued call is started after the first failure
+        waiting = {key: set(keys) for key, (_, keys) in nodes.items()}
+        dependents = {key: [] for key in nodes}
+        for key, (_, keys) in nodes.items():
+            for child in keys:
+                dependents[child].append(key)
+        ready = deque(key for key in nodes if not waiting[key])
+        errors = []
+        futures = {}
+        with ThreadPoolExecutor(max_workers=self.__jobs) as executor:
+            while ready or futures:
+                while ready and len(futures) < self.__jobs:
+                    if errors and not self.__keep_going:
+                        break
+                    key = ready.popleft()
+                    futures[self.__submit(executor, nodes[key][0])] = key
+                if not futures:
+                    break
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = futures.pop(future)
+                    if future.exception() is not None:
+                        # Dependents of the failed call are never ready
+                        errors.append(future.exception())
+                        continue
+                    for parent in dependents[key]:
+                        waiting[parent].discard(key)
+                        if not waiting[parent]:
+                            ready.append(parent)
+        if errors:
+            raise errors[0]
+
+    def __submit(self, executor, dependency):
+        context = contextvars.copy_context()
+        return executor.submit(context.run, self.__resolve, dependency)
+
+    def __resolve(self, dependency):
+        self.__local.worker = True
+        try:
+            dependency.resolve()
+        finally:
+            self.__local.worker = False
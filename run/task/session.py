@@ -0,0 +1,100 @@
+import asyncio
+import threading
+from functools import partial
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class Session:
+    """Dependency resolution state of a top-level invocation.
+
+    Resolution is keyed by predecessor and call arguments so a
+    predecessor required by many tasks is called once per session
+    (also from different threads or coroutines) and called again
+    in the next session. Session is entered by the top-level call
+    and shared with nested calls through context variable.
+
+    Examples
+    --------
+    Usage example::
+
+      with Session.enter():
+          module.build()
+          module.test()  # build's requires are not called again
+    """
+
+    # Public
+
+    def __init__(self):
+        self.__resolved = set()
+        self.__futures = {}
+        self.__locks = {}
+        self.__lock = threading.Lock()
+
+    async def aresolve(self, key, function):
+        """Await coroutine function once per key.
+
+        Concurrent resolutions of the same key await the same future.
+        """
+        with self.__lock:
+            future = None
+            if key not in self.__resolved:
+                future = self.__futures.get(key)
+                if future is None:
+                    future = asyncio.ensure_future(function())
+                    future.add_done_callback(
+                        partial(self.__resolve_future, key))
+                    self.__futures[key] = future
+        if future is not None:
+            await asyncio.shield(future)
+
+    @classmethod
+    def current(cls):
+        """Return current session or None.
+        """
+        return cls.__current.get()
+
+    @classmethod
+    @contextmanager
+    def enter(cls):
+        """Enter current session or new one if there is no current.
+        """
+        session = cls.__current.get()
+        if session is not None:
+            yield session
+            return
+        session = cls()
+        token = cls.__current.set(session)
+        try:
+            yield session
+        finally:
+            cls.__current.reset(token)
+
+    def resolve(self, key, function):
+        """Call function once per key.
+
+        Concurrent resolutions of the same key wait for the first one.
+        """
+        with self.__get_lock(key):
+            if key not in self.__resolved:
+                function()
+                self.__resolved.add(key)
+
+    def resolved(self, key):
+        """Return True if the key is resolved in the session.
+        """
+        return key in self.__resolved
+
+    # Private
+
+    __current = ContextVar('session', default=None)
+
+    def __get_lock(self, key):
+        with self.__lock:
+            return self.__locks.setdefault(key, threading.RLock())
+
+    def __resolve_future(self, key, future):
+        with self.__lock:
+            if not future.cancelled() and future.exception() is None:
+                self.__resolved.add(key)
+            self.__futures.pop(key, None)
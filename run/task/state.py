@@ -0,0 +1,126 @@
+import os
+import sqlite3
+import hashlib
+import threading
+
+
+class State:
+    """On-disk state database of incremental tasks.
+
+    Database keeps stat data and content digests of input files
+    so files with unchanged stat data are never hashed again. It
+    also keeps inputs fingerprints of the last successful task calls.
+
+    Parameters
+    ----------
+    filepath: str
+        Database path (directories are created on demand).
+    """
+
+    # Public
+
+    def __init__(self, filepath):
+        self.__filepath = os.path.abspath(filepath)
+        self.__connection = None
+        self.__lock = threading.Lock()
+
+    def __repr__(self):
+        return '<State "{self.filepath}">'.format(self=self)
+
+    def dump(self, key, fingerprint):
+        """Save fingerprint of the successful call.
+        """
+        with self.__lock:
+            connection = self.__connect()
+            connection.execute(
+                'INSERT OR REPLACE INTO calls VALUES (?, ?)',
+                (key, fingerprint))
+            connection.commit()
+
+    @property
+    def filepath(self):
+        return self.__filepath
+
+    def fingerprint(self, paths):
+        """Return fingerprint of the files content.
+
+        Parameters
+        ----------
+        paths: list
+            Sorted file paths.
+        """
+        digest = hashlib.sha1()
+        with self.__lock:
+            connection = self.__connect()
+            # Stat data is read at once to be fast for many files
+            files = {row[0]: row[1:] for row in connection.execute(
+                'SELECT path, mtime, size, inode, digest FROM files')}
+            updates = []
+            for path in paths:
+                digest.update(path.encode('utf-8', 'surrogateescape'))
+                digest.update(self.__hash(path, files, updates))
+            if updates:
+                connection.executemany(
+                    'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)',
+                    updates)
+                connection.commit()
+        return digest.hexdigest()
+
+    @classmethod
+    def get(cls, filepath):
+        """Return shared state for the database path.
+        """
+        filepath = os.path.abspath(filepath)
+        with cls.__states_lock:
+            state = cls.__states.get(filepath)
+            if state is None:
+                state = cls(filepath)
+                cls.__states[filepath] = state
+            return state
+
+    def load(self, key):
+        """Return fingerprint of the last successful call or None.
+        """
+        with self.__lock:
+            row = self.__connect().execute(
+                'SELECT fingerprint FROM calls WHERE key = ?',
+                (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0]
+
+    # Private
+
+    __states = {}
+    __states_lock = threading.Lock()
+
+    def __connect(self):
+        if self.__connection is None:
+            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            connection = sqlite3.connect(
+                self.filepath, check_same_thread=False)
+            connection.executescript(
+                'CREATE TABLE IF NOT EXISTS files ('
+                ' path TEXT PRIMARY KEY,'
+                ' mtime INTEGER, size INTEGER, inode INTEGER, digest BLOB);'
+                'CREATE TABLE IF NOT EXISTS calls ('
+                ' key TEXT PRIMARY KEY, fingerprint TEXT);')
+            self.__connection = connection
+        return self.__connection
+
+    def __hash(self, path, files, updates):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return b''
+        data = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        row = files.get(path)
+        if row is not None and tuple(row[:3]) == data:
+            return row[3]
+        digest = hashlib.sha1()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(65536), b''):
+                digest.update(chunk)
+        digest = digest.digest()
+        updates.append((path,) + data + (digest,))
+        return digest
@@ -1,14 +1,30 @@
 import os
+import sys
+import glob
+import time
 import uuid
+import asyncio
 import inspect
+import contextvars
 from copy import copy
 from functools import partial
 from contextlib import contextmanager
-from ..helpers import merge_dicts
+from collections.abc import Iterator
+from ..basedir import basedir
+from ..helpers import merge_dicts, pack
+from ..profiler import profiler
 from ..settings import settings
 from .metaclass import Metaclass
+from .cache import DiskCache
+from .cluster import Cluster, is_worker as is_cluster_worker
 from .require import require
+from .resolver import Resolver
+from .session import Session
+from .state import State
 from .event import CallTaskEvent
+from .mapper import Mapper
+from .memo import Memo
+from .pool import ProcessPool, is_worker
 from .trigger import trigger
 
 
@@ -24,29 +40,50 @@ class Task(metaclass=Metaclass):
         return self
 
     def __call__(self, *args, **kwargs):
-        Event = CallTaskEvent
-        uid = uuid.uuid4().int
-        args = self.Args + args
-        kwargs = merge_dicts(self.Kwargs, kwargs)
-        pEvent = partial(Event, self, uid=uid, args=args, kwargs=kwargs)
-        self.Notify(pEvent(state=Event.INIT))
-        try:
-            self.__resolve_dependencies()
-            try:
-                with self.__change_directory():
+        plan = self.__plan
+        if plan is None:
+            plan = self.__plan = self.__make_plan()
+        if plan:
+            location, listeners = plan
+            if (not self.__dependencies and
+                    not self.__observe(listeners)):
+                # Nothing observes or wraps the call
+                token = basedir.set(location)
+                try:
                     result = self.Invoke(*args, **kwargs)
-            except Exception:
-                if self.Fallback is not None:
-                    result = self.Fallback
-                else:
-                    self.__resolve_dependencies(fail=True)
-                    raise
-            self.__resolve_dependencies(fail=False)
-        except Exception:
-            self.Notify(pEvent(state=Event.FAIL))
-            raise
-        self.Notify(pEvent(state=Event.DONE))
-        return result
+                finally:
+                    basedir.reset(token)
+                if isinstance(result, Iterator):
+                    return self.__locate_stream(result, location)
+                return result
+        with Session.enter():
+            return self.__call(args, kwargs)
+
+    async def Acall(self, *args, **kwargs):
+        """Call task asynchronously.
+
+        It's a coroutine version of task calling. Dependencies
+        are awaited concurrently and invocation is awaited
+        with :meth:`Ainvoke` (not to block the event loop).
+        """
+        with Session.enter():
+            return await self.__acall(args, kwargs)
+
+    async def Ainvoke(self, *args, **kwargs):
+        """Invoke task asynchronously.
+
+        Synchronous invocation is run in the default executor
+        (in a copy of the current context).
+
+        Parameters
+        ----------
+        args, kwargs
+            Arguments for task invokation.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            None, partial(context.run, self.__invoke, *args, **kwargs))
 
     def __repr__(self):
         template = '<{self.Type}>'
@@ -64,15 +101,32 @@ class Task(metaclass=Metaclass):
     def Basedir(self):
         """Task's basedir.
 
-        If Chdir is True current directory will be
-        changed to Basedir when task invoking.
+        Located basedir is set to the context variable when task
+        invoking so :func:`run.path`, :func:`run.open` and
+        :func:`run.execute` resolve relative paths against it.
+        If Chdir is True current directory is also changed.
         """
         return self.Inspect('Basedir', default=None)
 
+    def Bind(self, *args, **kwargs):
+        """Bind arguments through the task's invocation signature.
+
+        Returns
+        -------
+        :class:`inspect.BoundArguments`
+            Bound arguments with defaults applied.
+        """
+        bound = inspect.signature(self.Invoke).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return bound
+
     @property
     def Chdir(self):
         """Task's chdir status (enabled or disabled).
 
+        Changing of the process current directory is
+        not thread-safe so it's disabled by default.
+
         .. seealso:: :attr:`run.Task.Basedir`
         """
         return self.Inspect(
@@ -92,6 +146,11 @@ class Task(metaclass=Metaclass):
         self.__init_dependencies()
         # Initiate directories
         self.__initdir = os.path.abspath(os.getcwd())
+        self.__location = None
+        # Initiate call plan
+        self.__plan = None
+        # Initiate memo
+        self.__memo = Memo()
         # Initiate arguments
         self.__args = ()
         self.__kwargs = {}
@@ -123,6 +182,17 @@ class Task(metaclass=Metaclass):
         return self.Inspect(
             'Docstring', default=str(inspect.getdoc(self)).strip())
 
+    @property
+    def Executor(self):
+        """Task's executor: None (calling thread), "process" or "cluster".
+
+        Process executor invokes task in warm worker process and
+        cluster executor invokes it on :attr:`settings.workers`
+        (task's arguments and result have to be picklable).
+        """
+        return self.Inspect(
+            'Executor', module=True, default=settings.executor)
+
     @property
     def Fallback(self):
         """Task's fallback.
@@ -132,6 +202,13 @@ class Task(metaclass=Metaclass):
         return self.Inspect(
             'Fallback', module=True, default=settings.fallback)
 
+    def Forget(self):
+        """Forget memoized results.
+
+        .. seealso:: :attr:`run.Task.Memoize`
+        """
+        self.__memo.forget()
+
     @property
     def Hidden(self):
         return self.Inspect('Hidden', default=False)
@@ -148,6 +225,10 @@ class Task(metaclass=Metaclass):
     def Invoke(self, *args, **kwargs):
         """Invoke task.
 
+        Iterator result (like generator) is streamed: call returns
+        an iterator of the same items and call's DONE event is
+        notified once it's exhausted (not memoized or cached).
+
         Parameters
         ----------
         args, kwargs
@@ -155,6 +236,27 @@ class Task(metaclass=Metaclass):
         """
         pass
 
+    @property
+    def Hits(self):
+        """Task's memo hits count.
+        """
+        return self.__memo.hits
+
+    @property
+    def Inputs(self):
+        """Task's input files glob patterns relative to :meth:`Locate`.
+
+        Task with inputs or outputs is skipped if all outputs exist
+        and no input has been changed since the last successful call.
+        """
+        return self.Inspect('Inputs', default=[])
+
+    @property
+    def Jobs(self):
+        """Task's count of require dependencies resolved concurrently.
+        """
+        return self.Inspect('Jobs', module=True, default=settings.jobs)
+
     @property
     def Kwargs(self):
         """Tasks's default keyword arguments.
@@ -163,16 +265,26 @@ class Task(metaclass=Metaclass):
 
     @property
     def Listeners(self):
+        """Task's call event listeners (callables).
+
+        Listener could define observes(task) method returning False
+        if it doesn't need task's call events at the moment so the
+        call is made without them.
+        """
         return self.Inspect('Listeners', default=[])
 
     def Locate(self, *paths):
-        basedir = self.Basedir
-        if basedir is None or not os.path.isabs(basedir):
-            prefix = self.__initdir
-            if self.Module:
-                prefix = self.Module.Locate()
-            basedir = os.path.join(*filter(None, [prefix, basedir]))
-        path = os.path.join(basedir, *paths)
+        # Location is cached until the next update
+        location = self.__location
+        if location is None:
+            location = self.Basedir
+            if location is None or not os.path.isabs(location):
+                prefix = self.__initdir
+                if self.Module:
+                    prefix = self.Module.Locate()
+                location = os.path.join(*filter(None, [prefix, location]))
+            self.__location = location
+        path = os.path.join(location, *paths)
         return path
 
     @property
@@ -182,6 +294,42 @@ class Task(metaclass=Metaclass):
         else:
             return self
 
+    @property
+    def Map(self):
+        """Iterable (or name of module's attribute) to map task over.
+
+        Mapped task's call invokes the task by it's executor for every
+        item (call's arguments follow the item) and streams results
+        in completion order or returns :attr:`Reduce` task's result.
+        Failed items are logged without aborting the map and
+        :class:`run.task.MapError` is raised once all items are done.
+
+        .. seealso:: :class:`run.task.Mapper`
+        """
+        return self.Inspect('Map', default=None)
+
+    @property
+    def MapJobs(self):
+        """Task's count of items of :attr:`Map` invoked concurrently.
+        """
+        return self.Inspect(
+            'MapJobs', module=True, default=settings.map_jobs)
+
+    @property
+    def Memoize(self):
+        """Task's memo limit: None, count or True (settings' limit).
+
+        Memoized task's results are kept in LRU memo keyed by
+        the bound arguments. Memo hit is notified as CACHE event (before DONE).
+        """
+        return self.Inspect('Memoize', default=None)
+
+    @property
+    def Misses(self):
+        """Task's memo misses count.
+        """
+        return self.__memo.misses
+
     @property
     def Module(self):
         """Task's module.
@@ -194,12 +342,14 @@ class Task(metaclass=Metaclass):
 
         Name is defined as task name in module.
         """
-        name = ''
-        if self.Module:
-            tasks = self.Module.Tasks
-            for key, task in tasks.items():
-                if task is self:
-                    name = key
+        name = self.Inspect('Name')
+        if name is None:
+            name = ''
+            if self.Module:
+                tasks = self.Module.Tasks
+                for key, task in tasks.items():
+                    if task is self:
+                        name = key
         return name
 
     def NotDepend(self, target):
@@ -230,6 +380,22 @@ class Task(metaclass=Metaclass):
                 [self.Module.Qualname, self.Name]))
         return qualname
 
+    @property
+    def Outputs(self):
+        """Task's output files glob patterns relative to :meth:`Locate`.
+
+        .. seealso:: :attr:`run.Task.Inputs`
+        """
+        return self.Inspect('Outputs', default=[])
+
+    @property
+    def Reduce(self):
+        """Task (or name of module's task) combining :attr:`Map` results.
+
+        Reduce task is called with an iterator of items' results.
+        """
+        return self.Inspect('Reduce', default=None)
+
     def Require(self, __target, *args, **kwargs):
         """Add require dependency.
 
@@ -243,6 +409,18 @@ class Task(metaclass=Metaclass):
         dependency = require(__target, *args, **kwargs)
         self.Depend(dependency)
 
+    def Restore(self, task):
+        """Take over cached state (memoized results) of the task.
+
+        Used on runfile reloading to keep results of not changed tasks.
+
+        Parameters
+        ----------
+        task: :class:`.Task`
+            Same task of the previous runfile build.
+        """
+        self.__memo = task.__memo
+
     @property
     def Signature(self):
         """Task's signature.
@@ -250,6 +428,36 @@ class Task(metaclass=Metaclass):
         return self.Inspect(
             'Signature', default=str(inspect.signature(self.Invoke)))
 
+    @property
+    def Source(self):
+        """Task's source code.
+        """
+        try:
+            return inspect.getsource(type(self))
+        except (OSError, TypeError):
+            return ''
+
+    @property
+    def Store(self):
+        """Task's results store: None or "disk".
+
+        Task stored on disk is not invoked if the result for the
+        same call key is found in the store (captured output is
+        replayed). Key includes arguments, task's source, required
+        tasks' keys and :attr:`StoreEnv` environment variables.
+        Store is shared through :attr:`settings.cache_remote`
+        server if it's set (entries are signed by
+        :attr:`settings.cache_authkey`).
+        """
+        return self.Inspect('Store', default=None)
+
+    @property
+    def StoreEnv(self):
+        """Task's environment variable names for results store key.
+        """
+        return self.Inspect(
+            'StoreEnv', module=True, default=settings.cache_env)
+
     @property
     def Style(self):
         return self.Inspect('Style', default='task')
@@ -275,12 +483,161 @@ class Task(metaclass=Metaclass):
 
     # TODO: clean updates list while applying?
     def Update(self):
-        updates = self.Inspect('Updates', default=[])
-        for update in updates:
-            update.apply(self)
+        with profiler.phase('update'):
+            updates = self.Inspect('Updates', default=[])
+            for update in updates:
+                update.apply(self)
+            self.__location = None
+            self.__plan = None
 
     # Private
 
+    def __call(self, args, kwargs):
+        Event = CallTaskEvent
+        uid = uuid.uuid4().int
+        args = self.Args + args
+        kwargs = merge_dicts(self.Kwargs, kwargs)
+        pEvent = partial(Event, self, uid=uid, args=args, kwargs=kwargs)
+        self.Notify(pEvent(state=Event.INIT))
+        duration = None
+        try:
+            memo = self.__make_memo(args, kwargs)
+            if memo is not None and memo[0]:
+                self.Notify(pEvent(state=Event.CACHE))
+                self.Notify(pEvent(state=Event.DONE))
+                return memo[1]
+            cache = self.__make_cache(args, kwargs)
+            if cache is not None and self.__check_cache(cache):
+                self.Notify(pEvent(state=Event.CACHE))
+                self.Notify(pEvent(state=Event.DONE))
+                self.__save_memo(memo, cache[2].result)
+                return cache[2].result
+            self.__resolve_dependencies()
+            record = self.__make_record(args, kwargs)
+            if record is not None and self.__check_record(record):
+                self.Notify(pEvent(state=Event.SKIP))
+                self.Notify(pEvent(state=Event.DONE))
+                return None
+            started = time.perf_counter()
+            try:
+                with self.__enter_basedir(), \
+                        self.__capture(cache) as output:
+                    result = self.__invoke(*args, **kwargs)
+            except Exception:
+                duration = time.perf_counter() - started
+                if self.Fallback is not None:
+                    result = self.Fallback
+                else:
+                    self.__resolve_dependencies(fail=True)
+                    raise
+            else:
+                duration = time.perf_counter() - started
+                if isinstance(result, Iterator):
+                    # Call is finished once the stream is exhausted
+                    return self.__stream(result, record, duration, pEvent)
+                self.__save_record(record)
+                self.__save_cache(cache, result, output)
+                self.__save_memo(memo, result)
+            self.__resolve_dependencies(fail=False)
+        except Exception:
+            self.Notify(pEvent(state=Event.FAIL, duration=duration))
+            raise
+        self.Notify(pEvent(state=Event.DONE, duration=duration))
+        return result
+
+    async def __acall(self, args, kwargs):
+        Event = CallTaskEvent
+        uid = uuid.uuid4().int
+        args = self.Args + args
+        kwargs = merge_dicts(self.Kwargs, kwargs)
+        pEvent = partial(Event, self, uid=uid, args=args, kwargs=kwargs)
+        self.Notify(pEvent(state=Event.INIT))
+        duration = None
+        try:
+            memo = self.__make_memo(args, kwargs)
+            if memo is not None and memo[0]:
+                self.Notify(pEvent(state=Event.CACHE))
+                self.Notify(pEvent(state=Event.DONE))
+                return memo[1]
+            cache = self.__make_cache(args, kwargs)
+            if cache is not None and self.__check_cache(cache):
+                self.Notify(pEvent(state=Event.CACHE))
+                self.Notify(pEvent(state=Event.DONE))
+                self.__save_memo(memo, cache[2].result)
+                return cache[2].result
+            await self.__aresolve_dependencies()
+            loop = asyncio.get_running_loop()
+            record = await loop.run_in_executor(
+                None, self.__make_record, args, kwargs)
+            if record is not None and self.__check_record(record):
+                self.Notify(pEvent(state=Event.SKIP))
+                self.Notify(pEvent(state=Event.DONE))
+                return None
+            started = time.perf_counter()
+            try:
+                with self.__enter_basedir(), \
+                        self.__capture(cache) as output:
+                    result = await self.Ainvoke(*args, **kwargs)
+            except Exception:
+                duration = time.perf_counter() - started
+                if self.Fallback is not None:
+                    result = self.Fallback
+                else:
+                    await self.__aresolve_dependencies(fail=True)
+                    raise
+            else:
+                duration = time.perf_counter() - started
+                if isinstance(result, Iterator):
+                    # Call is finished once the stream is exhausted
+                    return self.__stream(result, record, duration, pEvent)
+                self.__save_record(record)
+                self.__save_cache(cache, result, output)
+                self.__save_memo(memo, result)
+            await self.__aresolve_dependencies(fail=False)
+        except Exception:
+            self.Notify(pEvent(state=Event.FAIL, duration=duration))
+            raise
+        self.Notify(pEvent(state=Event.DONE, duration=duration))
+        return result
+
+    def __stream(self, iterator, record, duration, pEvent):
+        # Stream items are produced in task's base directory
+        # and their production time is added to the duration
+        Event = CallTaskEvent
+        try:
+            try:
+                while True:
+                    started = time.perf_counter()
+                    try:
+                        with self.__enter_basedir():
+                            item = next(iterator)
+                    except StopIteration:
+                        break
+                    finally:
+                        duration += time.perf_counter() - started
+                    yield item
+            except Exception:
+                self.__resolve_dependencies(fail=True)
+                raise
+            self.__save_record(record)
+            self.__resolve_dependencies(fail=False)
+        except BaseException:
+            # Including not exhausted stream closing
+            self.Notify(pEvent(state=Event.FAIL, duration=duration))
+            raise
+        self.Notify(pEvent(state=Event.DONE, duration=duration))
+
+    def __locate_stream(self, iterator, location):
+        while True:
+            token = basedir.set(location)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                basedir.reset(token)
+            yield item
+
     def __init_dependencies(self):
         for dependency in self.__parameters.pop('Depend', []):
             self.Depend(dependency)
@@ -289,20 +646,181 @@ class Task(metaclass=Metaclass):
         for task in self.__parameters.pop('Trigger', []):
             self.Trigger(task)
 
+    def __make_plan(self):
+        # Plan is (location, listeners) for fast path or False.
+        # Dependencies and listeners are checked on every call
+        # because they could be added after compiling.
+        if (self.Args or self.Kwargs or self.Fallback is not None or
+                self.Chdir or self.Executor or self.Store or
+                self.Memoize or self.Inputs or self.Outputs or
+                self.Map is not None):
+            return False
+        listeners = []
+        task = self
+        while task is not None:
+            notify = getattr(task.Notify, '__func__', None)
+            if notify is not Task.Notify:
+                return False
+            listeners.append(task.Listeners)
+            task = task.Module
+        return (self.Locate(), tuple(listeners))
+
+    def __observe(self, listeners):
+        # Listener without observes method observes every call
+        for items in listeners:
+            for listener in items:
+                observes = getattr(listener, 'observes', None)
+                if observes is None or observes(self):
+                    return True
+        return False
+
+    def __invoke(self, *args, **kwargs):
+        if self.Map is not None:
+            return self.__map(args, kwargs)
+        return self.__dispatch(*args, **kwargs)
+
+    def __map(self, args, kwargs):
+        items = self.Map
+        if isinstance(items, str):
+            items = getattr(self.Module, items)
+            if callable(items):
+                items = items()
+        mapper = Mapper(self.__dispatch, items, jobs=self.MapJobs)
+        results = mapper(*args, **kwargs)
+        reduce = self.Reduce
+        if reduce is None:
+            return results
+        if isinstance(reduce, str):
+            reduce = getattr(self.Module, reduce)
+        return reduce(results)
+
+    def __dispatch(self, *args, **kwargs):
+        # Tasks called in worker are invoked in place
+        if self.Executor == 'process' and not is_worker():
+            pool = ProcessPool.get(self.Main, workers=settings.processes)
+            return pool.invoke(self, *args, **kwargs)
+        if self.Executor == 'cluster' and not is_cluster_worker():
+            cluster = Cluster.get(self.Main, settings.workers)
+            return cluster.invoke(self, *args, **kwargs)
+        return self.Invoke(*args, **kwargs)
+
+    async def __aresolve_dependencies(self, fail=None):
+        if fail is None:
+            await asyncio.gather(*(
+                dependency.aresolve() for dependency in self.Dependencies))
+        else:
+            for dependency in self.Dependencies:
+                await dependency.aresolve(fail=fail)
+
+    def __make_memo(self, args, kwargs):
+        # Memo is (found, result, key, limit) for memoized task
+        limit = self.Memoize
+        if not limit:
+            return None
+        if limit is True:
+            limit = settings.memoize_limit
+        try:
+            key = Memo.key(self.Bind(*args, **kwargs))
+        except TypeError:
+            return None
+        if key is None:
+            return None
+        return self.__memo.get(key) + (key, limit)
+
+    def __save_memo(self, memo, result):
+        if memo is not None:
+            _, _, key, limit = memo
+            self.__memo.set(key, result, limit=limit)
+
+    def __make_cache(self, args, kwargs):
+        # Cache is (store, key, entry) for task stored on disk
+        if self.Store != 'disk':
+            return None
+        store = DiskCache.get(
+            os.path.join(settings.cache_dirpath, 'results'),
+            remote=settings.cache_remote)
+        key = store.key(self, args, kwargs, environ=self.StoreEnv)
+        if key is None:
+            return None
+        return (store, key, store.load(key))
+
+    def __check_cache(self, cache):
+        entry = cache[2]
+        if entry is None:
+            return False
+        sys.stdout.write(entry.stdout)
+        sys.stderr.write(entry.stderr)
+        return True
+
+    @contextmanager
+    def __capture(self, cache):
+        if cache is None:
+            yield None
+            return
+        with cache[0].capture() as output:
+            yield output
+
+    def __save_cache(self, cache, result, output):
+        if cache is not None:
+            store, key, _ = cache
+            store.dump(key, result, **output)
+
+    def __make_record(self, args, kwargs):
+        # Record is (state, key, fingerprint) for incremental task
+        if not self.Inputs and not self.Outputs:
+            return None
+        state = State.get(self.Main.Locate(settings.state_filename))
+        key = self.Qualname + pack(*args, **kwargs)
+        fingerprint = state.fingerprint(self.__glob(self.Inputs))
+        return (state, key, fingerprint)
+
+    def __check_record(self, record):
+        state, key, fingerprint = record
+        for pattern in self.Outputs:
+            if not self.__glob([pattern]):
+                return False
+        return state.load(key) == fingerprint
+
+    def __save_record(self, record):
+        if record is not None:
+            state, key, fingerprint = record
+            state.dump(key, fingerprint)
+
+    def __glob(self, patterns):
+        paths = set()
+        for pattern in patterns:
+            pattern = os.path.join(self.Locate(), pattern)
+            for path in glob.iglob(pattern, recursive=True):
+                if os.path.isfile(path):
+                    paths.add(path)
+        return sorted(paths)
+
     def __resolve_dependencies(self, fail=None):
+        jobs = self.Jobs
+        if fail is None and jobs > 1:
+            # Requires graph is resolved concurrently first
+            resolver = Resolver(jobs=jobs, keep_going=settings.keep_going)
+            resolver(self.Dependencies)
         for dependency in self.Dependencies:
             dependency.resolve(fail=fail)
 
     @contextmanager
-    def __change_directory(self):
-        if not self.Chdir:
-            yield
-            return
-        oldpath = os.path.abspath(os.getcwd())
-        newpath = self.Locate()
-        if oldpath == newpath:
-            yield
-            return
-        os.chdir(newpath)
-        yield
-        os.chdir(oldpath)
+    def __enter_basedir(self):
+        token = basedir.set(self.Locate())
+        try:
+            if not self.Chdir:
+                yield
+                return
+            # Legacy mode
+            oldpath = os.path.abspath(os.getcwd())
+            newpath = self.Locate()
+            if oldpath == newpath:
+                yield
+                return
+            os.chdir(newpath)
+            try:
+                yield
+            finally:
+                os.chdir(oldpath)
+        finally:
+            basedir.reset(token)
@@ -32,3 +32,9 @@ class trigger(Dependency):
             if (self.__on_success and not fail or
                 self.__on_fail and fail):
                 self.invoke()
+
+    async def aresolve(self, fail=None):
+        if fail is not None:
+            if (self.__on_success and not fail or
+                self.__on_fail and fail):
+                await self.ainvoke()
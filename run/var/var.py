@@ -24,6 +24,19 @@ class Var(Task, metaclass=ABCMeta):
         return self.Inspect(
             'Cache', module=True, default=settings.cache)
 
+    @property
+    def Executor(self):
+        """Var is always invoked in place (see :attr:`Task.Executor`).
+        """
+        return None
+
+    def Restore(self, task):
+        super().Restore(task)
+        try:
+            self.__cached_result = task.__cached_result
+        except AttributeError:
+            pass
+
     @property
     def Signature(self):
         return ''
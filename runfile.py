@@ -11,14 +11,17 @@ class ProjectModule(ProjectModule):
     author = 'roll'
     author_email = 'roll@respect31.com'
     copyright = '2015, Inventive Ninja'
-    data_files = [('/etc/bash_completion.d', ['data/run.sh'])]
+    data_files = [
+        ('/etc/bash_completion.d', ['data/run.sh']),
+        ('/usr/share/zsh/site-functions', ['data/_run']),
+        ('/usr/share/fish/vendor_completions.d', ['data/run.fish'])]
     description = 'Run is a program to run tasks from files.'
     development_requires = [
         'mario', 'sphinx', 'sphinx-settings', 'sphinx-rtd-theme']
     entry_points = {'console_scripts': ['run = run:program']}
     github_user = 'inventive-ninja'
     install_requires = ['clyde']
-    interpreters = ['3.3', '3.4']
+    interpreters = ['3.9', '3.10', '3.11', '3.12']
     license = 'MIT License'
     name = 'run'
     platforms = ['Unix']
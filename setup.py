@@ -3,7 +3,7 @@
 
 # Block: data_files
 import os
-data_files = [('/etc/bash_completion.d', ['data/run.sh'])]
+data_files = [('/etc/bash_completion.d', ['data/run.sh']), ('/usr/share/zsh/site-functions', ['data/_run']), ('/usr/share/fish/vendor_completions.d', ['data/run.fish'])]
 if data_files:
     try:
         if os.geteuid() != 0:
@@ -42,6 +42,7 @@ setup(
     install_requires=['clyde'], 
     packages=packages,
     platforms=['Unix'],
+    python_requires='>=3.9',
     url='https://github.com/inventive-ninja/run',
     tests_require=['nose', 'coverage'],
     test_suite='nose.collector',
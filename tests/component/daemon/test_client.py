@@ -0,0 +1,58 @@
+import os
+import shutil
+import socket
+import tempfile
+import unittest
+from unittest.mock import patch
+from importlib import import_module
+component = import_module('run.daemon.client')
+
+
+class ClientTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.client = component.Client('/not_existent.sock')
+
+    # Tests
+
+    def test_address(self):
+        self.assertEqual(self.client.address, '/not_existent.sock')
+
+    def test_connect_with_not_existent_address(self):
+        self.assertFalse(self.client.connect())
+
+    def test_execute_without_connect(self):
+        self.assertRaises(RuntimeError,
+            self.client.execute, ['run'], env={}, cwd='/')
+
+
+class ClientWithServerTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirpath)
+        self.address = os.path.join(self.dirpath, 'run.sock')
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(self.server.close)
+        self.server.bind(self.address)
+        self.server.listen()
+        self.client = component.Client(self.address)
+
+    # Tests
+
+    def test_connect(self):
+        self.assertTrue(self.client.connect())
+
+    def test_connect_with_public_directory(self):
+        os.chmod(self.dirpath, 0o755)
+        with self.assertLogs(component.__name__, 'WARNING'):
+            self.assertFalse(self.client.connect())
+
+    def test_connect_with_other_user_server(self):
+        with patch.object(component, 'peer_uid', return_value=-1), \
+                self.assertLogs(component.__name__, 'WARNING'):
+            self.assertFalse(self.client.connect())
@@ -0,0 +1,56 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from importlib import import_module
+component = import_module('run.daemon.locate')
+
+
+class locate_Test(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.addCleanup(patch.stopall)
+        patch.object(component.settings, 'daemon_dirpath', '/dirpath').start()
+
+    # Tests
+
+    def test(self):
+        self.assertRegex(
+            component.locate('/path/runfile.py'),
+            r'^/dirpath/[0-9a-f]{40}\.sock$')
+
+    def test_with_relative_filepath(self):
+        self.assertEqual(
+            component.locate('runfile.py'),
+            component.locate(component.os.path.abspath('runfile.py')))
+
+
+class verify_Test(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirpath)
+
+    # Tests
+
+    def test(self):
+        component.verify(self.dirpath)
+
+    def test_with_public_directory(self):
+        os.chmod(self.dirpath, 0o755)
+        self.assertRaises(RuntimeError, component.verify, self.dirpath)
+
+    def test_with_symlink(self):
+        path = self.dirpath + '.link'
+        os.symlink(self.dirpath, path)
+        self.addCleanup(os.remove, path)
+        self.assertRaises(RuntimeError, component.verify, path)
+
+    def test_with_other_owner(self):
+        with patch.object(component.os, 'getuid', return_value=-1):
+            self.assertRaises(RuntimeError, component.verify, self.dirpath)
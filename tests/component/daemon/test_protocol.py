@@ -0,0 +1,40 @@
+import os
+import socket
+import unittest
+from importlib import import_module
+component = import_module('run.daemon.protocol')
+
+
+class protocol_Test(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.client, self.server = socket.socketpair()
+        self.addCleanup(self.client.close)
+        self.addCleanup(self.server.close)
+
+    # Tests
+
+    def test_request(self):
+        request = {'argv': ['run', 'task'], 'env': {}, 'cwd': '/'}
+        component.send_request(self.client, request, [0, 1, 2])
+        received_request, fds = component.receive_request(self.server)
+        for fd in fds:
+            os.close(fd)
+        self.assertEqual(received_request, request)
+        self.assertEqual(len(fds), 3)
+
+    @unittest.skipUnless(hasattr(socket, 'SO_PEERCRED'), 'SO_PEERCRED')
+    def test_peer_uid(self):
+        self.assertEqual(component.peer_uid(self.client), os.getuid())
+        self.assertEqual(component.peer_uid(self.server), os.getuid())
+
+    def test_status(self):
+        component.send_status(self.server, 3)
+        self.assertEqual(component.receive_status(self.client), 3)
+
+    def test_status_with_closed_connection(self):
+        self.server.close()
+        self.assertRaises(ConnectionError,
+            component.receive_status, self.client)
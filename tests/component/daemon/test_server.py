@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+import threading
+from unittest.mock import Mock, patch
+from importlib import import_module
+component = import_module('run.daemon.server')
+client = import_module('run.daemon.client')
+
+
+class ServerTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.addCleanup(patch.stopall)
+        patch.object(component.Handler, 'timeout', 0.5).start()
+        self.dirpath = tempfile.mkdtemp()
+        self.address = os.path.join(self.dirpath, 'run.sock')
+        self.runfile = Mock()
+        self.handler = Mock(return_value=3)
+        self.server = component.Server(
+            self.address, runfile=self.runfile, handler=self.handler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.addCleanup(os.rmdir, self.dirpath)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.thread.join)
+        self.addCleanup(self.server.shutdown)
+
+    # Tests
+
+    def test(self):
+        self.client = client.Client(self.address)
+        self.assertTrue(self.client.connect())
+        self.assertEqual(
+            self.client.execute(['run'], env={}, cwd=self.dirpath), 3)
+
+    def test_with_running_server(self):
+        self.assertRaises(RuntimeError, component.Server,
+            self.address, runfile=self.runfile, handler=self.handler)
+
+    def test_with_other_user_request(self):
+        self.client = client.Client(self.address)
+        self.assertTrue(self.client.connect())
+        with patch.object(component, 'peer_uid', return_value=-1), \
+                self.assertLogs(component.__name__, 'WARNING'):
+            self.assertEqual(
+                self.client.execute(['run'], env={}, cwd=self.dirpath), 1)
+
+    def test_with_public_directory(self):
+        dirpath = tempfile.mkdtemp()
+        self.addCleanup(os.rmdir, dirpath)
+        os.chmod(dirpath, 0o755)
+        self.assertRaises(RuntimeError, component.Server,
+            os.path.join(dirpath, 'run.sock'),
+            runfile=self.runfile, handler=self.handler)
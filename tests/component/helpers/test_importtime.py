@@ -0,0 +1,20 @@
+import io
+import unittest
+from importlib import import_module
+component = import_module('run.helpers.importtime')
+
+
+class importtime_Test(unittest.TestCase):
+
+    # Tests
+
+    def test(self):
+        stderr = io.StringIO()
+        status, records = component.importtime(
+            ['-c', 'import sys, colorsys; sys.stderr.write("message\\n")'],
+            stderr=stderr)
+        self.assertEqual(status, 0)
+        self.assertEqual(stderr.getvalue(), 'message\n')
+        self.assertIn('colorsys', [record[0] for record in records])
+        for module, own, cumulative in records:
+            self.assertLessEqual(own, cumulative)
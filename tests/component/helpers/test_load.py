@@ -1,14 +1,59 @@
 import os
+import sys
+import shutil
+import tempfile
 import unittest
+from unittest.mock import patch
 from importlib import import_module
+from importlib.util import cache_from_source
 component = import_module('run.helpers.load')
 
 
 class load_Test(unittest.TestCase):
 
+    # Actions
+
+    def setUp(self):
+        self.dirpath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirpath)
+        self.filepath = os.path.join(self.dirpath, 'runfile.py')
+        with open(self.filepath, 'w') as file:
+            file.write('import unittest\n')
+
     # Tests
 
     def test(self):
         filepath = os.path.join(os.path.dirname(__file__), 'test_pack.py')
         module = component.load(filepath)
         self.assertIs(module.unittest, unittest)
+
+    def test_name(self):
+        module = component.load(self.filepath)
+        self.assertRegex(module.__name__, r'^runfile_[0-9a-f]{16}$')
+        self.assertIs(sys.modules[module.__name__], module)
+        self.assertEqual(component.load(self.filepath).__name__,
+                         module.__name__)
+
+    def test_with_name(self):
+        module = component.load(self.filepath, name='mock_runfile')
+        self.addCleanup(sys.modules.pop, 'mock_runfile')
+        self.assertIs(sys.modules['mock_runfile'], module)
+
+    def test_with_exception(self):
+        with open(self.filepath, 'w') as file:
+            file.write('raise RuntimeError()\n')
+        self.assertRaises(RuntimeError,
+            component.load, self.filepath, name='mock_runfile')
+        self.assertNotIn('mock_runfile', sys.modules)
+
+    @patch.object(sys, 'dont_write_bytecode', False)
+    def test_bytecode_cache(self):
+        component.load(self.filepath)
+        self.assertTrue(os.path.exists(cache_from_source(self.filepath)))
+
+    @patch.object(sys, 'dont_write_bytecode', False)
+    def test_bytecode_cache_with_checked_hash_validation(self):
+        component.load(self.filepath, validation='checked-hash')
+        with open(cache_from_source(self.filepath), 'rb') as file:
+            flags = int.from_bytes(file.read(8)[4:8], 'little')
+        self.assertEqual(flags, 0b11)
@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import patch
+from importlib import import_module
+component = import_module('run.helpers.profiler')
+
+
+class ProfilerTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.profiler = component.Profiler(enabled=True)
+
+    # Tests
+
+    def test_add(self):
+        self.profiler.add('import', 1, 0.5)
+        self.profiler.add('import', 1, 0.5)
+        self.assertEqual(self.profiler.phases['import'], (2, 1))
+
+    def test_phase(self):
+        with patch.object(component.time, 'perf_counter',
+                          side_effect=[0, 1, 1, 3, 3, 3.5]), \
+                patch.object(component.time, 'thread_time',
+                             side_effect=[0, 0.5, 0.5, 1.5, 1.5, 1.75]):
+            with self.profiler.phase('load'):
+                with self.profiler.phase('build'):
+                    pass
+        phases = self.profiler.phases
+        self.assertEqual(list(phases), ['load', 'build'])
+        # Nested phase time is exclusive
+        self.assertEqual(phases['load'], (1.5, 0.75))
+        self.assertEqual(phases['build'], (2, 1))
+
+    def test_phase_disabled(self):
+        self.profiler.enabled = False
+        with self.profiler.phase('load'):
+            pass
+        self.assertEqual(self.profiler.phases, {})
+
+    def test_start_stop(self):
+        self.profiler.enabled = False
+        self.profiler.start('parse')
+        self.profiler.stop()
+        self.profiler.stop()
+        self.assertEqual(list(self.profiler.phases), ['parse'])
+
+    def test_uptime(self):
+        wall, cpu = self.profiler.uptime()
+        self.assertGreater(wall, 0)
+        self.assertGreater(cpu, 0)
@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from importlib import import_module
+component = import_module('run.helpers.sampler')
+
+
+class SamplerTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.sampler = component.Sampler(interval=0.0005)
+
+    # Helpers
+
+    def spin(self):
+        result = 0
+        for number in range(1000000):
+            result += number
+        return result
+
+    # Tests
+
+    def test(self):
+        self.sampler.enable()
+        try:
+            self.spin()
+        finally:
+            self.sampler.disable()
+        self.assertTrue(
+            any('spin' in stack for stack in self.sampler.stacks))
+
+    def test_dump_stats(self):
+        self.sampler.stacks['main (file.py:1);spin (file.py:2)'] = 3
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = os.path.join(dirpath, 'stacks.folded')
+            self.sampler.dump_stats(filepath)
+            with open(filepath) as file:
+                self.assertEqual(
+                    file.read(), 'main (file.py:1);spin (file.py:2) 3\n')
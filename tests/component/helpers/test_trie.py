@@ -0,0 +1,40 @@
+import unittest
+from importlib import import_module
+component = import_module('run.helpers.trie')
+
+
+class TrieTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.trie = component.Trie(
+            ['build', 'test', 'test.unit', 'test.lint', 'test.unit.fast'])
+
+    # Tests
+
+    def test___contains__(self):
+        self.assertIn('test.unit', self.trie)
+        self.assertNotIn('test.other', self.trie)
+
+    def test_add(self):
+        self.trie.add('test.other')
+        self.assertIn('test.other', self.trie)
+
+    def test_complete(self):
+        self.assertEqual(self.trie.complete(''), ['build', 'test'])
+        self.assertEqual(self.trie.complete('t'), ['test'])
+
+    def test_complete_nested(self):
+        self.assertEqual(self.trie.complete('test.'),
+                         ['test.lint', 'test.unit'])
+        self.assertEqual(self.trie.complete('test.unit.'),
+                         ['test.unit.fast'])
+
+    def test_complete_not_existent(self):
+        self.assertEqual(self.trie.complete('other.'), [])
+        self.assertEqual(self.trie.complete('x'), [])
+
+    def test_with_separator(self):
+        self.trie = component.Trie(['a/b'], separator='/')
+        self.assertEqual(self.trie.complete('a/'), ['a/b'])
@@ -0,0 +1,95 @@
+import os
+import sys
+import tempfile
+import unittest
+from importlib import import_module
+component = import_module('run.helpers.watcher')
+
+
+class PollingWatcherTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dirpath = directory.name
+        os.mkdir(os.path.join(self.dirpath, 'src'))
+        os.mkdir(os.path.join(self.dirpath, '.run'))
+        self.watcher = self.make_watcher([self.dirpath])
+        self.addCleanup(self.watcher.close)
+
+    # Helpers
+
+    def make_watcher(self, paths):
+        return component.PollingWatcher(
+            paths, ignore=['.*'], debounce=0.05, interval=0.01)
+
+    def write(self, *paths):
+        path = os.path.join(self.dirpath, *paths)
+        with open(path, 'w') as file:
+            file.write(path)
+        return path
+
+    # Tests
+
+    def test_wait(self):
+        path = self.write('src', 'file')
+        self.assertEqual(self.watcher.wait(1), {path})
+
+    def test_wait_without_changes(self):
+        self.assertEqual(self.watcher.wait(0.05), set())
+
+    def test_wait_with_ignored_changes(self):
+        self.write('.run', 'state')
+        self.assertEqual(self.watcher.wait(0.05), set())
+
+    def test_wait_with_file(self):
+        path = self.write('file')
+        self.watcher = self.make_watcher([path])
+        self.addCleanup(self.watcher.close)
+        self.write('other')
+        self.assertEqual(self.watcher.wait(0.05), set())
+        os.remove(path)
+        self.assertEqual(self.watcher.wait(1), {path})
+
+    def test_wait_with_excluded_changes(self):
+        os.mkdir(os.path.join(self.dirpath, 'build'))
+        self.watcher = component.Watcher.create(
+            [self.dirpath], exclude=[
+                os.path.join(self.dirpath, 'build'),
+                os.path.join(self.dirpath, '*.log')])
+        self.addCleanup(self.watcher.close)
+        self.write('build', 'output')
+        self.write('file.log')
+        self.assertEqual(self.watcher.wait(0.05), set())
+
+    def test_ignored(self):
+        self.assertFalse(self.watcher.ignored(self.dirpath))
+        self.assertTrue(self.watcher.ignored(
+            os.path.join(self.dirpath, '.run', 'state')))
+        self.assertFalse(self.watcher.ignored(
+            os.path.join(self.dirpath, 'src', 'file')))
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), 'inotify')
+class InotifyWatcherTest(PollingWatcherTest):
+
+    # Helpers
+
+    def make_watcher(self, paths):
+        return component.InotifyWatcher(
+            paths, ignore=['.*'], debounce=0.05)
+
+    # Tests
+
+    def test_wait_with_new_directory(self):
+        os.mkdir(os.path.join(self.dirpath, 'new'))
+        self.watcher.wait(1)
+        path = self.write('new', 'file')
+        self.assertIn(path, self.watcher.wait(1))
+
+    def test_create(self):
+        watcher = component.Watcher.create([self.dirpath])
+        self.addCleanup(watcher.close)
+        self.assertIsInstance(watcher, component.InotifyWatcher)
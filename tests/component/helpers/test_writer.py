@@ -0,0 +1,48 @@
+import io
+import unittest
+from importlib import import_module
+component = import_module('run.helpers.writer')
+
+
+class WriterTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.buffer = io.BytesIO()
+        self.stream = io.TextIOWrapper(self.buffer, encoding='utf-8')
+
+    # Helpers
+
+    def make_stream(self):
+        yield 'line'
+        yield b'\xff\n'
+        yield {'key': 'value'}
+
+    # Tests
+
+    def test_write(self):
+        writer = component.Writer(self.stream)
+        writer.write(self.make_stream())
+        writer.write([1, 2])
+        self.assertEqual(
+            self.buffer.getvalue(),
+            b"line\n\xff\n{'key': 'value'}\n[1, 2]\n")
+
+    def test_write_with_jsonl(self):
+        writer = component.Writer(self.stream, format='jsonl')
+        writer.write(iter([{'key': 'value'}, None]))
+        writer.write('value')
+        self.assertEqual(
+            self.buffer.getvalue(),
+            b'{"key": "value"}\nnull\n"value"\n')
+
+    def test_write_without_buffer(self):
+        stream = io.StringIO()
+        writer = component.Writer(stream)
+        writer.write(iter(['line', b'bytes\n']))
+        self.assertEqual(stream.getvalue(), 'line\nbytes\n')
+
+    def test_with_unsupported_format(self):
+        self.assertRaises(ValueError, component.Writer, self.stream,
+                          format='xml')
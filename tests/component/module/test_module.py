@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from importlib import import_module
 from unittest.mock import Mock, patch
@@ -83,6 +85,17 @@ class ModuleTest(unittest.TestCase):
         # Check default call
         self.module.default.assert_called_with(*self.args, **self.kwargs)
 
+    def test_Builds(self):
+        self.assertEqual(self.module.Builds, 0)
+        self.module.task
+        self.module.task
+        self.assertEqual(self.module.Builds, 1)
+        self.assertGreater(self.module.BuildTime, 0)
+
+    def test_Builds_with_Tasks(self):
+        self.module.Tasks
+        self.assertEqual(self.module.Builds, 4)
+
     def test_Basedir(self):
         self.assertRegex(self.module.Basedir,
                          r'.*tests.component.module')
@@ -94,6 +107,18 @@ class ModuleTest(unittest.TestCase):
             Module=self.parent_module)
         self.assertEqual(self.module.Locate(), '/basedir')
 
+    def test_Lookup(self):
+        self.assertIs(self.module.Lookup('task'), self.module.task)
+        self.assertEqual(self.module.Builds, 1)
+        self.assertIsNone(self.module.Lookup('not_existent'))
+        self.assertIsNone(self.module.Lookup('Basedir'))
+
+    def test_Lookup_nested(self):
+        type(self.module).module = self.module
+        self.assertIs(self.module.Lookup('module.task'), self.module.task)
+        self.assertIsNone(self.module.Lookup('task.task'))
+        self.assertIsNone(self.module.Lookup('module.not_existent'))
+
     def test_Main(self):
         self.assertIs(self.module.Main, self.module)
 
@@ -146,6 +171,26 @@ class ModuleTest(unittest.TestCase):
             '---\n'
             'docstring')
 
+    def test_info_with_history(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        filepath = os.path.join(directory.name, 'history.sqlite')
+        patch.object(component.settings, 'history_filename', filepath).start()
+        component.History.get(filepath).dump(
+            '', started=0, duration=1, state='done', digest='', host='')
+        self.module.info()
+        # Check print call
+        self.print.assert_called_once_with(
+            '(*args, **kwargs)\n'
+            '---\n'
+            'Type: MockModule\nDependencies: []\n'
+            'Default arguments: ()\n'
+            'Default keyword arguments: {}\n'
+            'Timings: count 1, p50 1.000s, p95 1.000s, max 1.000s, '
+            'trend -\n'
+            '---\n'
+            'docstring')
+
     def test_info_with_task(self):
         self.module.info('info')
         # Check print call
@@ -163,10 +208,10 @@ class ModuleTest(unittest.TestCase):
         self.module.meta()
         # Check pprint call
         argument = self.pprint.call_args[0][0]
-        self.assertEqual(len(argument), 20)
+        self.assertEqual(len(argument), 35)
 
     def test_meta_with_task(self):
         self.module.meta('meta')
         # Check pprint call
         argument = self.pprint.call_args[0][0]
-        self.assertEqual(len(argument), 16)
+        self.assertEqual(len(argument), 29)
@@ -0,0 +1,231 @@
+import io
+import os
+import tempfile
+import unittest
+import threading
+from unittest.mock import Mock, patch
+from importlib import import_module
+from run.task import require
+from run.task.method import MethodTask
+component = import_module('run.task.cache')
+
+
+class DiskCacheTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = component.DiskCache(directory.name)
+        self.task = MethodTask(self.method, Build=True)
+
+    # Helpers
+
+    def method(self, module, first, second=2, **kwargs):
+        pass
+
+    def other_method(self, module, first, second=2, **kwargs):
+        return first
+
+    def print_method(self, module, name):
+        for _ in range(3):
+            self.barrier.wait(5)
+            print('from', name)
+        return name
+
+    def run_concurrently(self, *functions):
+        self.barrier = threading.Barrier(len(functions))
+        threads = [threading.Thread(target=function)
+                   for function in functions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # Tests
+
+    def test_capture(self):
+        stdout = io.StringIO()
+        with patch('sys.stdout', stdout):
+            with self.cache.capture() as output:
+                print('message')
+        self.assertEqual(stdout.getvalue(), 'message\n')
+        self.assertEqual(output, {'stdout': 'message\n', 'stderr': ''})
+
+    def test_capture_concurrently(self):
+        outputs = {}
+        def capture(name):
+            with self.cache.capture() as output:
+                self.print_method(None, name)
+            outputs[name] = output
+        stdout = io.StringIO()
+        with patch('sys.stdout', stdout):
+            self.run_concurrently(
+                lambda: capture('A'), lambda: capture('B'))
+            self.assertIs(component.sys.stdout, stdout)
+        self.assertEqual(outputs['A']['stdout'], 'from A\n' * 3)
+        self.assertEqual(outputs['B']['stdout'], 'from B\n' * 3)
+        self.assertEqual(stdout.getvalue().count('from'), 6)
+
+    def test_capture_with_concurrent_tasks(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        tasks = [MethodTask(self.print_method, Build=True, Store='disk'),
+                 MethodTask(self.print_method, Build=True, Store='disk')]
+        with patch.object(component.settings, 'cache_dirpath',
+                          directory.name), \
+                patch('sys.stdout', io.StringIO()):
+            self.run_concurrently(
+                lambda: tasks[0]('A'), lambda: tasks[1]('B'))
+            cache = component.DiskCache.get(
+                os.path.join(directory.name, 'results'))
+            for task, name in zip(tasks, ['A', 'B']):
+                entry = cache.load(cache.key(task, (name,)))
+                self.assertEqual(entry.stdout, 'from {0}\n'.format(name) * 3)
+
+    def test_dump_load(self):
+        self.assertIsNone(self.cache.load('key'))
+        self.assertTrue(self.cache.dump('key', {'value': 1}, 'out', 'err'))
+        self.assertTrue(self.cache.dump('other', {'value': 1}, 'out', 'err'))
+        self.assertEqual(
+            self.cache.load('key'),
+            self.cache.Entry({'value': 1}, 'out', 'err'))
+        # Equal entries are stored once
+        self.assertEqual(
+            len(os.listdir(os.path.join(self.cache.dirpath, 'objects'))), 1)
+
+    def test_dump_not_picklable(self):
+        self.assertFalse(self.cache.dump('key', lambda: None))
+        self.assertIsNone(self.cache.load('key'))
+
+    def test_key(self):
+        key = self.cache.key(self.task, (1,))
+        self.assertEqual(self.cache.key(self.task, (), {'first': 1}), key)
+        self.assertEqual(self.cache.key(self.task, (1, 2)), key)
+        self.assertNotEqual(self.cache.key(self.task, (2,)), key)
+        self.assertEqual(
+            self.cache.key(self.task, (1,), {'a': 1, 'b': 2}),
+            self.cache.key(self.task, (1,), {'b': 2, 'a': 1}))
+
+    def test_key_with_source(self):
+        task = MethodTask(self.other_method, Build=True)
+        self.assertNotEqual(self.cache.key(task, (1,)),
+                            self.cache.key(self.task, (1,)))
+
+    def test_key_with_environ(self):
+        key = self.cache.key(self.task, (1,), environ=['RUN_TEST_MODE'])
+        with patch.dict('os.environ', {'RUN_TEST_MODE': 'mode'}):
+            self.assertNotEqual(
+                self.cache.key(self.task, (1,), environ=['RUN_TEST_MODE']),
+                key)
+
+    def test_key_with_require(self):
+        key = self.cache.key(self.task, (1,))
+        dependency = require('task', 1)
+        predecessor = MethodTask(self.other_method, Build=True)
+        with patch.object(require, 'predecessor', predecessor):
+            self.task.Depend(dependency)
+            self.assertNotEqual(self.cache.key(self.task, (1,)), key)
+
+    def test_key_not_picklable(self):
+        self.assertIsNone(self.cache.key(self.task, (lambda: None,)))
+
+
+class DiskCacheWithRemoteTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.remote = MockBackend()
+        self.caches = []
+        for _ in range(2):
+            directory = tempfile.TemporaryDirectory()
+            self.addCleanup(directory.cleanup)
+            self.caches.append(
+                component.DiskCache(
+                    directory.name, remote=self.remote, authkey=b'secret'))
+
+    # Tests
+
+    def test_dump_load(self):
+        first, second = self.caches
+        self.assertTrue(first.dump('key', {'value': 1}, 'out', 'err'))
+        first.flush()
+        self.assertEqual(sorted(self.remote.data), ['keys', 'objects'])
+        entry = first.Entry({'value': 1}, 'out', 'err')
+        self.assertEqual(second.load('key'), entry)
+        # Downloaded entry is stored in the local tier
+        self.remote.data.clear()
+        self.assertEqual(second.load('key'), entry)
+        self.assertIsNone(second.load('other'))
+        self.assertEqual(first.stats, first.Stats(0, 0, 0, 1, 0))
+        self.assertEqual(second.stats, second.Stats(1, 1, 1, 0, 0))
+        self.assertEqual(str(second.stats),
+            'hits 2/3 (67%), remote hits 1, uploads 0, failures 0')
+
+    def test_dump_with_failed_upload(self):
+        first, second = self.caches
+        self.remote.put = Mock(side_effect=OSError('failure'))
+        self.assertTrue(first.dump('key', {'value': 1}))
+        first.flush()
+        self.assertEqual(first.stats.failures, 1)
+        self.assertIsNotNone(first.load('key'))
+
+    def test_load_with_corrupted_object(self):
+        first, second = self.caches
+        first.dump('key', {'value': 1})
+        first.flush()
+        for digest in self.remote.data['objects']:
+            self.remote.data['objects'][digest] = b'corrupted'
+        self.assertIsNone(second.load('key'))
+
+    def test_load_with_wrong_signature(self):
+        first, _ = self.caches
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        other = component.DiskCache(
+            directory.name, remote=self.remote, authkey=b'other')
+        other.dump('key', {'value': 1})
+        other.flush()
+        self.assertIsNone(first.load('key'))
+        self.assertEqual(first.stats.misses, 1)
+
+    def test_load_with_swapped_key(self):
+        first, second = self.caches
+        first.dump('key', {'value': 1})
+        first.flush()
+        # Signature binds the entry to the call key
+        self.remote.data['keys']['other'] = self.remote.data['keys']['key']
+        self.assertIsNone(second.load('other'))
+
+    def test_init_without_authkey(self):
+        self.assertRaises(
+            RuntimeError, component.DiskCache,
+            self.caches[0].dirpath, remote=self.remote)
+
+    def test_get(self):
+        patch.object(component.settings, 'cache_authkey', 'secret').start()
+        self.addCleanup(patch.stopall)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cache = component.DiskCache.get(
+            directory.name, remote='http://localhost:8765')
+        self.assertIsInstance(cache.remote, component.HTTPBackend)
+        self.assertEqual(cache.remote.url, 'http://localhost:8765')
+        self.assertIn(cache, component.DiskCache.shared())
+        self.assertIsNone(component.DiskCache.get(directory.name).remote)
+
+
+class MockBackend:
+
+    # Public
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, kind, digest):
+        return self.data.get(kind, {}).get(digest)
+
+    def put(self, kind, digest, data):
+        self.data.setdefault(kind, {})[digest] = data
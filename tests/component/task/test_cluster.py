@@ -0,0 +1,205 @@
+import os
+import stat
+import time
+import shutil
+import socket
+import signal
+import tempfile
+import unittest
+import multiprocessing
+from unittest.mock import Mock, patch
+from importlib import import_module
+from run.runfile import Runfile
+component = import_module('run.task.cluster')
+
+
+class ClusterTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.addCleanup(patch.stopall)
+        self.dirpath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirpath)
+        patch.object(component.settings, 'cache_dirpath', self.dirpath).start()
+        patch.object(component.settings, 'worker_authkey', 'secret').start()
+        file = tempfile.NamedTemporaryFile(
+            'w', suffix='.py', delete=False)
+        file.write(
+            'import os\n'
+            'import time\n'
+            'from run import Module, var\n'
+            'class MockModule(Module):\n'
+            '    @var\n'
+            '    def factor(self):\n'
+            '        return 2\n'
+            '    def double(self, value):\n'
+            '        return value * self.factor\n'
+            '    def pid(self, delay=0):\n'
+            '        time.sleep(delay)\n'
+            '        return os.getppid()\n'
+            '    def square(self, value):\n'
+            '        print("square")\n'
+            '        return self.multiply(value, value)\n'
+            '    def multiply(self, first, second):\n'
+            '        return first * second\n'
+            '    def fail(self):\n'
+            '        raise ValueError("fail")\n')
+        file.close()
+        self.addCleanup(os.remove, file.name)
+        self.filepath = file.name
+        self.module = Runfile(file.name).module
+        self.listener = Mock()
+        self.module.Listeners.append(self.listener)
+        self.workers = [self.start_worker() for _ in range(2)]
+        self.cluster = component.Cluster(
+            self.module, [address for _, address in self.workers])
+
+    # Helpers
+
+    def start_worker(self):
+        # Worker process is forked like started by "run --worker"
+        context = multiprocessing.get_context('fork')
+        reader, writer = context.Pipe(duplex=False)
+        process = context.Process(
+            target=serve, args=(self.filepath, writer), daemon=True)
+        process.start()
+        self.addCleanup(process.join)
+        self.addCleanup(process.kill)
+        return (process, reader.recv())
+
+    # Tests
+
+    def test_invoke(self):
+        self.assertEqual(self.cluster.invoke(self.module.square, 3), 9)
+
+    def test_invoke_events(self):
+        with patch('sys.stdout') as stdout:
+            self.cluster.invoke(self.module.square, value=3)
+        stdout.write.assert_called_with('square\n')
+        events = [call[0][0] for call in self.listener.call_args_list]
+        self.assertEqual([event.state for event in events], ['init', 'done'])
+        self.assertIs(events[0].task, self.module.multiply)
+        self.assertEqual(events[0].args, (3, 3))
+
+    def test_invoke_with_var(self):
+        self.assertEqual(self.cluster.invoke(self.module.double, 3), 6)
+        events = [call[0][0] for call in self.listener.call_args_list]
+        self.assertIs(events[0].task, self.module.Lookup('factor'))
+
+    def test_executor(self):
+        patch.object(component.settings, 'executor', 'cluster').start()
+        # Only tasks are shipped to workers
+        self.assertIsNone(self.module.Lookup('factor').Executor)
+        self.assertIsNone(self.module.Executor)
+        self.assertIsNone(self.module.list.Executor)
+        self.assertEqual(self.module.double.Executor, 'cluster')
+
+    def test_invoke_with_exception(self):
+        self.assertRaises(ValueError, self.cluster.invoke, self.module.fail)
+        self.assertEqual(len(self.cluster.alive), 2)
+
+    def test_invoke_balanced(self):
+        pids = {self.cluster.invoke(self.module.pid) for _ in range(2)}
+        self.assertEqual(pids, {process.pid for process, _ in self.workers})
+
+    def test_invoke_with_dead_worker(self):
+        process, address = self.workers[0]
+        process.kill()
+        process.join()
+        for _ in range(2):
+            self.assertEqual(
+                self.cluster.invoke(self.module.pid), self.workers[1][0].pid)
+        self.assertEqual(self.cluster.alive, [self.workers[1][1]])
+
+    def test_invoke_with_retries_exceeded(self):
+        patch.object(component.settings, 'worker_retries', 0).start()
+        process, address = self.workers[0]
+        process.kill()
+        process.join()
+        self.assertRaises(RuntimeError, self.cluster.invoke, self.module.pid)
+        self.assertEqual(self.cluster.alive, [self.workers[1][1]])
+
+    def test_invoke_with_hanging_worker(self):
+        process, address = self.workers[0]
+        os.kill(process.pid, signal.SIGSTOP)
+        self.addCleanup(os.kill, process.pid, signal.SIGCONT)
+        with patch.object(component.settings, 'worker_timeout', 0.5):
+            self.assertEqual(
+                self.cluster.invoke(self.module.pid), self.workers[1][0].pid)
+        self.assertEqual(self.cluster.alive, [self.workers[1][1]])
+
+    def test_invoke_with_no_workers(self):
+        for process, _ in self.workers:
+            process.kill()
+            process.join()
+        self.assertRaises(RuntimeError, self.cluster.invoke, self.module.pid)
+
+    def test_invoke_with_other_authkey(self):
+        with patch.object(component.settings, 'worker_authkey', 'other'):
+            self.assertRaises(
+                RuntimeError, self.cluster.invoke, self.module.pid)
+        self.assertEqual(self.cluster.alive, [])
+
+    def test_request_without_authentication(self):
+        # Request is never unpickled by the worker
+        filepath = os.path.join(self.dirpath, 'unpickled')
+        sock = socket.create_connection(
+            component.parse_address(self.workers[0][1]))
+        with sock:
+            component.send_message(sock, Unpickled(filepath))
+            sock.settimeout(5)
+            while sock.recv(1024):
+                pass
+        time.sleep(0.1)
+        self.assertFalse(os.path.exists(filepath))
+        self.assertEqual(self.cluster.invoke(self.module.square, 3), 9)
+
+    def test_worker_without_authkey(self):
+        patch.object(component.settings, 'worker_authkey', None).start()
+        self.assertRaises(RuntimeError, component.Worker,
+            '0.0.0.0:0', runfile=Runfile(self.filepath))
+
+    def test_get_authkey(self):
+        patch.object(component.settings, 'worker_authkey', None).start()
+        dirpath = os.path.join(self.dirpath, 'run')
+        patch.object(component.settings, 'daemon_dirpath', dirpath).start()
+        authkey = component.get_authkey()
+        self.assertEqual(len(authkey), 64)
+        self.assertEqual(component.get_authkey(), authkey)
+        mode = os.stat(os.path.join(dirpath, 'authkey')).st_mode
+        self.assertEqual(stat.S_IMODE(mode), 0o600)
+
+    def test_is_worker(self):
+        self.assertFalse(component.is_worker())
+
+    def test_parse_address(self):
+        self.assertEqual(
+            component.parse_address('localhost:8000'), ('localhost', 8000))
+        self.assertEqual(
+            component.parse_address(':8000'), ('127.0.0.1', 8000))
+        self.assertRaises(ValueError, component.parse_address, 'localhost')
+
+    def test_receive_message(self):
+        first, second = socket.socketpair()
+        with first, second:
+            component.send_message(first, ('heartbeat',))
+            self.assertEqual(
+                component.receive_message(second), ('heartbeat',))
+
+
+class Unpickled:
+
+    # Public
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+
+    def __reduce__(self):
+        return (open, (self.filepath, 'w'))
+
+
+def serve(filepath, writer):
+    worker = component.Worker('127.0.0.1:0', runfile=Runfile(filepath))
+    writer.send(worker.address)
+    worker.serve_forever()
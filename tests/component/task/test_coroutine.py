@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+from unittest.mock import Mock
+from importlib import import_module
+component = import_module('run.task.coroutine')
+
+
+class CoroutineTaskTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.args = ('arg1',)
+        self.kwargs = {'kwarg1': 'kwarg1'}
+        self.method = Mock(side_effect=self.make_coroutine)
+        self.task = component.CoroutineTask(self.method, Build=True)
+
+    # Helpers
+
+    async def make_coroutine(self, module, *args, **kwargs):
+        await asyncio.sleep(0)
+        return (args, kwargs)
+
+    # Tests
+
+    def test___call__(self):
+        result = self.task(*self.args, **self.kwargs)
+        self.assertEqual(result, (self.args, self.kwargs))
+        self.method.assert_called_with(None, *self.args, **self.kwargs)
+
+    def test___call___with_running_loop(self):
+        async def call():
+            return self.task(*self.args)
+        self.assertEqual(asyncio.run(call()), (self.args, {}))
+
+    def test_Acall(self):
+        result = asyncio.run(self.task.Acall(*self.args))
+        self.assertEqual(result, (self.args, {}))
+
+    def test_Invoke(self):
+        self.assertEqual(self.task.Invoke(*self.args), (self.args, {}))
+
+    def test_Map(self):
+        self.task = component.CoroutineTask(
+            self.method, Build=True, Map=[1, 2])
+        self.assertEqual(
+            sorted(self.task(), key=repr), [((1,), {}), ((2,), {})])
+
+    def test_Memoize(self):
+        self.task = component.CoroutineTask(
+            self.method, Build=True, Memoize=True)
+        self.assertEqual(self.task(1), ((1,), {}))
+        self.assertEqual(self.task(1), ((1,), {}))
+        self.assertEqual(self.method.call_count, 1)
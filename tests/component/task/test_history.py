@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+from importlib import import_module
+component = import_module('run.task.history')
+
+
+class HistoryTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.history = component.History(
+            os.path.join(directory.name, '.run', 'history.sqlite'))
+
+    # Helpers
+
+    def dump(self, qualname, durations, state='done'):
+        for started, duration in enumerate(durations):
+            self.history.dump(
+                qualname, started=started, duration=duration,
+                state=state, digest='digest', host='host')
+
+    # Tests
+
+    def test_stats(self):
+        self.dump('task', [1, 1, 2, 2])
+        self.dump('task', [10], state='fail')
+        stats = self.history.stats()
+        self.assertEqual(stats, [component.History.Stats(
+            qualname='task', count=4, mean=1.5, p50=1, p95=2, max=2, trend=1)])
+        self.assertEqual(
+            str(stats[0]),
+            'count 4, p50 1.000s, p95 2.000s, max 2.000s, trend +100%')
+
+    def test_stats_with_prefix(self):
+        self.dump('module.task', [1])
+        self.dump('module.other.task', [1])
+        self.dump('modules.task', [1])
+        self.dump('task', [1])
+        self.assertEqual(
+            [stats.qualname for stats in self.history.stats('module')],
+            ['module.other.task', 'module.task'])
+
+    def test_stats_with_limit(self):
+        self.dump('task', [3, 2, 1])
+        stats = self.history.stats(limit=2)
+        self.assertEqual((stats[0].count, stats[0].max), (2, 2))
+        self.assertIsNone(stats[0].trend)
+        self.assertEqual(stats[0].format_trend(), '-')
@@ -0,0 +1,78 @@
+import time
+import threading
+import unittest
+from importlib import import_module
+component = import_module('run.task.mapper')
+
+
+class MapperTest(unittest.TestCase):
+
+    # Helpers
+
+    def square(self, item, offset=0):
+        if item < 0:
+            raise ValueError(item)
+        return item * item + offset
+
+    # Tests
+
+    def test(self):
+        mapper = component.Mapper(self.square, range(10), jobs=3)
+        self.assertEqual(sorted(mapper()), [item * item for item in range(10)])
+        self.assertEqual(mapper.count, 10)
+        self.assertEqual(mapper.failures, [])
+
+    def test_with_arguments(self):
+        mapper = component.Mapper(self.square, [1, {'item': 2}])
+        self.assertEqual(sorted(mapper(offset=1)), [2, 5])
+
+    def test_with_failures(self):
+        mapper = component.Mapper(self.square, [1, -1, 2, -2])
+        results = []
+        with self.assertLogs(component.__name__, 'WARNING'):
+            with self.assertRaises(component.MapError) as context:
+                for result in mapper():
+                    results.append(result)
+        self.assertEqual(sorted(results), [1, 4])
+        self.assertEqual(str(context.exception), '2 of 4 map items failed')
+        self.assertEqual(mapper.count, 4)
+        self.assertEqual(
+            sorted(failure.item for failure in mapper.failures), [-2, -1])
+        for failure in mapper.failures:
+            self.assertIsInstance(failure.exception, ValueError)
+
+    def test_with_items_exception(self):
+        def generate():
+            yield 1
+            raise RuntimeError()
+        mapper = component.Mapper(self.square, generate())
+        self.assertRaises(RuntimeError, list, mapper())
+
+    def test_in_flight(self):
+        # Items are not pulled ahead of the bounded window
+        pulled = []
+        def generate():
+            for item in range(1000):
+                pulled.append(item)
+                yield item
+        mapper = component.Mapper(
+            self.square, generate(), jobs=2, chunk_size=2)
+        stream = mapper()
+        next(stream)
+        time.sleep(0.1)
+        stream.close()
+        self.assertLess(len(pulled), 20)
+
+    def test_work_stealing(self):
+        # Slow item doesn't hold the rest of it's chunk
+        released = threading.Event()
+        def process(item):
+            if item == 0:
+                released.wait(5)
+            return item
+        mapper = component.Mapper(
+            process, range(4), jobs=2, chunk_size=4)
+        stream = mapper()
+        self.assertEqual(sorted(next(stream) for _ in range(3)), [1, 2, 3])
+        released.set()
+        self.assertEqual(list(stream), [0])
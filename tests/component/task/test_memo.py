@@ -0,0 +1,79 @@
+import inspect
+import threading
+import unittest
+from importlib import import_module
+component = import_module('run.task.memo')
+
+
+class MemoTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.memo = component.Memo()
+
+    # Helpers
+
+    def bind(self, *args, **kwargs):
+        def function(first, second=2, **kwargs):
+            pass
+        bound = inspect.signature(function).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return bound
+
+    # Tests
+
+    def test_get_set(self):
+        self.assertEqual(self.memo.get('key'), (False, None))
+        self.memo.set('key', 'value', limit=2)
+        self.assertEqual(self.memo.get('key'), (True, 'value'))
+        self.assertEqual((self.memo.hits, self.memo.misses), (1, 1))
+
+    def test_set_with_limit(self):
+        self.memo.set('first', 1, limit=2)
+        self.memo.set('second', 2, limit=2)
+        self.memo.get('first')
+        self.memo.set('third', 3, limit=2)
+        self.assertEqual(len(self.memo), 2)
+        self.assertEqual(self.memo.get('first'), (True, 1))
+        self.assertEqual(self.memo.get('second'), (False, None))
+
+    def test_forget(self):
+        self.memo.set('key', 'value', limit=2)
+        self.memo.forget()
+        self.assertEqual(self.memo.get('key'), (False, None))
+
+    def test_key(self):
+        key = self.memo.key(self.bind(1))
+        self.assertEqual(self.memo.key(self.bind(first=1)), key)
+        self.assertEqual(self.memo.key(self.bind(1, 2)), key)
+        self.assertNotEqual(self.memo.key(self.bind(2)), key)
+        self.assertEqual(self.memo.key(self.bind(1, a=1, b=2)),
+                         self.memo.key(self.bind(1, b=2, a=1)))
+
+    def test_key_with_types(self):
+        keys = {self.memo.key(self.bind(value))
+                for value in [1, True, 1.0, (1,), (True,), [1], [True]]}
+        self.assertEqual(len(keys), 7)
+        self.assertNotEqual(self.memo.key(self.bind(1, a=1)),
+                            self.memo.key(self.bind(1, a=True)))
+
+    def test_key_not_hashable(self):
+        self.assertEqual(self.memo.key(self.bind([1])),
+                         self.memo.key(self.bind([1])))
+        self.assertIsNone(self.memo.key(self.bind([lambda: None])))
+
+    def test_threads(self):
+        def worker(number):
+            for index in range(1000):
+                key = (number + index) % 20
+                if not self.memo.get(key)[0]:
+                    self.memo.set(key, key, limit=10)
+        threads = [threading.Thread(target=worker, args=(number,))
+                   for number in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.memo.hits + self.memo.misses, 8000)
+        self.assertLessEqual(len(self.memo), 10)
@@ -21,6 +21,13 @@ class MethodTaskTest(unittest.TestCase):
         self.assertEqual(result, self.method.return_value)
         self.method.assert_called_with(None, *self.args, **self.kwargs)
 
+    def test_Bind(self):
+        def method(module, first, second=2):
+            pass
+        self.task = component.MethodTask(method, Build=True)
+        bound = self.task.Bind(1)
+        self.assertEqual(dict(bound.arguments), {'first': 1, 'second': 2})
+
     def test_Docstring(self):
         self.assertEqual(self.task.Docstring, self.method.__doc__)
 
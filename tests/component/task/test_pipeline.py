@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from importlib import import_module
+from run.runfile import Runfile
+component = import_module('run.task.pipeline')
+
+
+class PipelineTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.addCleanup(patch.stopall)
+        self.dirpath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirpath)
+        patch.object(component.settings, 'cache_dirpath', self.dirpath).start()
+        file = tempfile.NamedTemporaryFile(
+            'w', suffix='.py', delete=False)
+        file.write(
+            'import os\n'
+            'from run import Module, Pipeline, task\n'
+            'class MockModule(Module):\n'
+            '    etl = Pipeline("extract", "transform", "load")\n'
+            '    etlp = Pipeline("extract", "pid")\n'
+            '    fail = Pipeline("extract", "error")\n'
+            '    small = Pipeline("extract", "pid", QueueSize=2)\n'
+            '    def extract(self, count=3):\n'
+            '        yield from range(int(count))\n'
+            '    def transform(self, items):\n'
+            '        for item in items:\n'
+            '            yield item * 2\n'
+            '    def load(self, items):\n'
+            '        return sum(items)\n'
+            '    @task(Executor="process")\n'
+            '    def pid(self, items):\n'
+            '        for item in items:\n'
+            '            yield os.getpid()\n'
+            '    def error(self, items):\n'
+            '        for item in items:\n'
+            '            raise ValueError("error")\n')
+        file.close()
+        self.addCleanup(os.remove, file.name)
+        self.module = Runfile(file.name).module
+
+    # Tests
+
+    def test(self):
+        self.assertEqual(list(self.module.etl()), [6])
+        self.assertEqual(list(self.module.etl(count=5)), [20])
+
+    def test_stages(self):
+        self.assertEqual(
+            self.module.etl.Stages,
+            [self.module.extract, self.module.transform, self.module.load])
+
+    def test_stats(self):
+        list(self.module.etl(count=100))
+        stats = self.module.etl.Stats
+        self.assertEqual(
+            [item.name for item in stats], ['extract', 'transform', 'load'])
+        self.assertEqual([item.items for item in stats], [100, 100, 1])
+        for item in stats:
+            self.assertEqual(item.capacity, 64)
+            self.assertLessEqual(item.occupancy, item.capacity)
+
+    def test_queue_size(self):
+        self.assertEqual(len(list(self.module.small(count=100))), 100)
+        for item in self.module.small.Stats:
+            self.assertEqual(item.capacity, 2)
+            self.assertLessEqual(item.occupancy, 2)
+
+    def test_process_stage(self):
+        pids = set(self.module.etlp(count=10))
+        self.assertEqual(len(pids), 1)
+        self.assertNotIn(os.getpid(), pids)
+        stats = self.module.etlp.Stats
+        self.assertEqual([item.items for item in stats], [10, 10])
+
+    def test_with_exception(self):
+        self.assertRaises(ValueError, list, self.module.fail())
+
+    def test_close(self):
+        stream = self.module.small(count=1000)
+        next(stream)
+        stream.close()
+        # Stages are stopped by the backpressure
+        items = [item.items for item in self.module.small.Stats]
+        self.assertLess(items[0], 1000)
+        self.assertLess(items[1], 1000)
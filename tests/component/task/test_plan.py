@@ -0,0 +1,98 @@
+import json
+import unittest
+from importlib import import_module
+from run.module import Module
+from run.task import require, trigger
+component = import_module('run.task.plan')
+
+
+# Fixtures
+
+class MockModule(Module):
+
+    # Tasks
+
+    def lib1(self):
+        pass
+
+    def lib2(self):
+        pass
+
+    @require('lib1')
+    @require('lib2')
+    @trigger('notify')
+    def build(self):
+        pass
+
+    def notify(self):
+        pass
+
+    @require('build')
+    @require('lint', 'arg')
+    def test(self):
+        pass
+
+    def lint(self, arg):
+        pass
+
+    @require('cycle')
+    def cycle(self):
+        pass
+
+
+# Cases
+
+class PlanTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.module = MockModule(Build=True)
+        self.durations = {
+            'lib1': 1, 'lib2': 2, 'build': 1,
+            'notify': 1, 'test': 1, 'lint': 2}
+        self.plan = component.Plan(
+            self.module.test, durations=self.durations)
+
+    # Tests
+
+    def test_nodes(self):
+        self.assertEqual(self.plan.root, 'test')
+        self.assertEqual(
+            sorted(node.name for node in self.plan.nodes),
+            ['build', 'lib1', 'lib2', "lint('arg')", 'notify', 'test'])
+        self.assertEqual(
+            self.plan.nodes[-1],
+            component.Plan.Node(
+                name='test', task='test', duration=1,
+                requires=["lint('arg')", 'build'], triggers=[]))
+
+    def test_nodes_with_cycle(self):
+        self.assertRaises(RuntimeError, component.Plan, self.module.cycle)
+
+    def test_critical_path(self):
+        self.assertEqual(
+            self.plan.critical_path(),
+            (5, ['lib2', 'build', 'notify', 'test']))
+
+    def test_export(self):
+        data = json.loads(self.plan.export('json'))
+        self.assertEqual(data['root'], 'test')
+        self.assertEqual(len(data['nodes']), 6)
+
+    def test_export_dot(self):
+        dot = self.plan.export('dot')
+        self.assertTrue(dot.startswith('digraph plan {'))
+        self.assertIn('  "lib1" -> "build";', dot)
+        self.assertIn('  "build" -> "notify" [style=dashed];', dot)
+
+    def test_export_unsupported(self):
+        self.assertRaises(ValueError, self.plan.export, 'xml')
+
+    def test_simulate(self):
+        self.assertEqual(
+            self.plan.simulate(1),
+            component.Plan.Simulation(jobs=1, makespan=8, idle=0))
+        self.assertEqual(
+            self.plan.simulate(2),
+            component.Plan.Simulation(jobs=2, makespan=6, idle=4))
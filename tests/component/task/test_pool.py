@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+from importlib import import_module
+from run.runfile import Runfile
+from run.settings import settings
+component = import_module('run.task.pool')
+
+
+class ProcessPoolTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.addCleanup(patch.stopall)
+        self.dirpath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirpath)
+        patch.object(settings, 'cache_dirpath', self.dirpath).start()
+        # Worker processes are spawned with fresh settings
+        patch.dict(os.environ, {'XDG_CACHE_HOME': self.dirpath}).start()
+        file = tempfile.NamedTemporaryFile(
+            'w', suffix='.py', delete=False)
+        file.write(
+            'import os\n'
+            'from run import Module, task, var\n'
+            'class MockModule(Module):\n'
+            '    def pid(self):\n'
+            '        return os.getpid()\n'
+            '    @task(Executor="process")\n'
+            '    async def apid(self):\n'
+            '        return os.getpid()\n'
+            '    def square(self, value):\n'
+            '        return self.multiply(value, value)\n'
+            '    def multiply(self, first, second):\n'
+            '        return first * second\n'
+            '    @var\n'
+            '    def factor(self):\n'
+            '        return 2\n'
+            '    def double(self, value):\n'
+            '        return value * self.factor\n'
+            '    def fail(self):\n'
+            '        raise ValueError("fail")\n')
+        file.close()
+        self.addCleanup(os.remove, file.name)
+        self.module = Runfile(file.name).module
+        self.listener = Mock()
+        self.module.Listeners.append(self.listener)
+        self.pool = component.ProcessPool(self.module, workers=1)
+        self.addCleanup(self.pool.shutdown)
+
+    # Tests
+
+    def test_invoke(self):
+        self.assertEqual(self.pool.invoke(self.module.square, 3), 9)
+        self.assertNotEqual(self.pool.invoke(self.module.pid), os.getpid())
+
+    def test_invoke_events(self):
+        self.pool.invoke(self.module.square, value=3)
+        events = [call[0][0] for call in self.listener.call_args_list]
+        self.assertEqual([event.state for event in events], ['init', 'done'])
+        self.assertIs(events[0].task, self.module.multiply)
+        self.assertEqual(events[0].args, (3, 3))
+
+    def test_invoke_with_var(self):
+        self.assertEqual(self.pool.invoke(self.module.double, 3), 6)
+        events = [call[0][0] for call in self.listener.call_args_list]
+        self.assertIs(events[0].task, self.module.Lookup('factor'))
+
+    def test_invoke_with_exception(self):
+        self.assertRaises(ValueError, self.pool.invoke, self.module.fail)
+
+    def test_executor(self):
+        patch.object(settings, 'executor', 'process').start()
+        self.addCleanup(
+            lambda: component.ProcessPool.get(self.module).shutdown())
+        # Vars and modules are invoked in place
+        self.assertEqual(self.module.factor, 2)
+        self.assertEqual(self.module.double(3), 6)
+
+    def test_executor_with_coroutine_task(self):
+        self.addCleanup(
+            lambda: component.ProcessPool.get(self.module).shutdown())
+        self.assertNotEqual(self.module.apid(), os.getpid())
+
+    def test_is_worker(self):
+        self.assertFalse(component.is_worker())
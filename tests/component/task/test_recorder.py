@@ -0,0 +1,60 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+from importlib import import_module
+component = import_module('run.task.recorder')
+
+
+class RecorderTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.addCleanup(patch.stopall)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.task = Mock(Qualname='task')
+        self.task.Main.Locate = Mock(
+            side_effect=lambda path: os.path.join(directory.name, path))
+        self.recorder = component.Recorder()
+
+    # Helpers
+
+    def make_event(self, state, time, duration=None):
+        event = component.CallTaskEvent(
+            self.task, uid=1, state=state, args=(1,), duration=duration)
+        patch.object(type(event), 'time', time).start()
+        return event
+
+    # Tests
+
+    def test(self):
+        self.recorder(self.make_event('init', 10))
+        self.recorder(self.make_event('done', 12))
+        history = component.History.get(
+            self.task.Main.Locate(component.settings.history_filename))
+        stats = history.stats()
+        self.assertEqual([(item.qualname, item.max) for item in stats],
+                         [('task', 2)])
+
+    def test_with_duration(self):
+        self.recorder(self.make_event('init', 10))
+        self.recorder(self.make_event('done', 12, duration=1))
+        history = component.History.get(
+            self.task.Main.Locate(component.settings.history_filename))
+        self.assertEqual(history.stats()[0].max, 1)
+
+    def test_with_cache(self):
+        self.recorder(self.make_event('init', 10))
+        self.recorder(self.make_event('cache', 11))
+        self.recorder(self.make_event('done', 11))
+        history = component.History.get(
+            self.task.Main.Locate(component.settings.history_filename))
+        self.assertEqual(history.stats(), [])
+        self.assertEqual(history.stats(state='cache')[0].max, 1)
+
+    def test_without_init(self):
+        self.recorder(self.make_event('done', 12))
+        self.assertFalse(os.path.exists(
+            self.task.Main.Locate(component.settings.history_filename)))
@@ -1,5 +1,7 @@
+import asyncio
 import unittest
-from unittest.mock import patch
+from contextlib import ExitStack
+from unittest.mock import Mock, patch
 from importlib import import_module
 component = import_module('run.task.require')
 
@@ -11,7 +13,12 @@ class require_Test(unittest.TestCase):
     def setUp(self):
         self.addCleanup(patch.stopall)
         self.invoke = patch.object(component.require, 'invoke').start()
+        self.predecessor = Mock()
+        patch.object(component.require, 'predecessor', self.predecessor).start()
         self.require = component.require('task')
+        self.stack = ExitStack()
+        self.stack.enter_context(component.Session.enter())
+        self.addCleanup(self.stack.close)
 
     # Tests
 
@@ -23,3 +30,31 @@ class require_Test(unittest.TestCase):
     def test_resolve_fail_is_not_none(self):
         self.require.resolve(fail='fail')
         self.assertEqual(self.invoke.call_count, 0)
+
+    def test_resolve_shared_between_dependencies(self):
+        self.require.resolve()
+        component.require('task').resolve()
+        component.require('task', 'arg').resolve()
+        self.assertEqual(self.invoke.call_count, 2)
+
+    def test_resolve_in_new_session(self):
+        self.require.resolve()
+        with component.Session.enter():
+            self.require.resolve()
+        self.stack.close()
+        self.require.resolve()
+        self.assertEqual(self.invoke.call_count, 2)
+
+    def test_aresolve(self):
+        async def ainvoke(require):
+            self.invoke()
+        patch.object(component.require, 'ainvoke', ainvoke).start()
+        self.predecessor = Mock()
+        patch.object(component.require, 'predecessor', self.predecessor).start()
+        async def resolve():
+            await asyncio.gather(
+                self.require.aresolve(),
+                component.require('task').aresolve())
+            await component.require('task').aresolve()
+        asyncio.run(resolve())
+        self.assertEqual(self.invoke.call_count, 1)
@@ -0,0 +1,84 @@
+import time
+import threading
+import unittest
+from unittest.mock import Mock
+from importlib import import_module
+component = import_module('run.task.resolver')
+
+
+class ResolverTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.calls = []
+        self.module = Mock()
+
+    # Helpers
+
+    def make_task(self, name, *requires, effect=None):
+        def invoke(*args, **kwargs):
+            self.calls.append(name)
+            if effect is not None:
+                effect()
+        task = Mock(side_effect=invoke)
+        task.Dependencies = [self.make_require(target) for target in requires]
+        setattr(self.module, name, task)
+        return task
+
+    def make_require(self, target):
+        dependency = component.require(target)
+        dependency.bind(Mock(Module=self.module))
+        return dependency
+
+    # Tests
+
+    def test(self):
+        self.make_task('a')
+        self.make_task('b')
+        self.make_task('c', 'a')
+        resolver = component.Resolver(jobs=2)
+        resolver([self.make_require(name) for name in ['a', 'b', 'c', 'a']])
+        self.assertEqual(sorted(self.calls), ['a', 'b', 'c'])
+        self.assertLess(self.calls.index('a'), self.calls.index('c'))
+
+    def test_concurrency(self):
+        barrier = threading.Barrier(2, timeout=5)
+        self.make_task('a', effect=barrier.wait)
+        self.make_task('b', effect=barrier.wait)
+        resolver = component.Resolver(jobs=2)
+        resolver([self.make_require('a'), self.make_require('b')])
+        self.assertEqual(sorted(self.calls), ['a', 'b'])
+
+    def test_with_exception(self):
+        def fail():
+            raise RuntimeError('fail')
+        self.make_task('bad', effect=fail)
+        self.make_task('slow', effect=lambda: time.sleep(0.1))
+        self.make_task('other')
+        self.make_task('dependent', 'bad')
+        resolver = component.Resolver(jobs=2)
+        self.assertRaises(RuntimeError, resolver, [
+            self.make_require(name)
+            for name in ['bad', 'slow', 'other', 'dependent']])
+        self.assertEqual(sorted(self.calls), ['bad', 'slow'])
+
+    def test_with_exception_and_keep_going(self):
+        def fail():
+            raise RuntimeError('fail')
+        self.make_task('bad', effect=fail)
+        self.make_task('slow', effect=lambda: time.sleep(0.1))
+        self.make_task('other')
+        self.make_task('dependent', 'bad')
+        resolver = component.Resolver(jobs=2, keep_going=True)
+        self.assertRaises(RuntimeError, resolver, [
+            self.make_require(name)
+            for name in ['bad', 'slow', 'other', 'dependent']])
+        self.assertEqual(sorted(self.calls), ['bad', 'other', 'slow'])
+
+    def test_with_cycle(self):
+        self.make_task('a', 'b')
+        self.make_task('b', 'a')
+        resolver = component.Resolver(jobs=2)
+        self.assertRaises(RuntimeError, resolver, [self.make_require('a')])
+        self.assertEqual(self.calls, [])
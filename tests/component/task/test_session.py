@@ -0,0 +1,52 @@
+import asyncio
+import unittest
+from unittest.mock import Mock
+from importlib import import_module
+component = import_module('run.task.session')
+
+
+class SessionTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.function = Mock()
+        self.session = component.Session()
+
+    # Helpers
+
+    async def make_coroutine(self):
+        self.function()
+
+    # Tests
+
+    def test_enter(self):
+        self.assertIsNone(component.Session.current())
+        with component.Session.enter() as session:
+            self.assertIs(component.Session.current(), session)
+            with component.Session.enter() as nested_session:
+                self.assertIs(nested_session, session)
+        self.assertIsNone(component.Session.current())
+
+    def test_resolve(self):
+        self.session.resolve('key', self.function)
+        self.session.resolve('key', self.function)
+        self.session.resolve('other', self.function)
+        self.assertEqual(self.function.call_count, 2)
+        self.assertTrue(self.session.resolved('key'))
+
+    def test_resolve_with_exception(self):
+        self.function.side_effect = Exception()
+        self.assertRaises(Exception, self.session.resolve,
+                          'key', self.function)
+        self.assertFalse(self.session.resolved('key'))
+
+    def test_aresolve(self):
+        async def resolve():
+            await asyncio.gather(
+                self.session.aresolve('key', self.make_coroutine),
+                self.session.aresolve('key', self.make_coroutine))
+            await self.session.aresolve('key', self.make_coroutine)
+        asyncio.run(resolve())
+        self.assertEqual(self.function.call_count, 1)
+        self.assertTrue(self.session.resolved('key'))
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from importlib import import_module
+component = import_module('run.task.state')
+
+
+class StateTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dirpath = directory.name
+        self.paths = [self.make_file('a', 'a'), self.make_file('b', 'b')]
+        self.state = component.State(
+            os.path.join(self.dirpath, '.run', 'state.sqlite'))
+
+    # Helpers
+
+    def make_file(self, name, content):
+        path = os.path.join(self.dirpath, name)
+        with open(path, 'w') as file:
+            file.write(content)
+        return path
+
+    # Tests
+
+    def test_dump_load(self):
+        self.assertIsNone(self.state.load('key'))
+        self.state.dump('key', 'fingerprint')
+        self.assertEqual(self.state.load('key'), 'fingerprint')
+        state = component.State(self.state.filepath)
+        self.assertEqual(state.load('key'), 'fingerprint')
+
+    def test_fingerprint(self):
+        fingerprint = self.state.fingerprint(self.paths)
+        self.assertEqual(self.state.fingerprint(self.paths), fingerprint)
+        self.make_file('a', 'changed')
+        self.assertNotEqual(self.state.fingerprint(self.paths), fingerprint)
+
+    def test_fingerprint_with_changed_stat_only(self):
+        fingerprint = self.state.fingerprint(self.paths)
+        os.utime(self.paths[0], ns=(0, 0))
+        self.assertEqual(self.state.fingerprint(self.paths), fingerprint)
+
+    def test_fingerprint_with_cached_stat(self):
+        self.state.fingerprint(self.paths)
+        with patch.object(component.hashlib, 'sha1',
+                          wraps=component.hashlib.sha1) as sha1:
+            self.state.fingerprint(self.paths)
+        # Only fingerprint digest is made
+        self.assertEqual(sha1.call_count, 1)
+
+    def test_get(self):
+        self.assertIs(component.State.get(self.state.filepath),
+                      component.State.get(self.state.filepath))
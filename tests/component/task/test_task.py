@@ -1,7 +1,13 @@
+import os
+import asyncio
+import logging
+import tempfile
 import unittest
 from functools import partial
 from importlib import import_module
 from unittest.mock import Mock, call, patch
+from run.helpers import import_object
+from run.task import MapError
 component = import_module('run.task.task')
 
 
@@ -27,6 +33,9 @@ class TaskTest(unittest.TestCase):
             Invoke = Mock(return_value='value')
         return Task
 
+    async def make_coroutine(self, *args, **kwargs):
+        pass
+
     # Tests
 
     def test(self):
@@ -95,6 +104,191 @@ class TaskTest(unittest.TestCase):
         self.Task.Chdir = False
         self.assertEqual(self.task(), 'value')
 
+    def test___call___with_Basedir(self):
+        self.Task.Basedir = '/basedir'
+        self.Task.Invoke = Mock(
+            side_effect=lambda *args, **kwargs: component.basedir.get())
+        self.assertEqual(self.task(), '/basedir')
+        self.assertIsNone(component.basedir.get())
+
+    def test___call___with_fast_path(self):
+        self.Task.Invoke = Mock(
+            side_effect=lambda *args, **kwargs: component.basedir.get())
+        task = self.pTask()
+        with patch.object(component, 'CallTaskEvent') as Event:
+            self.assertEqual(task(), task.Locate())
+            self.assertFalse(Event.called)
+
+    def test___call___with_fast_path_and_default_listeners(self):
+        # Default listeners don't observe hidden tasks and quiet mode
+        listeners = [import_object(pointer)()
+                     for pointer in component.settings.listeners]
+        logger = logging.getLogger('task')
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.INFO)
+        hidden = self.pTask(Listeners=listeners, Hidden=True)
+        visible = self.pTask(Listeners=listeners)
+        with patch.object(component, 'CallTaskEvent') as Event:
+            self.assertEqual(hidden(), 'value')
+            self.assertFalse(Event.called)
+            self.assertEqual(visible(), 'value')
+            self.assertTrue(Event.called)
+            Event.reset_mock()
+            logger.setLevel(logging.ERROR)
+            self.assertEqual(visible(), 'value')
+            self.assertFalse(Event.called)
+
+    def test___call___without_fast_path(self):
+        with patch.object(component, 'CallTaskEvent') as Event:
+            self.assertEqual(self.task(), 'value')
+            self.assertTrue(Event.called)
+
+    def test___call___with_Listeners(self):
+        listener = Mock()
+        task = self.pTask(Listeners=[listener])
+        self.assertEqual(task(), 'value')
+        self.assertEqual(
+            [call[0][0].state for call in listener.call_args_list],
+            ['init', 'done'])
+        self.assertIsNone(listener.call_args_list[0][0][0].duration)
+        self.assertGreaterEqual(listener.call_args[0][0].duration, 0)
+
+    def test___call___with_stream(self):
+        self.Task.Basedir = '/basedir'
+        self.Task.Invoke = Mock(side_effect=lambda *args, **kwargs: (
+            component.basedir.get() for _ in range(2)))
+        listener = Mock()
+        task = self.pTask(Listeners=[listener])
+        stream = task()
+        self.assertEqual(next(stream), '/basedir')
+        self.assertEqual(
+            [call[0][0].state for call in listener.call_args_list],
+            ['init'])
+        self.assertEqual(list(stream), ['/basedir'])
+        self.assertEqual(
+            [call[0][0].state for call in listener.call_args_list],
+            ['init', 'done'])
+
+    def test___call___with_stream_exception(self):
+        def generate(*args, **kwargs):
+            yield 'value'
+            raise ValueError()
+        self.Task.Invoke = Mock(side_effect=generate)
+        listener = Mock()
+        task = self.pTask(Listeners=[listener])
+        stream = task()
+        self.assertEqual(next(stream), 'value')
+        self.assertRaises(ValueError, next, stream)
+        self.assertEqual(listener.call_args[0][0].state, 'fail')
+
+    def test___call___with_stream_and_fast_path(self):
+        self.Task.Basedir = '/basedir'
+        self.Task.Invoke = Mock(side_effect=lambda *args, **kwargs: (
+            component.basedir.get() for _ in range(2)))
+        task = self.pTask()
+        self.assertEqual(list(task()), ['/basedir', '/basedir'])
+        self.assertIsNone(component.basedir.get())
+
+    def test___call___with_Map(self):
+        self.Task.Invoke = Mock(side_effect=lambda item, *args, **kwargs: (
+            item, args, kwargs))
+        task = self.pTask(*self.args, Map=[1, 2], **self.kwargs)
+        self.assertEqual(sorted(task()), [
+            (1, ('arg1',), {'kwarg1': 'kwarg1'}),
+            (2, ('arg1',), {'kwarg1': 'kwarg1'})])
+
+    def test___call___with_Map_and_Reduce(self):
+        self.Task.Invoke = Mock(side_effect=lambda item: 1 / item)
+        task = self.pTask(Map=iter([1, 2]), Reduce=sum)
+        self.assertEqual(task(), 1.5)
+
+    def test___call___with_Map_and_failed_item(self):
+        self.Task.Invoke = Mock(side_effect=lambda item: 1 / item)
+        listener = Mock()
+        task = self.pTask(Map=iter([1, 0, 2]), Listeners=[listener])
+        stream = task()
+        results = []
+        with self.assertLogs('run.task.mapper', 'WARNING'):
+            with self.assertRaises(MapError) as context:
+                for result in stream:
+                    results.append(result)
+        self.assertEqual(sorted(results), [0.5, 1])
+        self.assertEqual(context.exception.count, 3)
+        self.assertEqual(
+            [failure.item for failure in context.exception.failures], [0])
+        self.assertEqual(listener.call_args[0][0].state, 'fail')
+
+    def test___call___with_Map_Reduce_and_failed_item(self):
+        self.Task.Invoke = Mock(side_effect=lambda item: 1 / item)
+        task = self.pTask(Map=iter([1, 0, 2]), Reduce=sum)
+        with self.assertLogs('run.task.mapper', 'WARNING'):
+            self.assertRaises(MapError, task)
+
+    def test_Acall(self):
+        self.assertEqual(asyncio.run(self.task.Acall()), 'value')
+        self.task.Invoke.assert_called_with(*self.args, **self.kwargs)
+
+    def test_Acall_with_Basedir(self):
+        self.Task.Basedir = '/basedir'
+        self.Task.Invoke = Mock(
+            side_effect=lambda *args, **kwargs: component.basedir.get())
+        self.assertEqual(asyncio.run(self.task.Acall()), '/basedir')
+
+    def test_Acall_with_dependencies(self):
+        dependency = Mock()
+        dependency.aresolve = Mock(side_effect=self.make_coroutine)
+        self.task.Depend(dependency)
+        self.assertEqual(asyncio.run(self.task.Acall()), 'value')
+        # Check dependnecy aresolve call
+        dependency.aresolve.assert_has_calls([
+            call(),
+            call(fail=False)])
+
+    def test___call___with_Inputs_and_Outputs(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            for name in ['input', 'output']:
+                with open(os.path.join(dirpath, name), 'w') as file:
+                    file.write(name)
+            self.Task.Inputs = ['input']
+            self.Task.Outputs = ['output']
+            self.Task.Basedir = dirpath
+            self.Task.Chdir = False
+            self.Task.Notify = Mock()
+            self.assertEqual(self.task(), 'value')
+            self.assertIsNone(self.task())
+            self.assertEqual(self.task.Invoke.call_count, 1)
+            self.assertEqual(
+                [item[0][0].state for item in
+                 self.task.Notify.call_args_list[-3:]],
+                ['init', 'skip', 'done'])
+            self.assertTrue(os.path.exists(
+                os.path.join(dirpath, component.settings.state_filename)))
+
+    def test___call___with_Memoize(self):
+        self.Task.Memoize = 1
+        self.task.Notify = Mock()
+        self.assertEqual(self.task(), 'value')
+        self.assertEqual(self.task(), 'value')
+        self.assertEqual(self.task.Invoke.call_count, 1)
+        self.assertEqual(
+            [item[0][0].state for item in
+             self.task.Notify.call_args_list[-3:]],
+            ['init', 'cache', 'done'])
+        self.assertEqual((self.task.Hits, self.task.Misses), (1, 1))
+        self.task.Forget()
+        self.assertEqual(self.task(), 'value')
+        self.assertEqual(self.task.Invoke.call_count, 2)
+
+    def test___call___with_Memoize_and_equal_arguments(self):
+        self.Task.Memoize = True
+        self.task.Invoke = Mock(
+            side_effect=lambda *args, **kwargs: repr(args[-1]))
+        self.assertEqual(self.task(1), '1')
+        self.assertEqual(self.task(True), 'True')
+        self.assertEqual(self.task(1.0), '1.0')
+        self.assertEqual(self.task(1), '1')
+        self.assertEqual(self.task.Invoke.call_count, 3)
+
     def test___repr__(self):
         self.assertEqual(repr(self.task), '<Task>')
 
@@ -152,9 +346,24 @@ class TaskTest(unittest.TestCase):
         self.assertEqual(self.task.Docstring,
                          self.task.__doc__)
 
+    def test_Executor(self):
+        self.assertEqual(self.task.Executor, component.settings.executor)
+
     def test_Fallback(self):
         self.assertEqual(self.task.Fallback, component.settings.fallback)
 
+    def test_Inputs(self):
+        self.assertEqual(self.task.Inputs, [])
+
+    def test_Jobs(self):
+        self.assertEqual(self.task.Jobs, component.settings.jobs)
+
+    def test_Map(self):
+        self.assertIsNone(self.task.Map)
+
+    def test_MapJobs(self):
+        self.assertEqual(self.task.MapJobs, component.settings.map_jobs)
+
     def test_Kwargs(self):
         self.assertEqual(self.task.Kwargs, self.kwargs)
 
@@ -200,6 +409,9 @@ class TaskTest(unittest.TestCase):
         self.module.Tasks = {'task': self.task}
         self.assertEqual(self.task.Qualname, 'module.task')
 
+    def test_Reduce(self):
+        self.assertIsNone(self.task.Reduce)
+
     @patch.object(component, 'require')
     def test_Require(self, require):
         self.task.Require('task', *self.args, **self.kwargs)
@@ -212,6 +424,9 @@ class TaskTest(unittest.TestCase):
     def test_Signature(self):
         self.assertEqual(self.task.Signature, '(*args, **kwargs)')
 
+    def test_Store(self):
+        self.assertIsNone(self.task.Store)
+
     def test_Style(self):
         self.assertEqual(self.task.Style, 'task')
 
@@ -0,0 +1,45 @@
+import os
+import unittest
+from unittest.mock import patch
+from importlib import import_module
+component = import_module('run.basedir')
+
+
+class basedir_Test(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.token = component.basedir.set('/basedir')
+        self.addCleanup(component.basedir.reset, self.token)
+
+    # Tests
+
+    def test_path(self):
+        self.assertEqual(component.path(), '/basedir')
+        self.assertEqual(component.path('file'), '/basedir/file')
+        self.assertEqual(component.path('/file'), '/file')
+
+    def test_path_without_basedir(self):
+        component.basedir.set(None)
+        self.assertEqual(component.path('file'),
+                         os.path.join(os.getcwd(), 'file'))
+
+    @patch('builtins.open')
+    def test_open(self, open):
+        self.assertEqual(component.open('file', 'w'), open.return_value)
+        open.assert_called_with('/basedir/file', 'w')
+
+    def test_open_with_file_descriptor(self):
+        read, write = os.pipe()
+        self.addCleanup(os.close, read)
+        with component.open(write, 'w') as file:
+            file.write('data')
+        self.assertEqual(os.read(read, 4), b'data')
+
+    @patch.object(component, 'subprocess')
+    def test_execute(self, subprocess):
+        result = component.execute(['ls'], check=True)
+        self.assertEqual(result, subprocess.run.return_value)
+        subprocess.run.assert_called_with(
+            ['ls'], cwd='/basedir', check=True)
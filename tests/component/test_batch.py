@@ -0,0 +1,102 @@
+import json
+import time
+import unittest
+from unittest.mock import Mock
+from io import StringIO
+from importlib import import_module
+from run.module import Module
+component = import_module('run.batch')
+
+
+# Fixtures
+
+class MockModule(Module):
+
+    # Tasks
+
+    def task(self, value, delay=0):
+        time.sleep(delay)
+        return value
+
+    def fail(self):
+        raise RuntimeError('failed')
+
+    def stream(self, count):
+        yield from range(count)
+        if count < 0:
+            raise RuntimeError('failed')
+
+
+# Cases
+
+class BatchTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.module = MockModule(Build=True)
+        self.output = StringIO()
+
+    # Helpers
+
+    def execute(self, *calls, **kwargs):
+        batch = component.Batch(self.module, **kwargs)
+        input = StringIO(''.join(call + '\n' for call in calls))
+        failures = batch(input, self.output)
+        results = list(map(json.loads, self.output.getvalue().splitlines()))
+        return (failures, results)
+
+    # Tests
+
+    def test(self):
+        failures, results = self.execute(
+            '{"task": "task", "args": [1]}',
+            '',
+            '{"task": "task", "kwargs": {"value": 2}}')
+        self.assertEqual(failures, 0)
+        self.assertEqual(
+            results,
+            [{'line': 1, 'task': 'task', 'state': 'done', 'result': 1},
+             {'line': 3, 'task': 'task', 'state': 'done', 'result': 2}])
+
+    def test_with_failures(self):
+        failures, results = self.execute(
+            '{"task": "fail"}',
+            '{"task": "not_existent"}',
+            'not json')
+        self.assertEqual(failures, 3)
+        self.assertEqual([result['state'] for result in results],
+                         ['fail', 'fail', 'fail'])
+        self.assertEqual(results[0]['error'], 'failed')
+
+    def test_with_stream(self):
+        self.module.stream.Notify = Mock()
+        failures, results = self.execute(
+            '{"task": "stream", "args": [2]}',
+            '{"task": "stream", "args": [-1]}')
+        self.assertEqual(failures, 1)
+        self.assertEqual(results[0]['result'], [0, 1])
+        self.assertEqual(results[1]['error'], 'failed')
+        self.assertEqual(
+            [call[0][0].state
+             for call in self.module.stream.Notify.call_args_list],
+            ['init', 'done', 'init', 'fail'])
+
+    def test_with_jobs(self):
+        failures, results = self.execute(
+            '{"task": "task", "args": [1], "kwargs": {"delay": 0.1}}',
+            '{"task": "task", "args": [2]}',
+            '{"task": "task", "args": [3]}',
+            jobs=2)
+        self.assertEqual([result['result'] for result in results], [1, 2, 3])
+
+    def test_with_jobs_and_completion_order(self):
+        failures, results = self.execute(
+            '{"task": "task", "args": [1], "kwargs": {"delay": 0.1}}',
+            '{"task": "task", "args": [2]}',
+            jobs=2, order='completion')
+        self.assertEqual([result['result'] for result in results], [2, 1])
+
+    def test_with_unsupported_order(self):
+        self.assertRaises(ValueError,
+            component.Batch, self.module, order='unsupported')
@@ -0,0 +1,75 @@
+import hashlib
+import tempfile
+import threading
+import unittest
+import urllib.error
+import urllib.request
+from importlib import import_module
+from run.task import HTTPBackend
+component = import_module('run.cache_server')
+
+
+class ServerTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.server = self.start_server()
+        self.backend = HTTPBackend(
+            'http://{0}:{1}/'.format(*self.server.server_address))
+
+    # Helpers
+
+    def start_server(self, token=None):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        server = component.Server(
+            ('127.0.0.1', 0), dirpath=directory.name, token=token)
+        self.addCleanup(server.server_close)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.shutdown)
+        return server
+
+    # Tests
+
+    def test_get_put(self):
+        data = b'data'
+        digest = hashlib.sha256(data).hexdigest()
+        self.assertIsNone(self.backend.get('objects', digest))
+        self.backend.put('objects', digest, data)
+        self.backend.put('keys', 'a' * 64, digest.encode('ascii'))
+        self.assertEqual(self.backend.get('objects', digest), data)
+        self.assertEqual(
+            self.backend.get('keys', 'a' * 64), digest.encode('ascii'))
+
+    def test_put_with_digest_mismatch(self):
+        with self.assertRaises(urllib.error.HTTPError) as context:
+            self.backend.put('objects', 'a' * 64, b'data')
+        self.assertEqual(context.exception.code, 400)
+
+    def test_get_put_with_token(self):
+        server = self.start_server(token='secret')
+        url = 'http://{0}:{1}/'.format(*server.server_address)
+        data = b'data'
+        digest = hashlib.sha256(data).hexdigest()
+        for token in [None, 'other']:
+            backend = HTTPBackend(url, token=token)
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                backend.put('objects', digest, data)
+            self.assertEqual(context.exception.code, 401)
+        backend = HTTPBackend(url, token='secret')
+        backend.put('objects', digest, data)
+        self.assertEqual(backend.get('objects', digest), data)
+
+    def test_server_without_token(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.assertRaises(
+            RuntimeError, component.Server,
+            ('0.0.0.0', 0), dirpath=directory.name)
+
+    def test_get_with_bad_path(self):
+        self.assertIsNone(self.backend.get('other', 'a' * 64))
+        self.assertIsNone(self.backend.get('keys', '../passwd'))
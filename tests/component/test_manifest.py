@@ -0,0 +1,144 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from importlib import import_module
+from run.module import Module
+from run.task import hide
+component = import_module('run.manifest')
+
+
+# Fixtures
+
+class MockSubmodule(Module):
+
+    # Tasks
+
+    def task(self):
+        """docstring"""
+
+    @hide
+    def hidden_task(self):
+        pass
+
+
+class MockModule(Module):
+
+    # Data
+
+    attribute = True
+
+    # Modules
+
+    module = MockSubmodule()
+
+
+# Cases
+
+class ManifestTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.addCleanup(patch.stopall)
+        self.dirpath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirpath)
+        patch.object(component.settings, 'cache_dirpath', self.dirpath).start()
+        patch.object(component.settings, 'plain', True).start()
+        self.manifest = component.Manifest(__file__)
+        self.manifest.dump(MockModule(Build=True))
+
+    # Tests
+
+    def test_exists(self):
+        self.assertTrue(self.manifest.exists)
+
+    def test_load(self):
+        self.manifest = component.Manifest(__file__)
+        self.assertTrue(self.manifest.load())
+        self.assertEqual(self.manifest.complete('module.t'), ['module.task'])
+        self.assertEqual(
+            self.manifest.history,
+            os.path.join(os.path.dirname(__file__),
+                         component.settings.history_filename))
+
+    def test_load_not_existent(self):
+        os.remove(self.manifest.path)
+        self.manifest = component.Manifest(__file__)
+        self.assertFalse(self.manifest.exists)
+        self.assertFalse(self.manifest.load())
+
+    def test_load_with_changed_runfile(self):
+        filepath = os.path.join(self.dirpath, 'runfile.py')
+        with open(filepath, 'w') as file:
+            file.write('# runfile')
+        manifest = component.Manifest(filepath)
+        self.assertTrue(manifest.dump(MockModule(Build=True)))
+        with open(filepath, 'w') as file:
+            file.write('# changed runfile')
+        manifest = component.Manifest(filepath)
+        self.assertFalse(manifest.exists)
+        self.assertFalse(manifest.load())
+        # Outdated manifest is replaced
+        self.assertTrue(manifest.dump(MockModule(Build=True)))
+        self.assertTrue(component.Manifest(filepath).load())
+        self.assertEqual(
+            len(os.listdir(os.path.dirname(manifest.path))), 2)
+
+    def test_dump_with_not_writable_directory(self):
+        filepath = os.path.join(self.dirpath, 'file')
+        open(filepath, 'w').close()
+        with patch.object(component.settings, 'cache_dirpath', filepath), \
+                patch.object(component.os, 'makedirs',
+                             side_effect=OSError()) as makedirs:
+            for _ in range(2):
+                manifest = component.Manifest(__file__)
+                self.assertFalse(manifest.dump(MockModule(Build=True)))
+                # Described tasks are still available
+                self.assertEqual(
+                    manifest.complete('module.t'), ['module.task'])
+        # Failed dump is not tried again
+        self.assertEqual(makedirs.call_count, 1)
+
+    def test_complete(self):
+        self.assertEqual(
+            self.manifest.complete(''),
+            ['attribute', 'info', 'list', 'meta', 'module'])
+
+    def test_complete_with_hidden_task(self):
+        self.assertEqual(
+            self.manifest.complete('module.'),
+            ['module.info', 'module.list', 'module.meta', 'module.task'])
+
+    def test_list(self):
+        self.assertEqual(
+            self.manifest.list(),
+            'attribute\n'
+            'info\n'
+            'list\n'
+            'meta\n'
+            'module')
+
+    def test_list_with_module(self):
+        self.assertEqual(
+            self.manifest.list('module'),
+            'module.info\n'
+            'module.list\n'
+            'module.meta\n'
+            'module.task')
+
+    def test_info_with_task(self):
+        self.assertEqual(
+            self.manifest.info('module.task'),
+            'module.task()\n'
+            '---\n'
+            'Type: MethodTask\n'
+            'Dependencies: []\n'
+            'Default arguments: ()\n'
+            'Default keyword arguments: {}\n'
+            '---\n'
+            'docstring')
+
+    def test_info_with_not_existent_task(self):
+        self.assertRaises(KeyError, self.manifest.info, 'not_existent')
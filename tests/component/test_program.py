@@ -1,4 +1,9 @@
+import os
+import sys
+import time
+import tempfile
 import unittest
+import subprocess
 from unittest.mock import patch
 from importlib import import_module
 component = import_module('run.program')
@@ -62,3 +67,84 @@ class ProgramTest(unittest.TestCase):
         self.assertEqual(
             self.program.arguments,
             {'args': ['attribute'], 'kwargs': {}})
+
+
+class ProgramWatchTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dirpath = directory.name
+        # Slow task's log is not watched
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.logpath = os.path.join(directory.name, 'slow.log')
+        self.write('runfile.py',
+            'import time\n'
+            'from run import Module, task\n'
+            'class MockModule(Module):\n'
+            '    @task(Inputs=["input*"], Outputs=["runs.log"])\n'
+            '    def write(self):\n'
+            '        with open("runs.log", "a") as file:\n'
+            '            file.write("run\\n")\n'
+            '    def slow(self):\n'
+            '        with open({logpath!r}, "a") as file:\n'
+            '            file.write("start\\n")\n'
+            '        time.sleep(30)\n'
+            '        with open({logpath!r}, "a") as file:\n'
+            '            file.write("end\\n")\n'.format(logpath=self.logpath))
+        self.write('input', 'input')
+
+    # Helpers
+
+    def write(self, name, text):
+        with open(os.path.join(self.dirpath, name), 'w') as file:
+            file.write(text)
+
+    def watch(self, attribute):
+        env = dict(os.environ,
+                   PYTHONPATH=os.pathsep.join(sys.path),
+                   XDG_CACHE_HOME=self.dirpath)
+        process = subprocess.Popen(
+            [sys.executable, '-c', 'from run import program; program()',
+             '--watch', attribute],
+            cwd=self.dirpath, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.addCleanup(process.wait)
+        self.addCleanup(process.kill)
+
+    def count_lines(self, filepath, line, count, timeout=10):
+        # Return count of lines once it's reached (or timeout expired)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with open(filepath) as file:
+                    lines = file.read().splitlines().count(line)
+            except FileNotFoundError:
+                lines = 0
+            if lines >= count or time.monotonic() > deadline:
+                return lines
+            time.sleep(0.05)
+
+    # Tests
+
+    def test_watch_with_task_writing_outputs(self):
+        filepath = os.path.join(self.dirpath, 'runs.log')
+        self.watch('write')
+        self.assertEqual(self.count_lines(filepath, 'run', 1), 1)
+        # Task's own outputs don't trigger it again
+        self.assertEqual(self.count_lines(filepath, 'run', 2, timeout=2), 1)
+        self.write('input', 'changed')
+        self.assertEqual(self.count_lines(filepath, 'run', 2), 2)
+        self.assertEqual(self.count_lines(filepath, 'run', 3, timeout=2), 2)
+
+    def test_watch_with_changes_during_run(self):
+        self.watch('slow')
+        self.assertEqual(self.count_lines(self.logpath, 'start', 1), 1)
+        # In-flight run is cancelled and started again
+        self.write('input', 'changed')
+        self.assertEqual(self.count_lines(self.logpath, 'start', 2), 2)
+        self.assertEqual(
+            self.count_lines(self.logpath, 'end', 1, timeout=0), 0)
@@ -0,0 +1,182 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from importlib import import_module
+from run.helpers import Profiler
+component = import_module('run.runfile')
+
+
+class RunfileTest(unittest.TestCase):
+
+    # Actions
+
+    def setUp(self):
+        self.addCleanup(patch.stopall)
+        self.dirpath = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dirpath)
+        patch.object(component.settings, 'cache_dirpath', self.dirpath).start()
+        file = tempfile.NamedTemporaryFile(
+            'w', suffix='.py', delete=False)
+        file.write(self.make_source('task'))
+        file.close()
+        self.filepath = file.name
+        self.addCleanup(os.remove, self.filepath)
+        self.runfile = component.Runfile(self.filepath)
+
+    # Helpers
+
+    def make_reload_source(self, *, sub_value):
+        return (
+            'from run import Module, task, var\n'
+            'class SubModule(Module):\n'
+            '    @var\n'
+            '    def value(self):\n'
+            '        return {sub_value}\n'
+            'class MockModule(Module):\n'
+            '    sub = SubModule()\n'
+            '    @var\n'
+            '    def value(self):\n'
+            '        return object()\n'
+            '    @task(Memoize=True)\n'
+            '    def task(self):\n'
+            '        return object()\n'.format(sub_value=sub_value))
+
+    def write_source(self, source):
+        self.write_file(self.filepath, source)
+
+    def write_file(self, filepath, source):
+        filepath = os.path.join(self.dirpath, filepath)
+        with open(filepath, 'w') as file:
+            file.write(source)
+        # Runfile is reloaded by modification time
+        stat = os.stat(filepath)
+        os.utime(filepath, ns=(stat.st_atime_ns,
+                               stat.st_mtime_ns + 10 ** 9))
+
+    def make_source(self, name):
+        return (
+            'from run import Module\n'
+            'class MockModule(Module):\n'
+            '    def {name}(self):\n'
+            '        pass\n'.format(name=name))
+
+    # Tests
+
+    def test_filepath(self):
+        self.assertEqual(self.runfile.filepath, self.filepath)
+
+    def test_changed(self):
+        self.assertTrue(self.runfile.changed)
+        self.runfile.module
+        self.assertFalse(self.runfile.changed)
+
+    def test_module(self):
+        self.assertEqual(type(self.runfile.module).__name__, 'MockModule')
+        self.assertIs(self.runfile.module, self.runfile.module)
+
+    def test_module_with_changed_runfile(self):
+        module = self.runfile.module
+        with open(self.filepath, 'w') as file:
+            file.write(self.make_source('other_task'))
+        stat = os.stat(self.filepath)
+        os.utime(self.filepath, ns=(stat.st_atime_ns,
+                                    stat.st_mtime_ns + 10 ** 9))
+        self.assertIsNot(self.runfile.module, module)
+        self.assertTrue(hasattr(self.runfile.module, 'other_task'))
+
+    def test_reload(self):
+        self.write_source(self.make_reload_source(sub_value='object()'))
+        module = self.runfile.module
+        results = (module.value, module.task(), module.sub.value)
+        self.write_source(self.make_reload_source(sub_value='None'))
+        with patch.object(component.Module, 'Notify') as notify:
+            reloaded = self.runfile.module
+        self.assertIsNot(reloaded, module)
+        # Results of not changed main module are restored
+        self.assertIs(reloaded.value, results[0])
+        self.assertIs(reloaded.task(), results[1])
+        self.assertIsNone(reloaded.sub.value)
+        self.assertEqual(reloaded.Tasks['task'].Hits, 1)
+        event = notify.call_args_list[0][0][0]
+        self.assertIsInstance(event, component.ReloadEvent)
+        self.assertIs(event.task, reloaded)
+        self.assertEqual(event.changed, ['SubModule'])
+        self.assertIn('task', event.restored)
+        self.assertIn('value', event.restored)
+        self.assertNotIn('sub.value', event.restored)
+
+    def test_reload_with_not_built_tasks(self):
+        self.write_source(self.make_reload_source(sub_value='object()'))
+        module = self.runfile.module
+        result = module.task()
+        self.write_source(self.make_reload_source(sub_value='None'))
+        with patch.object(component.Module, 'Notify') as notify:
+            reloaded = self.runfile.module
+        # Only previously built tasks are built to be restored
+        self.assertEqual(reloaded.Builds, 1)
+        self.assertEqual(notify.call_args[0][0].restored, ['task'])
+        self.assertIs(reloaded.task(), result)
+
+    def test_reload_with_changed_module_code(self):
+        self.write_source(self.make_reload_source(sub_value='object()'))
+        module = self.runfile.module
+        value = module.value
+        self.write_source(
+            '# Comment\n' + self.make_reload_source(sub_value='object()'))
+        reloaded = self.runfile.module
+        self.assertIsNot(reloaded.value, value)
+
+    def test_reload_with_changed_local_import(self):
+        # Runfile and it's helper module are in a private directory
+        self.filepath = os.path.join(self.dirpath, 'runfile.py')
+        sys.path.insert(0, self.dirpath)
+        self.addCleanup(sys.path.remove, self.dirpath)
+        name = 'helper_' + os.path.basename(self.dirpath)
+        self.addCleanup(sys.modules.pop, name, None)
+        self.write_file(name + '.py', 'VALUE = 1\n')
+        self.write_source(
+            'import {name}\n'
+            'from run import Module, var\n'
+            'class MockModule(Module):\n'
+            '    @var\n'
+            '    def value(self):\n'
+            '        return {name}.VALUE\n'.format(name=name))
+        self.runfile = component.Runfile(self.filepath)
+        self.assertEqual(self.runfile.module.value, 1)
+        self.assertFalse(self.runfile.changed)
+        self.write_file(name + '.py', 'VALUE = 2\n')
+        self.assertTrue(self.runfile.changed)
+        with patch.object(component.Module, 'Notify') as notify:
+            self.assertEqual(self.runfile.module.value, 2)
+        event = notify.call_args_list[0][0][0]
+        self.assertEqual(event.changed, ['MockModule'])
+        self.assertEqual(event.restored, [])
+
+    def test_module_without_manifest(self):
+        module = self.runfile.module
+        # Building module doesn't describe (and build) all tasks
+        self.assertEqual(module.Builds, 0)
+        self.assertFalse(component.Manifest(self.filepath).exists)
+
+    def test_manifest(self):
+        self.assertEqual(self.runfile.manifest.complete('ta'), ['task'])
+        self.assertTrue(component.Manifest(self.filepath).exists)
+
+    def test_module_with_no_module(self):
+        with open(self.filepath, 'w') as file:
+            file.write('')
+        self.assertRaises(RuntimeError, getattr, self.runfile, 'module')
+
+    def test_timings(self):
+        self.runfile.module
+        self.assertEqual(list(self.runfile.timings), ['load', 'build'])
+
+    def test_timings_with_profiler(self):
+        profiler = Profiler(enabled=True)
+        with patch('run.module.module.profiler', profiler), \
+                patch.object(component, 'profiler', profiler):
+            self.runfile.module
+        self.assertEqual(list(profiler.phases), ['load', 'build', 'spawn'])
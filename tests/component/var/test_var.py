@@ -29,6 +29,13 @@ class VarTest(unittest.TestCase):
         # Two calls because of caching is off
         self.assertEqual(self.var.Invoke.call_count, 2)
 
+    def test___get___with_fast_path(self):
+        listener = Mock(observes=Mock(return_value=False))
+        self.var = self.Var(Build=True, Listeners=[listener])
+        self.assertEqual(self.var.__get__('module'), 'value')
+        listener.observes.assert_called_with(self.var)
+        self.assertFalse(listener.called)
+
     @unittest.skip
     @patch.object(component, 'TaskEvent')
     def test___get___with_Cache_is_true(self, TaskEvent):
@@ -55,5 +62,10 @@ class VarTest(unittest.TestCase):
     def test_Signature(self):
         self.assertEqual(self.var.Signature, '')
 
+    def test_Store(self):
+        # Vars caching doesn't make var's results stored
+        self.var = self.Var(Build=True, Cache=True)
+        self.assertIsNone(self.var.Store)
+
     def test_Style(self):
         self.assertEqual(self.var.Style, 'var')
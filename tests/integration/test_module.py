@@ -1,9 +1,10 @@
+import asyncio
 import unittest
 from io import StringIO
 from unittest.mock import patch
 from run.module import Module
 from run.settings import settings
-from run.task import Task
+from run.task import Task, Prototype
 from run.var import Var
 
 
@@ -54,6 +55,9 @@ class MockModule(Module):
     def method_task(self):
         pass
 
+    async def coroutine_task(self, value):
+        return value
+
     # Vars
 
     var = MockVar()
@@ -83,6 +87,7 @@ class ModuleTest(unittest.TestCase):
             self.stdout.getvalue(),
             'attribute\n'
             'class_var\n'
+            'coroutine_task\n'
             'info\n'
             'list\n'
             'meta\n'
@@ -91,3 +96,18 @@ class ModuleTest(unittest.TestCase):
             'property_var\n'
             'task\n'
             'var\n')
+
+    def test_lazy_building(self):
+        self.module.module.module_var
+        self.module.method_task
+        self.assertEqual(self.module.Builds, 2)
+        self.assertEqual(self.module.module.Builds, 0)
+        self.assertIsInstance(
+            vars(type(self.module))['task'], Prototype)
+
+    def test_Acall(self):
+        self.assertEqual(
+            asyncio.run(self.module.Acall('coroutine_task', 'value')),
+            'value')
+        self.assertEqual(self.module.coroutine_task('value'), 'value')
+        self.assertIsNone(asyncio.run(self.module.Acall('var')))
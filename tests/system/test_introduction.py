@@ -22,3 +22,28 @@ class IntroductionTest(DemoTest):
             'We are ready.\n'
             'Hello World 3 times!\n'
             'We are done.\n')
+
+    def test_multiple_tasks(self):
+        result = self.execute('ready + done -q')
+        self.assertEqual(
+            result,
+            'We are ready.\n'
+            'We are done.\n')
+
+    def test_multiple_tasks_without_separator(self):
+        # Module attribute as argument is not a task
+        result = self.execute('hello list -q')
+        self.assertEqual(
+            result,
+            'We are ready.\n'
+            'Hello list 3 times!\n'
+            'We are done.\n')
+
+    def test_multiple_tasks_with_arguments(self):
+        result = self.execute('hello Bob,1 + ready -q')
+        self.assertEqual(
+            result,
+            'We are ready.\n'
+            'Hello Bob 1 times!\n'
+            'We are done.\n'
+            'We are ready.\n')